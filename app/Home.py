@@ -2,9 +2,15 @@
 Natural Language Log Explorer - Home Page
 """
 
+import importlib
+import threading
+
 import streamlit as st
 import streamlit.components.v1 as components
-from renderings import HERO_SVG
+from configs.logger import get_logger
+from renderings import HERO_URL
+
+logger = get_logger("home")
 
 st.set_page_config(
     page_title="Log Explorer",
@@ -78,6 +84,29 @@ FEATURE_CARDS = '''
 </div>
 '''
 
+
+def _preload() -> None:
+    """
+    Warm up the Log Explorer and Embeddings pages in the background.
+    
+    Imports the service modules (anthropic, openai, qdrant-client, fastembed) and
+    validates their settings, so the first click on another page doesn't pay the
+    cold-start cost. Nothing here touches the network.
+    """
+    try:
+        for module in ("services.generator_service", "services.explainer_service",
+                       "services.search_service", "services.vectorstore_service"):
+            importlib.import_module(module)
+        
+        from configs.config import get_anthropic_settings, get_datadog_settings, get_openai_settings
+        get_anthropic_settings()
+        get_datadog_settings()
+        get_openai_settings()
+        logger.info("Preloaded service modules and settings")
+    except Exception as e:
+        logger.warning(f"Preload failed (pages will load on demand): {type(e).__name__}: {e}")
+
+
 # Reduce top padding
 st.markdown("""
 <style>
@@ -100,8 +129,12 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # Render animated hero
-components.html(HERO_SVG, height=300)
+components.iframe(HERO_URL, height=300)
 
 # Render feature cards
 components.html(FEATURE_CARDS, height=380)
 
+# Preload the heavier pages once per session
+if "preloaded" not in st.session_state:
+    st.session_state.preloaded = True
+    threading.Thread(target=_preload, name="preload", daemon=True).start()
@@ -0,0 +1,86 @@
+"""In-process cache for LLM responses."""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any
+
+from configs.logger import get_logger
+
+logger = get_logger("cache")
+
+
+
+def normalize_text(text: str) -> str:
+    """Collapse whitespace so trivially different inputs share a cache key."""
+    return " ".join(text.split())
+
+
+def normalize_log_json(log_json: str) -> str:
+    """
+    Canonicalize a log entry for use in a cache key.
+    
+    Every field is kept: the analysis may quote any value from the log, including
+    its timestamp or trace ID, so only entries with identical content share a key.
+    
+    Args:
+        log_json: The log entry in JSON format
+        
+    Returns:
+        The entry re-serialized with sorted keys and no whitespace, or the
+        whitespace-normalized text if it isn't valid JSON
+    """
+    try:
+        return json.dumps(json.loads(log_json), sort_keys=True, separators=(",", ":"))
+    except ValueError:
+        return normalize_text(log_json)
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU cache keyed on (prompt name, RAG context, user input).
+    
+    The RAG context is part of the key, so indexing or deleting documentation
+    invalidates the affected entries without any explicit bookkeeping.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[bytes, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(prompt_name: str, rag_context: str, user_input: str) -> bytes:
+        """Hash the parts of a request that determine the response."""
+        digest = hashlib.blake2b(digest_size=16)
+        for part in (prompt_name, rag_context, user_input):
+            digest.update(part.encode())
+            digest.update(b"\0")
+        return digest.digest()
+
+    def get(self, key: bytes) -> Any | None:
+        """Return the cached response for key, or None on a miss."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: bytes, value: Any) -> None:
+        """Store a response, evicting the least recently used entry when full."""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        with self._lock:
+            self._entries.clear()
+        logger.info("Response cache cleared")
+
+
+# Shared by the generator and explainer services
+response_cache = ResponseCache()
@@ -1,5 +1,7 @@
 """Configuration settings for the Log Explorer app."""
 
+from functools import lru_cache
+
 from pydantic import field_validator
 from pydantic_settings import BaseSettings
 
@@ -8,60 +10,132 @@ from configs.logger import get_logger
 logger = get_logger("config")
 
 
-class Settings(BaseSettings):
-    """Application settings loaded from environment variables."""
+def validate_api_key(v: str) -> str:
+    """Validate that an API key is properly configured."""
+    if not v or v.strip() == "":
+        raise ValueError("API key cannot be empty")
+    if v.startswith('your_'):
+        raise ValueError("API key not configured - please update .env file with real API keys")
+    return v
+
+
+class EnvSettings(BaseSettings):
+    """Base for settings groups loaded from the shared .env file."""
+
+    class Config:
+        env_file = ".env"
+        env_file_encoding = "utf-8"
+        extra = "ignore"
+
+
+class AnthropicSettings(EnvSettings):
+    """Anthropic settings (query generation and explanation)."""
 
-    # Anthropic Settings
     anthropic_api_key: str
-    anthropic_model_name: str 
+    anthropic_model_name: str
+    anthropic_small_model_name: str | None = None
     anthropic_temperature: float
     anthropic_max_output_tokens: int
 
-    # OpenAI Settings (embeddings only)
+    @field_validator('anthropic_api_key')
+    @classmethod
+    def validate_not_empty(cls, v: str) -> str:
+        return validate_api_key(v)
+
+
+class OpenAISettings(EnvSettings):
+    """OpenAI settings (embeddings only)."""
+
     openai_api_key: str
     openai_embedding_model: str
     openai_embedding_dimensions: int
 
-    # Firecrawl Settings
+    @field_validator('openai_api_key')
+    @classmethod
+    def validate_not_empty(cls, v: str) -> str:
+        return validate_api_key(v)
+
+
+class FirecrawlSettings(EnvSettings):
+    """Firecrawl settings (URL scraping)."""
+
     firecrawl_api_key: str
 
-    # Datadog Settings
+    @field_validator('firecrawl_api_key')
+    @classmethod
+    def validate_not_empty(cls, v: str) -> str:
+        return validate_api_key(v)
+
+
+class DatadogSettings(EnvSettings):
+    """Datadog settings (Logs API)."""
+
     dd_api_key: str
     dd_app_key: str
     dd_site: str
 
-    # Qdrant Settings
+    @field_validator('dd_api_key', 'dd_app_key')
+    @classmethod
+    def validate_not_empty(cls, v: str) -> str:
+        return validate_api_key(v)
+
+
+class QdrantSettings(EnvSettings):
+    """Qdrant settings (sparse embeddings)."""
+
     qdrant_sparse_embedding_model: str
 
-    # App settings
+
+class Settings(EnvSettings):
+    """General application settings."""
+
     app_name: str = "Natural Language Log Explorer"
     debug: bool = False
 
-    @field_validator('anthropic_api_key', 'openai_api_key', 'firecrawl_api_key', 'dd_api_key', 'dd_app_key')
-    @classmethod
-    def validate_not_empty(cls, v: str) -> str:
-        """Validate that API keys are properly configured."""
-        if not v or v.strip() == "":
-            raise ValueError("API key cannot be empty")
-        if v.startswith('your_'):
-            raise ValueError("API key not configured - please update .env file with real API keys")
-        return v
 
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
+# Each settings group is loaded and validated on first use only, so a page never
+# pays for (or fails on) credentials it doesn't need. Call .cache_clear() to reload.
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get general application settings (singleton pattern)."""
+    logger.info("Loading application settings from environment")
+    return Settings()
 
 
-_settings: Settings | None = None
+@lru_cache(maxsize=1)
+def get_anthropic_settings() -> AnthropicSettings:
+    """Get Anthropic settings (singleton pattern)."""
+    settings = AnthropicSettings()
+    logger.info(f"Anthropic settings loaded - model: {settings.anthropic_model_name}")
+    return settings
 
 
-def get_settings() -> Settings:
-    """Get application settings (singleton pattern)."""
-    global _settings
-    
-    if _settings is None:
-        logger.info("Loading application settings from environment")
-        _settings = Settings()
-        logger.info(f"Settings loaded - Datadog site: {_settings.dd_site}")
-    
-    return _settings
+@lru_cache(maxsize=1)
+def get_openai_settings() -> OpenAISettings:
+    """Get OpenAI settings (singleton pattern)."""
+    settings = OpenAISettings()
+    logger.info(f"OpenAI settings loaded - embedding model: {settings.openai_embedding_model}")
+    return settings
+
+
+@lru_cache(maxsize=1)
+def get_firecrawl_settings() -> FirecrawlSettings:
+    """Get Firecrawl settings (singleton pattern)."""
+    logger.info("Loading Firecrawl settings from environment")
+    return FirecrawlSettings()
+
+
+@lru_cache(maxsize=1)
+def get_datadog_settings() -> DatadogSettings:
+    """Get Datadog settings (singleton pattern)."""
+    settings = DatadogSettings()
+    logger.info(f"Datadog settings loaded - site: {settings.dd_site}")
+    return settings
+
+
+@lru_cache(maxsize=1)
+def get_qdrant_settings() -> QdrantSettings:
+    """Get Qdrant settings (singleton pattern)."""
+    logger.info("Loading Qdrant settings from environment")
+    return QdrantSettings()
@@ -1,11 +1,55 @@
 """Central logging configuration for the Log Explorer app."""
 
+import atexit
 import logging
+import os
+import queue
 import sys
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
+from typing import TextIO
+
+
+class SingleWriteStreamHandler(logging.StreamHandler[TextIO]):
+    """
+    StreamHandler that writes a record, or a whole batch of records, with one write.
+    
+    The stock handler already joins message and terminator; the win here is
+    emit_batch(), which turns a flushed buffer into a single write and flush.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            self.flush()
+        except Exception:
+            self.handleError(record)
+
+    def emit_batch(self, records: list[logging.LogRecord]) -> None:
+        records = [r for r in records if r.levelno >= self.level and self.filter(r)]
+        if not records:
+            return
+        self.acquire()
+        try:
+            self.stream.write("".join(self.format(r) + self.terminator for r in records))
+            self.flush()
+        except Exception:
+            self.handleError(records[-1])
+        finally:
+            self.release()
+
+
+# Skip per-record attributes the formatter never uses
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+# Log level - INFO by default, DEBUG when LOG_DEBUG is set. Records below the
+# level are discarded before any formatting work is done.
+LOG_LEVEL = logging.DEBUG if os.getenv("LOG_DEBUG") else logging.INFO
 
 # Create logger
 logger = logging.getLogger("log_explorer")
-logger.setLevel(logging.DEBUG)
+logger.setLevel(LOG_LEVEL)
 
 # Remove any existing handlers to avoid duplicates
 if logger.hasHandlers():
@@ -18,12 +62,64 @@ formatter = logging.Formatter(
 )
 
 # Console handler - outputs to stdout
-console_handler = logging.StreamHandler(sys.stdout)
-console_handler.setLevel(logging.DEBUG)
+console_handler = SingleWriteStreamHandler(sys.stdout)
+console_handler.setLevel(LOG_LEVEL)
 console_handler.setFormatter(formatter)
 
+# Queue handler - request threads only enqueue records; a background listener
+# thread formats them and does the blocking write to stdout
+log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+queue_handler = QueueHandler(log_queue)
+
+
+class BurstMemoryHandler(MemoryHandler):
+    """
+    MemoryHandler that also flushes once the log queue has been drained.
+    
+    Records from a single interaction are written out together, but nothing
+    sits in the buffer waiting for the next burst of activity. Any target other
+    than a SingleWriteStreamHandler is flushed record by record as usual.
+    """
+
+    def shouldFlush(self, record: logging.LogRecord) -> bool:  # noqa: N802
+        return super().shouldFlush(record) or log_queue.empty()
+
+    def flush(self) -> None:
+        if not isinstance(self.target, SingleWriteStreamHandler):
+            super().flush()
+            return
+        self.acquire()
+        try:
+            if self.buffer:
+                self.target.emit_batch(self.buffer)
+                self.buffer.clear()
+        finally:
+            self.release()
+
+
+# Memory handler - buffers records on the listener thread and hands them to the
+# console handler in batches (immediately for WARNING and above)
+memory_handler = BurstMemoryHandler(
+    capacity=256,
+    flushLevel=logging.WARNING,
+    target=console_handler,
+    flushOnClose=True,
+)
+
+listener = QueueListener(log_queue, memory_handler, respect_handler_level=True)
+listener.start()
+
+
+def _shutdown() -> None:
+    """Drain the queue, then flush whatever is still buffered."""
+    listener.stop()
+    memory_handler.close()
+
+
+atexit.register(_shutdown)
+
 # Add handler to logger
-logger.addHandler(console_handler)
+logger.addHandler(queue_handler)
 
 # Prevent propagation to root logger
 logger.propagate = False
@@ -32,4 +128,3 @@ logger.propagate = False
 def get_logger(name: str) -> logging.Logger:
     """Get a child logger with the given name."""
     return logging.getLogger(f"log_explorer.{name}")
-
@@ -3,28 +3,107 @@ Log Explorer - Translate, Execute, and Explain Datadog Log Search queries.
 """
 
 import streamlit as st
-import streamlit.components.v1 as components
+
 from configs.logger import get_logger
-from renderings import GENERATE_WORKFLOW_SVG, LOG_SEARCH_WORKFLOW_SVG, EXPLAIN_WORKFLOW_SVG
-from services.generator_service import generate_log_query, generate_ddsql_query
-from services.search_service import execute_query
-from services.explainer_service import explain_log_query, explain_ddsql_query, explain_log_entry
+from renderings import (
+    EXPLAIN_WORKFLOW_URL,
+    GENERATE_WORKFLOW_URL,
+    LOG_SEARCH_WORKFLOW_URL,
+    render_workflow,
+)
 
 logger = get_logger("log_explorer")
 
+# Number of logs rendered by default in the Log Search results
+SEARCH_SAMPLE_SIZE = 10
+
+# Log Search time range options (minutes -> label)
+TIME_RANGE_LABELS = {15: "15 min", 1440: "24 hours", 43200: "30 days"}
+TIME_RANGE_OPTIONS = tuple(TIME_RANGE_LABELS)
+
 st.set_page_config(
     page_title="Log Explorer",
     page_icon="🔍",
     layout="wide",
 )
 
-tab_generate, tab_log_search, tab_explain = st.tabs(["✨ Generate", "🔍 Log Search", "💡 Explain"])
 
-# --- GENERATE TAB ---
-with tab_generate:
+# Services are imported inside the wrappers: they pull in anthropic, qdrant-client and
+# fastembed, which the page shouldn't pay for until a button is actually clicked.
+# Generate and explain results aren't cached here - the services cache them keyed
+# on the RAG context, so indexing or deleting docs is picked up immediately. Searches
+# cover a window relative to now, so every Search click runs a fresh query.
+def _generate_log(user_input: str) -> dict:
+    from services.generator_service import generate_log_query
+
+    return generate_log_query(user_input)
+
+
+def _generate_ddsql(user_input: str) -> dict:
+    from services.generator_service import generate_ddsql_query
+
+    return generate_ddsql_query(user_input)
+
+
+def _execute(query: str, time_range_minutes: int, limit: int) -> dict:
+    from services.search_service import execute_query
+
+    return execute_query(query, time_range_minutes=time_range_minutes, limit=limit)
+
+
+def _explain_log(query: str, detail: str) -> str:
+    from services.explainer_service import explain_log_query
+
+    return explain_log_query(query, detail)
+
+
+def _explain_ddsql(query: str, detail: str) -> str:
+    from services.explainer_service import explain_ddsql_query
+
+    return explain_ddsql_query(query, detail)
+
+
+def _explain_entry(log_json: str, detail: str) -> str:
+    from services.explainer_service import explain_log_entry
+
+    return explain_log_entry(log_json, detail)
+
+
+def _show_generated(result: dict, language: str) -> None:
+    """Render a generation result: either the query or a clarification request."""
+    if result.get("needs_clarification"):
+        st.warning(result.get("message", "Could you be more specific?"))
+        if result.get("options"):
+            st.markdown("**Did you mean:**")
+            for option in result["options"]:
+                st.markdown(f"• {option}")
+    else:
+        st.markdown("### Generated Query")
+        st.code(result.get("query", ""), language=language)
+        
+        if result.get("explanation"):
+            st.info(result["explanation"])
+
+
+def _store_generated(result: dict, state_key: str, label: str) -> None:
+    """Keep a generation result and hand new queries over to the Log Search tab."""
+    st.session_state[state_key] = result
+    if result.get("needs_clarification"):
+        return
     
+    query = result.get("query", "")
+    logger.info("%s: %s", label, query)
+    if query != st.session_state.get("last_generated_query", ""):
+        st.session_state.last_generated_query = query
+        # The Log Search tab lives outside this fragment, so rerun the whole page
+        st.rerun()
+
+
+@st.fragment
+def _generate_tab() -> None:
+    """Generate tab - widget changes here rerun only this tab."""
     with st.expander("How It Works", expanded=True):
-        components.html(GENERATE_WORKFLOW_SVG, height=350, scrolling=False)
+        render_workflow(GENERATE_WORKFLOW_URL, height=350)
     
     generate_type = st.radio(
         "Query type:",
@@ -45,25 +124,13 @@ with tab_generate:
         
         if st.button("Generate Query", type="primary", use_container_width=True, key="gen_log_search"):
             if user_input:
-                logger.info(f"Translating to Log Search: {user_input[:100]}")
+                logger.info("Translating to Log Search: %.100s", user_input)
                 with st.spinner("Generating Log Query..."):
-                    result = generate_log_query(user_input)
-                
-                if result.get("needs_clarification"):
-                    st.warning(result.get("message", "Could you be more specific?"))
-                    if result.get("options"):
-                        st.markdown("**Did you mean:**")
-                        for option in result["options"]:
-                            st.markdown(f"• {option}")
-                else:
-                    st.session_state.last_generated_query = result.get("query", "")
-                    logger.info(f"Generated query: {result.get('query', '')}")
-                    
-                    st.markdown("### Generated Query")
-                    st.code(result.get("query", ""), language="bash")
-
-                    if result.get("explanation"):
-                        st.info(result["explanation"])
+                    result = _generate_log(user_input)
+                _store_generated(result, "generated_log_result", "Generated query")
+        
+        if "generated_log_result" in st.session_state:
+            _show_generated(st.session_state.generated_log_result, language="bash")
     
     else:  # DDSQL Query
         user_input = st.text_area(
@@ -76,75 +143,84 @@ with tab_generate:
         
         if st.button("Generate Query", type="primary", use_container_width=True, key="gen_ddsql"):
             if user_input:
-                logger.info(f"Translating to DDSQL: {user_input[:100]}")
+                logger.info("Translating to DDSQL: %.100s", user_input)
                 with st.spinner("Generating DDSQL Query..."):
-                    result = generate_ddsql_query(user_input)
-                
-                if result.get("needs_clarification"):
-                    st.warning(result.get("message", "Could you be more specific?"))
-                    if result.get("options"):
-                        st.markdown("**Did you mean:**")
-                        for option in result["options"]:
-                            st.markdown(f"• {option}")
-                else:
-                    st.session_state.last_generated_query = result.get("query", "")
-                    logger.info(f"Generated DDSQL query: {result.get('query', '')}")
-                    
-                    st.markdown("### Generated Query")
-                    st.code(result.get("query", ""), language="sql")
-                    
-                    if result.get("explanation"):
-                        st.info(result["explanation"])
+                    result = _generate_ddsql(user_input)
+                _store_generated(result, "generated_ddsql_result", "Generated DDSQL query")
+        
+        if "generated_ddsql_result" in st.session_state:
+            _show_generated(st.session_state.generated_ddsql_result, language="sql")
 
-# --- LOG SEARCH TAB ---
-with tab_log_search:
-    
+
+@st.fragment
+def _log_search_tab() -> None:
+    """Log Search tab - widget changes here rerun only this tab."""
     with st.expander("How It Works", expanded=True):
-        components.html(LOG_SEARCH_WORKFLOW_SVG, height=350, scrolling=False)
+        render_workflow(LOG_SEARCH_WORKFLOW_URL, height=350)
     
     default_query = st.session_state.get("last_generated_query", "")
     
-    query_to_execute = st.text_area(
-        "Enter a Log Search query to execute:",
-        value=default_query,
-        placeholder="e.g., service:payment-service status:error",
-        height=150,
-        key="execute_input",
-        label_visibility="collapsed"
-    )
-    
-    col1, col2 = st.columns(2)
-    with col1:
-        time_range = st.selectbox(
-            "Time range",
-            options=[15, 1440, 43200],
-            format_func=lambda x: {15: "15 min", 1440: "24 hours", 43200: "30 days"}[x],
-            index=0
+    # A form batches the query, time range and limit into a single rerun on submit
+    with st.form("log_search_form", border=False):
+        query_to_execute = st.text_area(
+            "Enter a Log Search query to execute:",
+            value=default_query,
+            placeholder="e.g., service:payment-service status:error",
+            height=150,
+            key="execute_input",
+            label_visibility="collapsed"
         )
     
-    with col2:
-        limit = st.selectbox(
-            "Max results",
-            options=[10, 25, 50, 100],
-            index=2
-        )
+        col1, col2 = st.columns(2)
+        with col1:
+            time_range = st.selectbox(
+                "Time range",
+                options=TIME_RANGE_OPTIONS,
+                format_func=TIME_RANGE_LABELS.__getitem__,
+                index=0
+            )
     
-    st.divider()
+        with col2:
+            limit = st.selectbox(
+                "Max results",
+                options=[10, 25, 50, 100],
+                index=2
+            )
+        
+        st.divider()
+        
+        submitted = st.form_submit_button("Search", type="primary", use_container_width=True)
     
-    if st.button("Search", type="primary", use_container_width=True):
+    if submitted:
         if query_to_execute:
-            logger.info(f"Executing Log Search query: {query_to_execute}")
+            logger.info("Executing Log Search query: %s", query_to_execute)
             with st.spinner("Executing query..."):
-                result = execute_query(query_to_execute, time_range_minutes=time_range, limit=limit)
+                result = _execute(query_to_execute, time_range, limit)
             
-            logger.info(f"Query returned {result.get('count', 0)} results")
+            logger.info("Query returned %s results", result.get("count", 0))
+            st.session_state.last_search_result = result
+    
+    result = st.session_state.get("last_search_result")
+    if result:
+        # Only a sample is rendered by default; the full payload can be up to
+        # 100 logs with nested attributes
+        st.json({
+            "count": result.get("count"),
+            "query": result.get("query"),
+            "datadog_url": result.get("datadog_url"),
+            "sample": result.get("logs", [])[:SEARCH_SAMPLE_SIZE],
+        })
+        
+        # A toggle rather than an expander: collapsed expanders still ship their content
+        if st.toggle("Show full payload", key="show_full_payload"):
             st.json(result)
 
-# --- EXPLAIN TAB ---
-with tab_explain:
-    
+
+@st.fragment
+def _explain_tab() -> None:
+    """Explain tab - widget changes here rerun only this tab."""
     with st.expander("How It Works", expanded=True):
-        components.html(EXPLAIN_WORKFLOW_SVG, height=500, scrolling=False)
+        render_workflow(EXPLAIN_WORKFLOW_URL, height=500)
     
     explain_mode = st.radio(
         "What do you want to explain?",
@@ -154,6 +230,8 @@ with tab_explain:
         key="explain_mode_radio"
     )
     
+    detail = "full" if st.toggle("In-depth explanation", key="explain_in_depth") else "short"
+    
     if explain_mode == "Log Search Query":
         query_input = st.text_area(
             "Paste a Datadog Log Search query to explain:",
@@ -165,9 +243,9 @@ with tab_explain:
         
         if st.button("Explain Query", type="primary", use_container_width=True, key="explain_log_search_btn"):
             if query_input:
-                logger.info(f"Explaining Log Search query: {query_input}")
+                logger.info("Explaining Log Search query: %s", query_input)
                 with st.spinner("Analyzing query..."):
-                    explanation = explain_log_query(query_input)
+                    explanation = _explain_log(query_input, detail)
                 
                 st.info(explanation)
     
@@ -182,9 +260,9 @@ with tab_explain:
         
         if st.button("Explain Query", type="primary", use_container_width=True, key="explain_ddsql_btn"):
             if ddsql_input:
-                logger.info(f"Explaining DDSQL query: {ddsql_input}")
+                logger.info("Explaining DDSQL query: %s", ddsql_input)
                 with st.spinner("Analyzing DDSQL query..."):
-                    explanation = explain_ddsql_query(ddsql_input)
+                    explanation = _explain_ddsql(ddsql_input, detail)
                 
                 st.info(explanation)
     
@@ -199,8 +277,23 @@ with tab_explain:
         
         if st.button("Analyze Log", type="primary", use_container_width=True, key="analyze_log_btn"):
             if log_input:
-                logger.info(f"Analyzing log entry")
+                logger.info("Analyzing log entry")
                 with st.spinner("Analyzing log..."):
-                    explanation = explain_log_entry(log_input)
+                    explanation = _explain_entry(log_input, detail)
                 
                 st.info(explanation)
+
+
+tab_generate, tab_log_search, tab_explain = st.tabs(["✨ Generate", "🔍 Log Search", "💡 Explain"])
+
+# --- GENERATE TAB ---
+with tab_generate:
+    _generate_tab()
+
+# --- LOG SEARCH TAB ---
+with tab_log_search:
+    _log_search_tab()
+
+# --- EXPLAIN TAB ---
+with tab_explain:
+    _explain_tab()
@@ -7,16 +7,9 @@ Scrape URLs to markdown and generate hybrid embeddings:
 """
 
 import streamlit as st
-import streamlit.components.v1 as components
-from services.scraper_service import url_to_collection_name
+
 from configs.logger import get_logger
-from renderings import EMBEDDINGS_WORKFLOW_SVG
-from services.vectorstore_service import (
-    list_collections,
-    index_url,
-    hybrid_search,
-    delete_collection,
-)
+from renderings import EMBEDDINGS_WORKFLOW_URL, render_workflow
 
 logger = get_logger("embeddings")
 
@@ -26,150 +19,196 @@ st.set_page_config(
     layout="wide",
 )
 
-# --- HOW IT WORKS ---
-with st.expander("How It Works", expanded=True):
-    components.html(EMBEDDINGS_WORKFLOW_SVG, height=300, scrolling=False)
 
-st.divider()
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_collections() -> list[dict]:
+    """List collections, refetching from Qdrant at most every 30 seconds."""
+    # Imported lazily (here and in the handlers below) so qdrant-client, openai and
+    # fastembed load on first use rather than on every page import
+    from services.vectorstore_service import list_collections
 
-# --- COLLECTIONS ---
-st.subheader("Collections")
+    return list_collections()
 
-collections = list_collections()
 
-if collections:
-    col1, col2 = st.columns([4, 1])
+def _collection_counts() -> dict[str, int]:
+    """Map collection names to their chunk counts."""
+    return {c["name"]: c["points_count"] for c in _cached_collections()}
+
+
+@st.fragment
+def _collections_section() -> None:
+    """Collections list - widget changes here rerun only this section."""
+    counts = _collection_counts()
+
+    if counts:
+        col1, col2 = st.columns([4, 1])
     
-    with col1:
-        # Dropdown with collection info
-        collection_options = [
-            f"{c['name']} ({c['points_count']} chunks)"
-            for c in collections
-        ]
-        selected_option = st.selectbox(
-            "Select collection:",
-            options=collection_options,
-            index=None,
-            placeholder="Choose a collection",
-            label_visibility="collapsed",
-        )
-        # Extract collection name from selection
-        selected_collection = selected_option.split(" (")[0] if selected_option else None
+        with col1:
+            # Dropdown keyed by collection name, labelled with its chunk count
+            selected_collection = st.selectbox(
+                "Select collection:",
+                options=list(counts),
+                index=None,
+                format_func=lambda name: f"{name} ({counts[name]} chunks)",
+                placeholder="Choose a collection",
+                label_visibility="collapsed",
+            )
     
-    with col2:
-        if st.button("Delete", type="secondary", use_container_width=True):
-            if selected_collection:
-                delete_collection(selected_collection)
-                st.rerun()
-else:
-    st.info("No collections yet. Add a URL below to create one.")
+        with col2:
+            if st.button("Delete", type="secondary", use_container_width=True):
+                if selected_collection:
+                    from services.vectorstore_service import delete_collection
+
+                    delete_collection(selected_collection)
+                    _cached_collections.clear()
+                    # The deleted collection must also leave the Search section,
+                    # which is a separate fragment, so rerun the whole page
+                    st.rerun()
+    else:
+        st.info("No collections yet. Add a URL below to create one.")
 
-st.divider()
 
-# --- ADD URL ---
-st.subheader("Add URL")
+@st.fragment
+def _add_url_section() -> None:
+    """Add URL form - widget changes here rerun only this section."""
+    # Initialize session state for collection name
+    if "generated_collection_name" not in st.session_state:
+        st.session_state.generated_collection_name = ""
 
-# Initialize session state for collection name
-if "generated_collection_name" not in st.session_state:
-    st.session_state.generated_collection_name = ""
+    url_input = st.text_input(
+        "URL to scrape:",
+        placeholder="https://docs.datadoghq.com/logs/explorer/search_syntax/",
+        key="url_input",
+    )
 
-url_input = st.text_input(
-    "URL to scrape:",
-    placeholder="https://docs.datadoghq.com/logs/explorer/search_syntax/",
-    key="url_input",
-)
+    # Auto-generate collection name only when the URL actually changes
+    if url_input and url_input != st.session_state.get("last_slugged_url"):
+        from services.scraper_service import url_to_collection_name
 
-# Auto-generate collection name when URL changes
-if url_input:
-    generated_name = url_to_collection_name(url_input)
-    if generated_name != st.session_state.generated_collection_name:
-        st.session_state.generated_collection_name = generated_name
-
-# Show generated collection name (editable)
-collection_name = st.text_input(
-    "Collection name (auto-generated):",
-    value=st.session_state.generated_collection_name,
-    placeholder="Enter URL above to auto-generate",
-)
+        st.session_state.last_slugged_url = url_input
+        st.session_state.generated_collection_name = url_to_collection_name(url_input)
+
+    # Show generated collection name (editable)
+    collection_name = st.text_input(
+        "Collection name (auto-generated):",
+        value=st.session_state.generated_collection_name,
+        placeholder="Enter URL above to auto-generate",
+    )
 
-# Progress placeholders
-progress_container = st.empty()
-status_container = st.empty()
+    # Progress placeholders
+    progress_container = st.empty()
+    status_container = st.empty()
 
-if st.button("Index URL", type="primary", use_container_width=True):
-    if url_input and collection_name:
-        # Sanitize collection name
-        safe_name = collection_name.lower().replace(" ", "-")
+    if st.button("Index URL", type="primary", use_container_width=True):
+        if url_input and collection_name:
+            # Sanitize collection name
+            safe_name = collection_name.lower().replace(" ", "-")
         
-        # Create progress bar
-        progress_bar = progress_container.progress(0)
+            # Create progress bar
+            progress_bar = progress_container.progress(0)
         
-        def update_progress(current: int, total: int, status: str):
-            """Callback to update progress bar and status."""
-            if total > 0:
-                progress_bar.progress(current / total, text=f"{current}/{total} chunks")
-            status_container.caption(status)
+            def update_progress(current: int, total: int, status: str):
+                """Callback to update progress bar and status."""
+                if total > 0:
+                    progress_bar.progress(current / total, text=f"{current}/{total} chunks")
+                status_container.caption(status)
         
-        try:
-            chunks_indexed = index_url(
-                collection_name=safe_name,
-                url=url_input,
-                progress_callback=update_progress,
-            )
-            # Clear progress indicators
-            progress_container.empty()
-            status_container.empty()
+            try:
+                from services.vectorstore_service import index_url
+
+                chunks_indexed = index_url(
+                    collection_name=safe_name,
+                    url=url_input,
+                    progress_callback=update_progress,
+                )
+                # Clear progress indicators
+                progress_container.empty()
+                status_container.empty()
             
-            st.success(f"Indexed {chunks_indexed} chunks into '{safe_name}'")
-            # Reset session state
-            st.session_state.generated_collection_name = ""
-            st.rerun()
-        except Exception as e:
-            # Clear progress indicators
-            progress_container.empty()
-            status_container.empty()
+                st.success(f"Indexed {chunks_indexed} chunks into '{safe_name}'")
+                # Reset session state
+                st.session_state.generated_collection_name = ""
+                st.session_state.last_slugged_url = None
+                _cached_collections.clear()
+                # The new collection must show up in the Collections and Search
+                # sections, which are separate fragments, so rerun the whole page
+                st.rerun()
+            except Exception as e:
+                # Clear progress indicators
+                progress_container.empty()
+                status_container.empty()
             
-            logger.error(f"Failed to index URL: {e}")
-            st.error(f"Failed to index: {e}")
-    else:
-        st.warning("Please enter a URL.")
+                logger.error(f"Failed to index URL: {e}")
+                st.error(f"Failed to index: {e}")
+        else:
+            st.warning("Please enter a URL.")
 
-st.divider()
 
-# --- SEARCH TEST ---
-st.subheader("Test Hybrid Search")
+@st.fragment
+def _search_section() -> None:
+    """Hybrid search test - widget changes here rerun only this section."""
+    counts = _collection_counts()
 
-col1, col2 = st.columns([3, 1])
+    # A form batches the query and collection choice into a single rerun on submit
+    with st.form("search_test_form", border=False):
+        col1, col2 = st.columns([3, 1])
 
-with col1:
-    search_query = st.text_input(
-        "Search query:",
-        placeholder="filter by HTTP status code",
-    )
+        with col1:
+            search_query = st.text_input(
+                "Search query:",
+                placeholder="filter by HTTP status code",
+            )
 
-with col2:
-    search_collection = st.selectbox(
-        "Collection:",
-        options=[c["name"] for c in collections] if collections else ["No collections"],
-        disabled=not collections,
-    )
+        with col2:
+            search_collection = st.selectbox(
+                "Collection:",
+                options=list(counts) if counts else ["No collections"],
+                disabled=not counts,
+            )
+
+        submitted = st.form_submit_button("Search", use_container_width=True)
+
+    if submitted:
+        if search_query and counts:
+            with st.spinner("Searching..."):
+                from services.vectorstore_service import hybrid_search
 
-if st.button("Search", use_container_width=True):
-    if search_query and collections:
-        with st.spinner("Searching..."):
-            results = hybrid_search(search_collection, search_query, limit=5)
+                results = hybrid_search(search_collection, search_query, limit=5)
         
-        if results:
-            st.markdown(f"**Found {len(results)} results:**")
+            if results:
+                st.markdown(f"**Found {len(results)} results:**")
             
-            for i, result in enumerate(results, 1):
-                with st.expander(f"Result {i} (score: {result['score']:.3f})"):
-                    st.markdown(result["text"])
-                    st.caption(f"Source: {result['url']}")
-        else:
-            st.info("No results found.")
-    elif not collections:
-        st.warning("No collections to search. Add a URL first.")
+                for i, result in enumerate(results, 1):
+                    with st.expander(f"Result {i} (score: {result['score']:.3f})"):
+                        st.markdown(result["text"])
+                        st.caption(f"Source: {result['url']}")
+            else:
+                st.info("No results found.")
+        elif not counts:
+            st.warning("No collections to search. Add a URL first.")
+
+
+# --- HOW IT WORKS ---
+with st.expander("How It Works", expanded=True):
+    render_workflow(EMBEDDINGS_WORKFLOW_URL, height=300)
+
+st.divider()
+
+# --- COLLECTIONS ---
+st.subheader("Collections")
+_collections_section()
+
+st.divider()
+
+# --- ADD URL ---
+st.subheader("Add URL")
+_add_url_section()
+
+st.divider()
+
+# --- SEARCH TEST ---
+st.subheader("Test Hybrid Search")
+_search_section()
 
 st.divider()
 
@@ -1,339 +1,256 @@
 """Centralized prompts for the Log Explorer application."""
 
-TRANSLATOR_SYSTEM_PROMPT = """You are a Datadog Log Search query assistant. Translate natural language 
-questions into valid Datadog Log Search syntax for the Log Explorer.
-
-RELEVANT DOCUMENTATION:
-{rag_context}
-
-LOG SEARCH SYNTAX RULES:
-
-1. Reserved Attributes (no @ prefix):
-   - service:payment-service
-   - status:error (or status:warn, status:info)
-   - host:web-server-01
-   - source:nginx
-
-2. Facets and Custom Attributes (@ prefix required):
-   - @http.status_code:500
-   - @http.method:POST
-   - @duration:>1000000000  (nanoseconds)
-   - @error.message:*timeout*
-   - @usr.id:12345
-
-3. Comparisons:
-   - Exact: @http.status_code:500
-   - Range: @http.status_code:>=400
-   - Greater than: @duration:>1000000000
-   
-4. Wildcards:
-   - @error.message:*connection*refused*
-   - service:payment*
-
-5. Boolean Logic:
-   - AND: Use space (implicit) → service:api status:error
-   - OR: Use OR keyword → status:error OR status:warn
-   - NOT: Use NOT or - → NOT service:test OR -service:test
-   - Grouping: (status:error OR status:warn)
-
-6. Security/Audit Patterns:
-   - Authentication: @evt.name:authentication @evt.outcome:failure
-   - CloudTrail: source:cloudtrail @evt.name:ConsoleLogin
-   - Suspicious IPs: NOT @network.client.ip:10.* NOT @network.client.ip:192.168.*
-
-IMPORTANT:
-- Duration is in NANOSECONDS (1 second = 1000000000 ns)
-- Reserved attributes don't need @, facets/custom attributes need @
-- Use wildcards (*) for partial matching
-
-Return JSON with this structure:
-{{
-  "query": "the Log Search query",
-  "explanation": "what this query does in plain English"
-}}
-
-If the request is ambiguous, return:
-{{
-  "needs_clarification": true,
-  "message": "question to ask the user",
-  "options": ["option1", "option2", "option3"]
-}}
+import re
+
+# The system prompts are fully static; per-request RAG context goes in the user
+# message instead. They are well under Anthropic's minimum cacheable prompt length
+# (1024 tokens, 2048 for Haiku), so they aren't marked for prompt caching.
+
+TRANSLATOR_SYSTEM_PROMPT = """You translate natural language into Datadog Log Search queries.
+
+SYNTAX:
+- Reserved attributes, no @: service:payment-service, status:error|warn|info, host:web-server-01, source:nginx
+- Facets/custom attributes need @: @http.status_code:500, @http.method:POST, @error.message:*timeout*, @usr.id:12345
+- @duration is in NANOSECONDS (1s = 1000000000)
+- cmp: :>, :<, :>=, :<=, :[a TO b] (e.g. @http.status_code:>=400)
+- Wildcards: @error.message:*connection*refused*, service:payment*
+- Boolean: space = AND, OR, NOT or - (e.g. -service:test), group with ( )
+- Security: @evt.name:authentication @evt.outcome:failure; source:cloudtrail @evt.name:ConsoleLogin; NOT @network.client.ip:10.*
+
+Return exactly, with no code fences:
+<Log Search query>
+---
+<what it does, plain English>
+If ambiguous, return one line:
+CLARIFY|||<question>|||<opt1>;<opt2>;<opt3>
 """
 
-DDSQL_TRANSLATOR_SYSTEM_PROMPT = """You are a Datadog DDSQL query assistant. Translate natural language 
-questions into valid DDSQL (Datadog SQL) queries. DDSQL is SQL for Datadog data, compatible with PostgreSQL syntax.
-
-RELEVANT DOCUMENTATION:
-{rag_context}
-
-DATA TYPES:
-- BIGINT: 64-bit signed integers
-- BOOLEAN: true or false
-- DECIMAL: Floating-point numbers
-- INTERVAL: Time duration (e.g., INTERVAL '30 minutes')
-- JSON: JSON data
-- TIMESTAMP: Date and time values
-- VARCHAR: Variable-length strings
-
-SUPPORTED SQL SYNTAX:
-- SELECT (DISTINCT), JOIN (FULL/INNER/LEFT/RIGHT), GROUP BY, ORDER BY (ASC/DESC)
-- WHERE with LIKE, IN, ON, OR filters
-- HAVING, LIMIT, OFFSET
-- CASE WHEN...THEN...ELSE...END
-- IS NULL / IS NOT NULL
-- USING for joins with same column names
-- || for string concatenation
-- Arithmetic: +, -, *, /
+DDSQL_TRANSLATOR_SYSTEM_PROMPT = """You translate natural language into DDSQL (Datadog SQL, PostgreSQL-compatible).
+
+TYPES: BIGINT, BOOLEAN, DECIMAL, INTERVAL ('30 minutes'), JSON, TIMESTAMP, VARCHAR
+SQL: SELECT [DISTINCT], [FULL|INNER|LEFT|RIGHT] JOIN ... ON/USING, WHERE (LIKE, IN, OR), GROUP BY, HAVING, ORDER BY, LIMIT, OFFSET, CASE WHEN, IS [NOT] NULL, ||, + - * /
 
 TABLE FUNCTIONS:
+dd.logs(
+    filter => 'Log Search filter',
+    columns => ARRAY['col1', ...],
+    indexes => ARRAY['index1', ...],        -- optional
+    from_timestamp => TIMESTAMP '...',      -- optional
+    to_timestamp => TIMESTAMP '...'         -- optional
+) AS (col1 TYPE, ...)
+dd.metrics_scalar('metric_query', 'avg|max|min|sum' [, from_timestamp, to_timestamp])
+dd.metrics_timeseries('metric_query' [, from_timestamp, to_timestamp])
+
+TAGS (HSTORE): tags->'region', akeys(tags), avals(tags)
+FUNCTIONS: MIN, MAX, COUNT, SUM, AVG, BOOL_AND, BOOL_OR, CEIL, FLOOR, ROUND, POWER, ABS, LOWER, UPPER, LENGTH, TRIM, REPLACE, SUBSTRING, STRPOS, SPLIT_PART, EXTRACT, TO_TIMESTAMP, TO_CHAR, DATE_BIN, DATE_TRUNC, NOW(), json_extract_path_text, json_extract_path, json_array_elements, CARDINALITY, ARRAY_POSITION, STRING_TO_ARRAY, ARRAY_AGG, UNNEST, COALESCE, CAST, CURRENT_SETTING, REGEXP_LIKE, REGEXP_MATCH, REGEXP_REPLACE
+WINDOW: OVER (PARTITION BY ...), RANK(), ROW_NUMBER(), LEAD, LAG, FIRST_VALUE, LAST_VALUE, NTH_VALUE
+
+RULES:
+- Follow the shape of the EXAMPLES sent with the request
+- dd.logs() always needs the AS clause with column names and types
+- Single quotes for strings; default time range is 1 hour
+- Use LIMIT for large result sets
+
+Return exactly, with no code fences:
+<DDSQL query>
+---
+<what it does, plain English>
+If ambiguous, return one line:
+CLARIFY|||<question>|||<opt1>;<opt2>;<opt3>
+"""
 
-1. dd.logs() - Query log data:
-   dd.logs(
-       filter => 'Log Search filter string',
-       columns => ARRAY['col1', 'col2', ...],
-       indexes => ARRAY['index1', ...],        -- optional
-       from_timestamp => TIMESTAMP '...',      -- optional
-       to_timestamp => TIMESTAMP '...'         -- optional
-   ) AS (col1 TYPE, col2 TYPE, ...)
-   
-   NOTE: Default time range is 1 hour if not specified.
-
-2. dd.metrics_scalar() - Aggregate metric to scalar:
-   dd.metrics_scalar(
-       'metric_query',
-       'reducer',                              -- avg, max, min, sum
-       from_timestamp,                         -- optional
-       to_timestamp                            -- optional
-   )
-
-3. dd.metrics_timeseries() - Metric as timeseries:
-   dd.metrics_timeseries(
-       'metric_query',
-       from_timestamp,                         -- optional
-       to_timestamp                            -- optional
-   )
-
-TAGS (HSTORE type):
-- Access tag value: tags->'region'
-- Get all keys: akeys(tags)
-- Get all values: avals(tags)
-- Compare tags: da.tags = de.tags OR da.tags->'app' = de.tags->'app'
-
-COMMON FUNCTIONS:
-- Aggregation: MIN, MAX, COUNT, SUM, AVG, BOOL_AND, BOOL_OR
-- Math: CEIL, FLOOR, ROUND, POWER, ABS
-- String: LOWER, UPPER, LENGTH, TRIM, REPLACE, SUBSTRING, STRPOS, SPLIT_PART
-- Date/Time: EXTRACT, TO_TIMESTAMP, TO_CHAR, DATE_BIN, DATE_TRUNC, NOW()
-- JSON: json_extract_path_text, json_extract_path, json_array_elements
-- Array: CARDINALITY, ARRAY_POSITION, STRING_TO_ARRAY, ARRAY_AGG, UNNEST
-- Other: COALESCE, CAST, CURRENT_SETTING
-
-WINDOW FUNCTIONS:
-- OVER, PARTITION BY, RANK(), ROW_NUMBER()
-- LEAD(col), LAG(col), FIRST_VALUE(col), LAST_VALUE(col), NTH_VALUE(col, offset)
-
-REGEX FUNCTIONS:
-- REGEXP_LIKE(input, pattern) - Returns boolean
-- REGEXP_MATCH(input, pattern [, flags]) - Returns array of matches
-- REGEXP_REPLACE(input, pattern, replacement [, flags])
-
-EXAMPLE QUERIES:
-
--- Query error logs with service filter
-SELECT timestamp, host, service, message 
+# Few-shot DDSQL examples. Only the ones closest to the user's question are sent
+# with each request (see select_ddsql_examples), not all of them every time.
+DDSQL_EXAMPLES = (
+    ("Query error logs with service filter", """SELECT timestamp, host, service, message
 FROM dd.logs(
     filter => 'service:payment-service status:error',
     columns => ARRAY['timestamp', 'host', 'service', 'message']
 ) AS (timestamp TIMESTAMP, host VARCHAR, service VARCHAR, message VARCHAR)
-LIMIT 100
-
--- Count errors by service
-SELECT service, COUNT(*) as error_count
+LIMIT 100"""),
+    ("Count errors by service", """SELECT service, COUNT(*) AS error_count
 FROM dd.logs(
     filter => 'status:error',
     columns => ARRAY['service']
 ) AS (service VARCHAR)
 GROUP BY service
-ORDER BY error_count DESC
-
--- Average CPU by service (metrics)
-SELECT * FROM dd.metrics_scalar(
-    'avg:system.cpu.user{{*}} by {{service}}',
+ORDER BY error_count DESC"""),
+    ("Average CPU by service (metrics)", """SELECT * FROM dd.metrics_scalar(
+    'avg:system.cpu.user{*} by {service}',
     'avg'
-) ORDER BY value DESC
-
--- Query with explicit time range
-SELECT timestamp, service, message
+) ORDER BY value DESC"""),
+    ("Query with explicit time range", """SELECT timestamp, service, message
 FROM dd.logs(
     filter => 'status:error',
     columns => ARRAY['timestamp', 'service', 'message'],
     from_timestamp => TIMESTAMP '2025-01-01 00:00:00',
     to_timestamp => TIMESTAMP '2025-01-02 00:00:00'
-) AS (timestamp TIMESTAMP, service VARCHAR, message VARCHAR)
-
--- Extract JSON field from attributes
-SELECT 
+) AS (timestamp TIMESTAMP, service VARCHAR, message VARCHAR)"""),
+    ("Extract JSON field from attributes", """SELECT
     timestamp,
-    json_extract_path_text(attributes, 'http', 'status_code') as status_code
+    json_extract_path_text(attributes, 'http', 'status_code') AS status_code
 FROM dd.logs(
     filter => 'source:nginx',
     columns => ARRAY['timestamp', 'attributes']
-) AS (timestamp TIMESTAMP, attributes JSON)
-
--- Query with tags (for infrastructure data)
-SELECT instance_type, COUNT(*) as count
+) AS (timestamp TIMESTAMP, attributes JSON)"""),
+    ("Query with tags (for infrastructure data)", """SELECT instance_type, COUNT(*) AS count
 FROM aws.ec2_instance
 WHERE tags->'region' = 'us-east-1'
-GROUP BY instance_type
-
-IMPORTANT:
-- Always define the AS clause with column names and types for dd.logs()
-- Use single quotes for strings
-- In metrics queries, escape curly braces: {{*}} instead of {{*}}
-- Default time range is 1 hour if not specified
-- Use LIMIT to avoid large result sets
-- INTERVAL syntax: INTERVAL '30 minutes', INTERVAL '1 hour', INTERVAL '7 days'
-
-Return JSON with this structure:
-{{
-  "query": "the DDSQL query",
-  "explanation": "what this query does in plain English"
-}}
-
-If the request is ambiguous, return:
-{{
-  "needs_clarification": true,
-  "message": "question to ask the user",
-  "options": ["option1", "option2", "option3"]
-}}
+GROUP BY instance_type"""),
+)
+
+_WORD_PATTERN = re.compile(r"[a-z0-9_]+")
+
+# Words too common in questions or SQL to say anything about relevance
+_STOPWORDS = frozenset({
+    "a", "an", "and", "all", "as", "by", "dd", "for", "from", "in", "is", "me",
+    "of", "on", "or", "select", "show", "the", "to", "what", "with",
+})
+
+
+def _keywords(text: str) -> frozenset[str]:
+    """Lowercased words of text, minus stopwords, with a trailing plural 's' removed."""
+    return frozenset(
+        word[:-1] if len(word) > 3 and word.endswith("s") else word
+        for word in _WORD_PATTERN.findall(text.lower())
+        if word not in _STOPWORDS
+    )
+
+
+_DDSQL_EXAMPLE_KEYWORDS = tuple(_keywords(f"{title} {query}") for title, query in DDSQL_EXAMPLES)
+
+
+def select_ddsql_examples(question: str, k: int = 2) -> str:
+    """
+    Pick the DDSQL examples that share the most keywords with a question.
+    
+    Args:
+        question: The user's question in plain English
+        k: Number of examples to include
+        
+    Returns:
+        An EXAMPLES block to append to the user message
+    """
+    words = _keywords(question)
+    ranked = sorted(
+        range(len(DDSQL_EXAMPLES)),
+        key=lambda i: len(words & _DDSQL_EXAMPLE_KEYWORDS[i]),
+        reverse=True,
+    )
+    return "\n\nEXAMPLES:\n" + "\n\n".join(
+        f"-- {DDSQL_EXAMPLES[i][0]}\n{DDSQL_EXAMPLES[i][1]}" for i in ranked[:k]
+    )
+
+
+# The explainer and analyzer prompts come in two detail levels. "short" asks for
+# a couple of sections only; "full" is the complete walkthrough.
+
+_LOG_EXPLAINER_HEADER = """You explain Datadog Log Search queries in plain English for beginners.
+
+SYNTAX:
+- Reserved attributes, no @: service, status, host, source, message, trace_id
+- Facets need @: @http.status_code, @duration (NANOSECONDS), @error.message, @evt.name, @usr.id
+- Wildcards *pattern*; space = AND, OR, NOT or -; cmp :>, :<, :>=, :<=, :[a TO b]
 """
 
-LOG_EXPLAINER_SYSTEM_PROMPT = """You are a Datadog Log Search query expert. Given a Log Search query,
-provide a comprehensive, well-structured explanation in plain English.
-
-RELEVANT DOCUMENTATION:
-{rag_context}
-
-DATADOG SYNTAX REFERENCE:
-- Reserved attributes (no @): service, status, host, source, message, trace_id
-- Facets/attributes (@ prefix): @http.status_code, @duration, @error.message, @evt.name, @usr.id, etc.
-- @duration is in NANOSECONDS (1 second = 1,000,000,000 ns)
-- Wildcards: *pattern* for partial matching
-- Boolean: spaces = AND, OR for OR, NOT or - for negation
-- Comparisons: :>, :<, :>=, :<=, :[ TO ] for ranges
-
-FORMAT YOUR RESPONSE EXACTLY AS FOLLOWS:
+LOG_EXPLAINER_SYSTEM_PROMPTS = {
+    "short": _LOG_EXPLAINER_HEADER + """
+FORMAT:
+## Summary
+1-2 sentences: what it searches for and why.
 
+## Key Points
+- 3-5 bullets: each filter and what it matches
+""",
+    "full": _LOG_EXPLAINER_HEADER + """
+FORMAT:
 ## Summary
-A clear 1-2 sentence summary of what this query searches for and why someone might use it.
+1-2 sentences: what it searches for and why.
 
 ## Query Breakdown
-
-| Component | Type | Meaning |
-|-----------|------|---------|
-| `component1` | attribute type | what it filters |
-| `component2` | attribute type | what it filters |
+|component|type|meaning|
 
 ## What This Matches
-- Bullet point describing the logs that will be returned
-- Include specifics about services, statuses, events, etc.
+- Logs returned (services, statuses, events)
 
 ## Use Cases
-- Common scenario where this query would be useful
-- Another relevant use case
+- 2 scenarios
 
 ## Tips
-- Any gotchas or important notes about this query
-- Suggestions for modifications or related queries
+- Gotchas, modifications, related queries
+""",
+}
 
-Be thorough but concise. Use clear, beginner-friendly language. Always explain technical terms.
-"""
-
-LOG_ANALYZER_SYSTEM_PROMPT = """You are a senior Site Reliability Engineer analyzing log entries.
-Given a log entry (JSON format), provide a detailed analysis of what happened and potential root causes.
+_LOG_ANALYZER_HEADER = """You are a senior SRE analyzing a JSON log entry. Cite actual values from the log; put the most likely explanation first.
 
-RELEVANT DOCUMENTATION:
-{rag_context}
+Consider: service role, severity, errors and stack traces, HTTP status, event outcome, user/session, network/geo, timing.
+"""
 
-Analyze the log considering:
-- The service and its role in the system
-- The status/severity level
-- Error messages and stack traces
-- HTTP status codes and their meanings
-- Event types and outcomes
-- User/session information
-- Network and geographic data
-- Timing and duration information
+LOG_ANALYZER_SYSTEM_PROMPTS = {
+    "short": _LOG_ANALYZER_HEADER + """
+FORMAT:
+## What Happened
+The event this log represents.
 
-FORMAT YOUR RESPONSE EXACTLY AS FOLLOWS:
+## Severity
+Critical/High/Medium/Low/Info, and what is affected.
 
+## Top Cause
+The most likely cause, in 1-2 sentences.
+""",
+    "full": _LOG_ANALYZER_HEADER + """
+FORMAT:
 ## What Happened
-A clear explanation of what this log entry represents and what event occurred.
+The event this log represents.
 
 ## Severity Assessment
-- **Level:** (Critical/High/Medium/Low/Info)
-- **Impact:** What systems or users might be affected
+- **Level:** Critical/High/Medium/Low/Info
+- **Impact:** Affected systems or users
 
 ## Potential Root Causes
-1. Most likely cause with explanation
-2. Alternative cause with explanation
-3. Another possibility if applicable
+1. Most likely cause, with reasoning
+2. Alternatives
 
 ## Recommended Actions
-- Immediate steps to investigate or resolve
-- Follow-up actions for prevention
-- Related logs or metrics to check
+- Investigate/resolve now, prevent later, related logs or metrics
 
 ## Context
-- Relevant details about the service, user, or request
-- Any patterns or anomalies in the data
-
-Be specific and actionable. Reference actual values from the log entry. Prioritize the most likely explanations.
-"""
+- Relevant service/user/request details, patterns or anomalies
+""",
+}
 
-DDSQL_EXPLAINER_SYSTEM_PROMPT = """You are a DDSQL (Datadog SQL) query expert. Given a DDSQL query,
-provide a comprehensive, well-structured explanation in plain English.
+_DDSQL_EXPLAINER_HEADER = """You explain DDSQL (Datadog SQL) queries in plain English for beginners, explaining SQL concepts where needed.
 
-RELEVANT DOCUMENTATION:
-{rag_context}
-
-DDSQL SYNTAX REFERENCE:
-- Table functions: dd.logs(), dd.metrics_scalar(), dd.metrics_timeseries()
-- dd.logs() requires: filter, columns, AS clause with types
-- Standard SQL: SELECT, FROM, WHERE, GROUP BY, ORDER BY, LIMIT, JOIN
-- Tags access: tags->'key' (HSTORE type)
-- JSON functions: json_extract_path_text(), json_array_elements()
-- Aggregations: COUNT, SUM, AVG, MIN, MAX
-- Window functions: OVER, PARTITION BY, RANK(), ROW_NUMBER()
+SYNTAX:
+- Table functions: dd.logs() (filter, columns, AS clause with types), dd.metrics_scalar(), dd.metrics_timeseries()
+- Standard SQL, JOIN, window functions (OVER, PARTITION BY, RANK(), ROW_NUMBER())
+- Tags: tags->'key' (HSTORE); JSON: json_extract_path_text(), json_array_elements()
+"""
 
-FORMAT YOUR RESPONSE EXACTLY AS FOLLOWS:
+DDSQL_EXPLAINER_SYSTEM_PROMPTS = {
+    "short": _DDSQL_EXPLAINER_HEADER + """
+FORMAT:
+## Summary
+1-2 sentences: what it does and why.
 
+## Key Points
+- 3-5 bullets: data source, filters, aggregation, output
+""",
+    "full": _DDSQL_EXPLAINER_HEADER + """
+FORMAT:
 ## Summary
-A clear 1-2 sentence summary of what this query does and why someone might use it.
+1-2 sentences: what it does and why.
 
 ## Query Breakdown
-
-| Clause | Purpose |
-|--------|---------|
-| SELECT | What columns/data are being retrieved |
-| FROM | Data source (logs, metrics, etc.) |
-| WHERE/filter | Filtering conditions |
-| GROUP BY | How results are aggregated |
-| ORDER BY | How results are sorted |
+|clause|purpose|
 
 ## Data Flow
-1. Step-by-step explanation of how data flows through the query
-2. What transformations or aggregations are applied
-3. What the final output looks like
+1. How data flows through the query, transformations applied, final output
 
 ## Use Cases
-- Common scenario where this query would be useful
-- Another relevant use case
+- 2 scenarios
 
 ## Tips
-- Performance considerations
-- Alternative approaches
-- Common modifications
-
-Be thorough but concise. Use clear, beginner-friendly language. Explain SQL concepts when relevant.
-"""
+- Performance, alternatives, common modifications
+""",
+}
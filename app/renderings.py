@@ -2,6 +2,10 @@
 SVG diagrams for workflow visualizations.
 """
 
+from pathlib import Path
+
+import streamlit.components.v1 as components
+
 # Generate workflow SVG diagram
 GENERATE_WORKFLOW_SVG = '''
 <svg id="export-svg" width="100%" xmlns="http://www.w3.org/2000/svg" class="flowchart" style="max-width: 2067.59px; background: rgb(35, 32, 48);" viewBox="0 0 2067.59375 470.451171875" role="graphics-document document" aria-roledescription="flowchart-v2"><style xmlns="http://www.w3.org/1999/xhtml">p {margin: 0;}</style><style>#export-svg{font-family:arial,sans-serif;font-size:14px;fill:#ccc;}@keyframes edge-animation-frame{from{stroke-dashoffset:0;}}@keyframes dash{to{stroke-dashoffset:0;}}#export-svg .edge-animation-slow{stroke-dasharray:9,5!important;stroke-dashoffset:900;animation:dash 50s linear infinite;stroke-linecap:round;}#export-svg .edge-animation-fast{stroke-dasharray:9,5!important;stroke-dashoffset:900;animation:dash 20s linear infinite;stroke-linecap:round;}#export-svg .error-icon{fill:#a44141;}#export-svg .error-text{fill:#ddd;stroke:#ddd;}#export-svg .edge-thickness-normal{stroke-width:1px;}#export-svg .edge-thickness-thick{stroke-width:3.5px;}#export-svg .edge-pattern-solid{stroke-dasharray:0;}#export-svg .edge-thickness-invisible{stroke-width:0;fill:none;}#export-svg .edge-pattern-dashed{stroke-dasharray:3;}#export-svg .edge-pattern-dotted{stroke-dasharray:2;}#export-svg .marker{fill:lightgrey;stroke:lightgrey;}#export-svg .marker.cross{stroke:lightgrey;}#export-svg svg{font-family:arial,sans-serif;font-size:14px;}#export-svg p{margin:0;}#export-svg .label{font-family:arial,sans-serif;color:#ccc;}#export-svg .cluster-label text{fill:#F9FFFE;}#export-svg .cluster-label span{color:#F9FFFE;}#export-svg .cluster-label span p{background-color:transparent;}#export-svg .label text,#export-svg span{fill:#ccc;color:#ccc;}#export-svg .node rect,#export-svg .node circle,#export-svg .node ellipse,#export-svg .node polygon,#export-svg .node path{fill:#1f2020;stroke:#ccc;stroke-width:1px;}#export-svg .rough-node .label text,#export-svg .node .label text,#export-svg .image-shape .label,#export-svg .icon-shape .label{text-anchor:middle;}#export-svg .node .katex path{fill:#000;stroke:#000;stroke-width:1px;}#export-svg .rough-node .label,#export-svg .node .label,#export-svg .image-shape .label,#export-svg .icon-shape .label{text-align:center;}#export-svg .node.clickable{cursor:pointer;}#export-svg .root .anchor path{fill:lightgrey!important;stroke-width:0;stroke:lightgrey;}#export-svg .arrowheadPath{fill:lightgrey;}#export-svg .edgePath .path{stroke:lightgrey;stroke-width:1px;}#export-svg .flowchart-link{stroke:lightgrey;fill:none;}#export-svg .edgeLabel{background-color:hsl(0, 0%, 34.4117647059%);text-align:center;}#export-svg .edgeLabel p{background-color:hsl(0, 0%, 34.4117647059%);}#export-svg .edgeLabel rect{opacity:0.5;background-color:hsl(0, 0%, 34.4117647059%);fill:hsl(0, 0%, 34.4117647059%);}#export-svg .labelBkg{background-color:rgba(87.75, 87.75, 87.75, 0.5);}#export-svg .cluster rect{fill:hsl(180, 1.5873015873%, 28.3529411765%);stroke:rgba(255, 255, 255, 0.25);stroke-width:1px;}#export-svg .cluster text{fill:#F9FFFE;}#export-svg .cluster span{color:#F9FFFE;}#export-svg div.mermaidTooltip{position:absolute;text-align:center;max-width:200px;padding:2px;font-family:arial,sans-serif;font-size:12px;background:hsl(20, 1.5873015873%, 12.3529411765%);border:1px solid rgba(255, 255, 255, 0.25);border-radius:2px;pointer-events:none;z-index:100;}#export-svg .flowchartTitleText{text-anchor:middle;font-size:18px;fill:#ccc;}#export-svg rect.text{fill:none;stroke-width:0;}#export-svg .icon-shape,#export-svg .image-shape{background-color:hsl(0, 0%, 34.4117647059%);text-align:center;}#export-svg .icon-shape p,#export-svg .image-shape p{background-color:hsl(0, 0%, 34.4117647059%);padding:2px;}#export-svg .icon-shape rect,#export-svg .image-shape rect{opacity:0.5;background-color:hsl(0, 0%, 34.4117647059%);fill:hsl(0, 0%, 34.4117647059%);}#export-svg .label-icon{display:inline-block;height:1em;overflow:visible;vertical-align:-0.125em;}#export-svg .node .label-icon path{fill:currentColor;stroke:revert;stroke-width:revert;}#export-svg .node .neo-node{stroke:#ccc;}#export-svg [data-look="neo"].node rect,#export-svg [data-look="neo"].cluster rect,#export-svg [data-look="neo"].node polygon{stroke:url(#export-svg-gradient);filter:drop-shadow( 1px 2px 2px rgba(185,185,185,1));}#export-svg [data-look="neo"].node path{stroke:url(#export-svg-gradient);stroke-width:1;}#export-svg [data-look="neo"].node .outer-path{filter:drop-shadow( 1px 2px 2px rgba(185,185,185,1));}#export-svg [data-look="neo"].node .neo-line path{stroke:#ccc;filter:none;}#export-svg [data-look="neo"].node circle{stroke:url(#export-svg-gradient);filter:drop-shadow( 1px 2px 2px rgba(185,185,185,1));}#export-svg [data-look="neo"].node circle .state-start{fill:#000000;}#export-svg [data-look="neo"].statediagram-cluster rect{fill:#1f2020;stroke:url(#export-svg-gradient);stroke-width:1;}#export-svg [data-look="neo"].icon-shape .icon{fill:url(#export-svg-gradient);filter:drop-shadow( 1px 2px 2px rgba(185,185,185,1));}#export-svg [data-look="neo"].icon-shape .icon-neo path{stroke:url(#export-svg-gradient);filter:drop-shadow( 1px 2px 2px rgba(185,185,185,1));}#export-svg :root{--mermaid-font-family:"trebuchet ms",verdana,arial,sans-serif;}</style><g><marker id="export-svg_flowchart-v2-pointEnd" class="marker flowchart-v2" viewBox="0 0 11.5 14" refX="7.75" refY="7" markerUnits="userSpaceOnUse" markerWidth="10.5" markerHeight="14" orient="auto"><path d="M 0 0 L 11.5 7 L 0 14 z" class="arrowMarkerPath" style="stroke-width: 0; stroke-dasharray: 1, 0;"/></marker><marker id="export-svg_flowchart-v2-pointStart" class="marker flowchart-v2" viewBox="0 0 11.5 14" refX="4" refY="7" markerUnits="userSpaceOnUse" markerWidth="11.5" markerHeight="14" orient="auto"><polygon points="0,7 11.5,14 11.5,0" class="arrowMarkerPath" style="stroke-width: 0; stroke-dasharray: 1, 0;"/></marker><marker id="export-svg_flowchart-v2-pointEnd-margin" class="marker flowchart-v2" viewBox="0 0 11.5 14" refX="11.5" refY="7" markerUnits="userSpaceOnUse" markerWidth="10.5" markerHeight="14" orient="auto"><path d="M 0 0 L 11.5 7 L 0 14 z" class="arrowMarkerPath" style="stroke-width: 0; stroke-dasharray: 1, 0;"/></marker><marker id="export-svg_flowchart-v2-pointStart-margin" class="marker flowchart-v2" viewBox="0 0 11.5 14" refX="1" refY="7" markerUnits="userSpaceOnUse" markerWidth="11.5" markerHeight="14" orient="auto"><polygon points="0,7 11.5,14 11.5,0" class="arrowMarkerPath" style="stroke-width: 0; stroke-dasharray: 1, 0;"/></marker><marker id="export-svg_flowchart-v2-circleEnd" class="marker flowchart-v2" viewBox="0 0 10 10" refY="5" refX="10.75" markerUnits="userSpaceOnUse" markerWidth="14" markerHeight="14" orient="auto"><circle cx="5" cy="5" r="5" class="arrowMarkerPath" style="stroke-width: 0; stroke-dasharray: 1, 0;"/></marker><marker id="export-svg_flowchart-v2-circleStart" class="marker flowchart-v2" viewBox="0 0 10 10" refX="0" refY="5" markerUnits="userSpaceOnUse" markerWidth="14" markerHeight="14" orient="auto"><circle cx="5" cy="5" r="5" class="arrowMarkerPath" style="stroke-width: 0; stroke-dasharray: 1, 0;"/></marker><marker id="export-svg_flowchart-v2-circleEnd-margin" class="marker flowchart-v2" viewBox="0 0 10 10" refY="5" refX="12.25" markerUnits="userSpaceOnUse" markerWidth="14" markerHeight="14" orient="auto"><circle cx="5" cy="5" r="5" class="arrowMarkerPath" style="stroke-width: 0; stroke-dasharray: 1, 0;"/></marker><marker id="export-svg_flowchart-v2-circleStart-margin" class="marker flowchart-v2" viewBox="0 0 10 10" refX="-2" refY="5" markerUnits="userSpaceOnUse" markerWidth="14" markerHeight="14" orient="auto"><circle cx="5" cy="5" r="5" class="arrowMarkerPath" style="stroke-width: 0; stroke-dasharray: 1, 0;"/></marker><marker id="export-svg_flowchart-v2-crossEnd" class="marker cross flowchart-v2" viewBox="0 0 15 15" refX="17.7" refY="7.5" markerUnits="userSpaceOnUse" markerWidth="12" markerHeight="12" orient="auto"><path d="M 1,1 L 14,14 M 1,14 L 14,1" class="arrowMarkerPath" style="stroke-width: 2.5;"/></marker><marker id="export-svg_flowchart-v2-crossStart" class="marker cross flowchart-v2" viewBox="0 0 15 15" refX="-3.5" refY="7.5" markerUnits="userSpaceOnUse" markerWidth="12" markerHeight="12" orient="auto"><path d="M 1,1 L 14,14 M 1,14 L 14,1" class="arrowMarkerPath" style="stroke-width: 2.5; stroke-dasharray: 1, 0;"/></marker><marker id="export-svg_flowchart-v2-crossEnd-margin" class="marker cross flowchart-v2" viewBox="0 0 15 15" refX="17.7" refY="7.5" markerUnits="userSpaceOnUse" markerWidth="12" markerHeight="12" orient="auto"><path d="M 1,1 L 14,14 M 1,14 L 14,1" class="arrowMarkerPath" style="stroke-width: 2.5;"/></marker><marker id="export-svg_flowchart-v2-crossStart-margin" class="marker cross flowchart-v2" viewBox="0 0 15 15" refX="-3.5" refY="7.5" markerUnits="userSpaceOnUse" markerWidth="12" markerHeight="12" orient="auto"><path d="M 1,1 L 14,14 M 1,14 L 14,1" class="arrowMarkerPath" style="stroke-width: 2.5; stroke-dasharray: 1, 0;"/></marker><g class="root"><g class="clusters"><g class="cluster" id="Response" data-id="Response" data-et="cluster" data-look="neo"><rect style="" x="1592.4921875" y="8" width="467.1015625" height="363.90234375"/><g class="cluster-label" transform="translate(1794.51953125, 8)"><foreignObject width="63.046875" height="21"><div style="display: table-cell; white-space: normal; line-height: 1.5; max-width: 200px; text-align: center;" xmlns="http://www.w3.org/1999/xhtml"><span class="nodeLabel"><p>Response</p></span></div></foreignObject></g></g><g class="cluster" id="DDSQL" data-id="DDSQL" data-et="cluster" data-look="neo"><rect style="" x="982.984375" y="252.451171875" width="559.5078125" height="210"/><g class="cluster-label" transform="translate(1202.30078125, 252.451171875)"><foreignObject width="120.875" height="21"><div style="display: table-cell; white-space: normal; line-height: 1.5; max-width: 200px; text-align: center;" xmlns="http://www.w3.org/1999/xhtml"><span class="nodeLabel"><p>DDSQL Generation</p></span></div></foreignObject></g></g><g class="cluster" id="LogSearch" data-id="LogSearch" data-et="cluster" data-look="neo"><rect style="" x="982.984375" y="22.451171875" width="559.5078125" height="210"/><g class="cluster-label" transform="translate(1190.35546875, 22.451171875)"><foreignObject width="144.765625" height="21"><div style="display: table-cell; white-space: normal; line-height: 1.5; max-width: 200px; text-align: center;" xmlns="http://www.w3.org/1999/xhtml"><span class="nodeLabel"><p>Log Search Generation</p></span></div></foreignObject></g></g><g class="cluster" id="RAG" data-id="RAG" data-et="cluster" data-look="neo"><rect style="" x="251.3125" y="25.951171875" width="681.671875" height="328"/><g class="cluster-label" transform="translate(525.609375, 25.951171875)"><foreignObject width="133.078125" height="21"><div style="display: table-cell; white-space: normal; line-height: 1.5; max-width: 200px; text-align: center;" xmlns="http://www.w3.org/1999/xhtml"><span class="nodeLabel"><p>Shared RAG Pipeline</p></span></div></foreignObject></g></g><g class="cluster" id="Input" data-id="Input" data-et="cluster" data-look="neo"><rect style="" x="8" y="126.951171875" width="193.3125" height="136"/><g class="cluster-label" transform="translate(89.0859375, 126.951171875)"><foreignObject width="31.140625" height="21"><div style="display: table-cell; white-space: normal; line-height: 1.5; max-width: 200px; text-align: center;" xmlns="http://www.w3.org/1999/xhtml"><span class="nodeLabel"><p>Input</p></span></div></foreignObject></g></g></g><g class="edgePaths"><path d="M176.3125,194.951171875L201.3125,194.951171875L226.3125,194.951171875L251.3125,194.951171875L272.3125,194.951171875" id="L_A_B_0" class="edge-thickness-normal edge-pattern-solid edge-thickness-normal edge-pattern-solid flowchart-link" style="stroke-dasharray: 0 0 87 9; stroke-dashoffset: 0;;" data-edge="true" data-et="edge" data-id="L_A_B_0" data-points="W3sieCI6MTc2LjMxMjUsInkiOjE5NC45NTExNzE4NzV9LHsieCI6MjAxLjMxMjUsInkiOjE5NC45NTExNzE4NzV9LHsieCI6MjI2LjMxMjUsInkiOjE5NC45NTExNzE4NzV9LHsieCI6MjUxLjMxMjUsInkiOjE5NC45NTExNzE4NzV9LHsieCI6Mjc2LjMxMjUsInkiOjE5NC45NTExNzE4NzV9XQ==" marker-end="url(#export-svg_flowchart-v2-pointEnd-margin)"/><path d="M402.46875,194.951171875L427.46875,194.951171875L448.46875,194.951171875" id="L_B_C_0" class="edge-thickness-normal edge-pattern-solid edge-thickness-normal edge-pattern-solid flowchart-link" style="stroke-dasharray: 0 0 37 9; stroke-dashoffset: 0;;" data-edge="true" data-et="edge" data-id="L_B_C_0" data-points="W3sieCI6NDAyLjQ2ODc1LCJ5IjoxOTQuOTUxMTcxODc1fSx7IngiOjQyNy40Njg3NSwieSI6MTk0Ljk1MTE3MTg3NX0seyJ4Ijo0NTIuNDY4NzUsInkiOjE5NC45NTExNzE4NzV9XQ==" marker-end="url(#export-svg_flowchart-v2-pointEnd-margin)"/><path d="M585.2578125,194.951171875L610.2578125,194.951171875L631.2578125,194.951171875" id="L_C_D_0" class="edge-thickness-normal edge-pattern-solid edge-thickness-normal edge-pattern-solid flowchart-link" style="stroke-dasharray: 0 0 37 9; stroke-dashoffset: 0;;" data-edge="true" data-et="edge" data-id="L_C_D_0" data-points="W3sieCI6NTg1LjI1NzgxMjUsInkiOjE5NC45NTExNzE4NzV9LHsieCI6NjEwLjI1NzgxMjUsInkiOjE5NC45NTExNzE4NzV9LHsieCI6NjM1LjI1NzgxMjUsInkiOjE5NC45NTExNzE4NzV9XQ==" marker-end="url(#export-svg_flowchart-v2-pointEnd-margin)"/><path d="M741.9453125,194.951171875L766.9453125,194.951171875L787.9453125,194.951171875" id="L_D_E_0" class="edge-thickness-normal edge-pattern-solid edge-thickness-normal edge-pattern-solid flowchart-link" style="stroke-dasharray: 0 0 37 9; stroke-dashoffset: 0;;" data-edge="true" data-et="edge" data-id="L_D_E_0" data-points="W3sieCI6NzQxLjk0NTMxMjUsInkiOjE5NC45NTExNzE4NzV9LHsieCI6NzY2Ljk0NTMxMjUsInkiOjE5NC45NTExNzE4NzV9LHsieCI6NzkxLjk0NTMxMjUsInkiOjE5NC45NTExNzE4NzV9XQ==" marker-end="url(#export-svg_flowchart-v2-pointEnd-margin)"/><path d="M866.2077955163044,172.451171875L926.5571070770102,88.85432755433098Q932.984375,79.951171875 943.9650832651483,79.951171875L957.984375,79.951171875L982.984375,79.951171875L1031.99609375,79.951171875" id="L_E_F1_0" class="edge-thickness-normal edge-pattern-solid edge-thickness-normal edge-pattern-solid flowchart-link" style="stroke-dasharray: 0 0 202.50955200195312 9; stroke-dashoffset: 0;;" data-edge="true" data-et="edge" data-id="L_E_F1_0" data-points="W3sieCI6ODY2LjIwNzc5NTUxNjMwNDQsInkiOjE3Mi40NTExNzE4NzV9LHsieCI6OTMyLjk4NDM3NSwieSI6NzkuOTUxMTcxODc1fSx7IngiOjk1Ny45ODQzNzUsInkiOjc5Ljk1MTE3MTg3NX0seyJ4Ijo5ODIuOTg0Mzc1LCJ5Ijo3OS45NTExNzE4NzV9LHsieCI6MTAzNS45OTYwOTM3NSwieSI6NzkuOTUxMTcxODc1fV0=" marker-end="url(#export-svg_flowchart-v2-pointEnd-margin)"/><path d="M866.2077955163044,217.451171875L926.5571070770102,301.04801619566905Q932.984375,309.951171875 943.9650832651483,309.951171875L957.984375,309.951171875L982.984375,309.951171875L1003.984375,309.951171875" id="L_E_F2_0" class="edge-thickness-normal edge-pattern-solid edge-thickness-normal edge-pattern-solid flowchart-link" style="stroke-dasharray: 0 0 174.49781799316406 9; stroke-dashoffset: 0;;" data-edge="true" data-et="edge" data-id="L_E_F2_0" data-points="W3sieCI6ODY2LjIwNzc5NTUxNjMwNDQsInkiOjIxNy40NTExNzE4NzV9LHsieCI6OTMyLjk4NDM3NSwieSI6MzA5Ljk1MTE3MTg3NX0seyJ4Ijo5NTcuOTg0Mzc1LCJ5IjozMDkuOTUxMTcxODc1fSx7IngiOjk4Mi45ODQzNzUsInkiOjMwOS45NTExNzE4NzV9LHsieCI6MTAwNy45ODQzNzUsInkiOjMwOS45NTExNzE4NzV9XQ==" marker-end="url(#export-svg_flowchart-v2-pointEnd-margin)"/><path d="M1293.85546875,79.951171875L1346.8671875,79.951171875L1389.65234375,79.951171875" id="L_F1_G1_0" class="edge-thickness-normal edge-pattern-solid edge-thickness-normal edge-pattern-solid flowchart-link" style="stroke-dasharray: 0 0 86.796875 9; stroke-dashoffset: 0;;" data-edge="true" data-et="edge" data-id="L_F1_G1_0" data-points="W3sieCI6MTI5My44NTU0Njg3NSwieSI6NzkuOTUxMTcxODc1fSx7IngiOjEzNDYuODY3MTg3NSwieSI6NzkuOTUxMTcxODc1fSx7IngiOjEzOTMuNjUyMzQzNzUsInkiOjc5Ljk1MTE3MTg3NX1d" marker-end="url(#export-svg_flowchart-v2-pointEnd-margin)"/><path d="M1321.8671875,309.951171875L1346.8671875,309.951171875L1389.65234375,309.951171875" id="L_F2_G2_0" class="edge-thickness-normal edge-pattern-solid edge-thickness-normal edge-pattern-solid flowchart-link" style="stroke-dasharray: 0 0 58.78515625 9; stroke-dashoffset: 0;;" data-edge="true" data-et="edge" data-id="L_F2_G2_0" data-points="W3sieCI6MTMyMS44NjcxODc1LCJ5IjozMDkuOTUxMTcxODc1fSx7IngiOjEzNDYuODY3MTg3NSwieSI6MzA5Ljk1MTE3MTg3NX0seyJ4IjoxMzkzLjY1MjM0Mzc1LCJ5IjozMDkuOTUxMTcxODc1fV0=" marker-end="url(#export-svg_flowchart-v2-pointEnd-margin)"/><path d="M1495.70703125,79.951171875L1542.4921875,79.951171875L1567.4921875,79.951171875L1580.828320443363,79.951171875Q1592.4921875,79.951171875 1599.869311595901,88.9857628889076L1652.8927767994883,153.92235823786572" id="L_G1_I_0" class="edge-thickness-normal edge-pattern-solid edge-thickness-normal edge-pattern-solid flowchart-link" style="stroke-dasharray: 0 0 181.7978057861328 9; stroke-dashoffset: 0;;" data-edge="true" data-et="edge" data-id="L_G1_I_0" data-points="W3sieCI6MTQ5NS43MDcwMzEyNSwieSI6NzkuOTUxMTcxODc1fSx7IngiOjE1NDIuNDkyMTg3NSwieSI6NzkuOTUxMTcxODc1fSx7IngiOjE1NjcuNDkyMTg3NSwieSI6NzkuOTUxMTcxODc1fSx7IngiOjE1OTIuNDkyMTg3NSwieSI6NzkuOTUxMTcxODc1fSx7IngiOjE2NTUuNDIyNjgzNTgyNTc0NiwieSI6MTU3LjAyMDY3NTc5MjQyNTUyfV0=" marker-end="url(#export-svg_flowchart-v2-pointEnd-margin)"/><path d="M1495.70703125,309.951171875L1542.4921875,309.951171875L1567.4921875,309.951171875L1580.828320443363,309.951171875Q1592.4921875,309.951171875 1599.869311595901,300.9165808610924L1652.8927767994883,235.97998551213428" id="L_G2_I_0" class="edge-thickness-normal edge-pattern-solid edge-thickness-normal edge-pattern-solid flowchart-link" style="stroke-dasharray: 0 0 181.7978057861328 9; stroke-dashoffset: 0;;" data-edge="true" data-et="edge" data-id="L_G2_I_0" data-points="W3sieCI6MTQ5NS43MDcwMzEyNSwieSI6MzA5Ljk1MTE3MTg3NX0seyJ4IjoxNTQyLjQ5MjE4NzUsInkiOjMwOS45NTExNzE4NzV9LHsieCI6MTU2Ny40OTIxODc1LCJ5IjozMDkuOTUxMTcxODc1fSx7IngiOjE1OTIuNDkyMTg3NSwieSI6MzA5Ljk1MTE3MTg3NX0seyJ4IjoxNjU1LjQyMjY4MzU4MjU3NDYsInkiOjIzMi44ODE2Njc5NTc1NzQ0OH1d" marker-end="url(#export-svg_flowchart-v2-pointEnd-margin)"/><path d="M1724.1675045158208,163.82180139082095L1803.8996356764212,98.11315216893556Q1815.3203125,88.701171875 1830.1195432962968,88.701171875L1871.34375,88.701171875" id="L_I_J_0" class="edge-thickness-normal edge-pattern-solid edge-thickness-normal edge-pattern-solid flowchart-link" style="stroke-dasharray: 0 0 163.98870849609375 9; stroke-dashoffset: 0;;" data-edge="true" data-et="edge" data-id="L_I_J_0" data-points="W3sieCI6MTcyNC4xNjc1MDQ1MTU4MjA4LCJ5IjoxNjMuODIxODAxMzkwODIwOTV9LHsieCI6MTgxNS4zMjAzMTI1LCJ5Ijo4OC43MDExNzE4NzV9LHsieCI6MTg3NS4zNDM3NSwieSI6ODguNzAxMTcxODc1fV0=" marker-end="url(#export-svg_flowchart-v2-pointEnd-margin)"/><path d="M1725.844992789921,224.40305408507894L1802.6081360023566,281.7108513507784Q1815.3203125,291.201171875 1831.1842847314338,291.201171875L1871.93359375,291.201171875" id="L_I_K_0" class="edge-thickness-normal edge-pattern-solid edge-thickness-normal edge-pattern-solid flowchart-link" style="stroke-dasharray: 0 0 158.20037841796875 9; stroke-dashoffset: 0;;" data-edge="true" data-et="edge" data-id="L_I_K_0" data-points="W3sieCI6MTcyNS44NDQ5OTI3ODk5MjEsInkiOjIyNC40MDMwNTQwODUwNzg5NH0seyJ4IjoxODE1LjMyMDMxMjUsInkiOjI5MS4yMDExNzE4NzV9LHsieCI6MTg3NS45MzM1OTM3NSwieSI6MjkxLjIwMTE3MTg3NX1d" marker-end="url(#export-svg_flowchart-v2-pointEnd-margin)"/></g><g class="edgeLabels"><g class="edgeLabel"><g class="label" data-id="L_A_B_0" transform="translate(0, 0)"><foreignObject width="0" height="0"><div style="display: table-cell; white-space: normal; line-height: 1.5; max-width: 200px; text-align: center;" xmlns="http://www.w3.org/1999/xhtml" class="labelBkg"><span class="edgeLabel"></span></div></foreignObject></g></g><g class="edgeLabel"><g class="label" data-id="L_B_C_0" transform="translate(0, 0)"><foreignObject width="0" height="0"><div style="display: table-cell; white-space: normal; line-height: 1.5; max-width: 200px; text-align: center;" xmlns="http://www.w3.org/1999/xhtml" class="labelBkg"><span class="edgeLabel"></span></div></foreignObject></g></g><g class="edgeLabel"><g class="label" data-id="L_C_D_0" transform="translate(0, 0)"><foreignObject width="0" height="0"><div style="display: table-cell; white-space: normal; line-height: 1.5; max-width: 200px; text-align: center;" xmlns="http://www.w3.org/1999/xhtml" class="labelBkg"><span class="edgeLabel"></span></div></foreignObject></g></g><g class="edgeLabel"><g class="label" data-id="L_D_E_0" transform="translate(0, 0)"><foreignObject width="0" height="0"><div style="display: table-cell; white-space: normal; line-height: 1.5; max-width: 200px; text-align: center;" xmlns="http://www.w3.org/1999/xhtml" class="labelBkg"><span class="edgeLabel"></span></div></foreignObject></g></g><g class="edgeLabel"><g class="label" data-id="L_E_F1_0" transform="translate(0, 0)"><foreignObject width="0" height="0"><div style="display: table-cell; white-space: normal; line-height: 1.5; max-width: 200px; text-align: center;" xmlns="http://www.w3.org/1999/xhtml" class="labelBkg"><span class="edgeLabel"></span></div></foreignObject></g></g><g class="edgeLabel"><g class="label" data-id="L_E_F2_0" transform="translate(0, 0)"><foreignObject width="0" height="0"><div style="display: table-cell; white-space: normal; line-height: 1.5; max-width: 200px; text-align: center;" xmlns="http://www.w3.org/1999/xhtml" class="labelBkg"><span class="edgeLabel"></span></div></foreignObject></g></g><g class="edgeLabel"><g class="label" data-id="L_F1_G1_0" transform="translate(0, 0)"><foreignObject width="0" height="0"><div style="display: table-cell; white-space: normal; line-height: 1.5; max-width: 200px; text-align: center;" xmlns="http://www.w3.org/1999/xhtml" class="labelBkg"><span class="edgeLabel"></span></div></foreignObject></g></g><g class="edgeLabel"><g class="label" data-id="L_F2_G2_0" transform="translate(0, 0)"><foreignObject width="0" height="0"><div style="display: table-cell; white-space: normal; line-height: 1.5; max-width: 200px; text-align: center;" xmlns="http://www.w3.org/1999/xhtml" class="labelBkg"><span class="edgeLabel"></span></div></foreignObject></g></g><g class="edgeLabel"><g class="label" data-id="L_G1_I_0" transform="translate(0, 0)"><foreignObject width="0" height="0"><div style="display: table-cell; white-space: normal; line-height: 1.5; max-width: 200px; text-align: center;" xmlns="http://www.w3.org/1999/xhtml" class="labelBkg"><span class="edgeLabel"></span></div></foreignObject></g></g><g class="edgeLabel"><g class="label" data-id="L_G2_I_0" transform="translate(0, 0)"><foreignObject width="0" height="0"><div style="display: table-cell; white-space: normal; line-height: 1.5; max-width: 200px; text-align: center;" xmlns="http://www.w3.org/1999/xhtml" class="labelBkg"><span class="edgeLabel"></span></div></foreignObject></g></g><g class="edgeLabel" transform="translate(1815.3203125, 88.701171875)"><g class="label" data-id="L_I_J_0" transform="translate(-26.45703125, -10.5)"><foreignObject width="52.9140625" height="21"><div style="display: table-cell; white-space: normal; line-height: 1.5; max-width: 200px; text-align: center;" xmlns="http://www.w3.org/1999/xhtml" class="labelBkg"><span class="edgeLabel"><p>Success</p></span></div></foreignObject></g></g><g class="edgeLabel" transform="translate(1815.3203125, 291.201171875)"><g class="label" data-id="L_I_K_0" transform="translate(-35.0234375, -10.5)"><foreignObject width="70.046875" height="21"><div style="display: table-cell; white-space: normal; line-height: 1.5; max-width: 200px; text-align: center;" xmlns="http://www.w3.org/1999/xhtml" class="labelBkg"><span class="edgeLabel"><p>Ambiguous</p></span></div></foreignObject></g></g></g><g class="nodes"><g class="node default" id="flowchart-A-0" data-id="A" data-node="true" data-et="node" data-look="neo" transform="translate(104.65625, 194.951171875)"><rect class="basic label-container" style="" data-id="A" x="-71.65625" y="-33" width="143.3125" height="66" stroke="url(#gradient)"/><g class="label" style="" transform="translate(-55.65625, -21)"><rect/><foreignObject width="111.3125" height="42"><div style="display: table-cell; white-space: normal; line-height: 1.5; max-width: 200px; text-align: center;" xmlns="http://www.w3.org/1999/xhtml"><span class="nodeLabel"><p>Natural Language<br />Query</p></span></div></foreignObject></g></g><g class="node default" id="flowchart-B-1" data-id="B" data-node="true" data-et="node" data-look="neo" transform="translate(339.390625, 194.951171875)"><rect class="basic label-container" style="" data-id="B" x="-63.078125" y="-22.5" width="126.15625" height="45" stroke="url(#gradient)"/><g class="label" style="" transform="translate(-47.078125, -10.5)"><rect/><foreignObject width="94.15625" height="21"><div style="display: table-cell; white-space: normal; line-height: 1.5; max-width: 200px; text-align: center;" xmlns="http://www.w3.org/1999/xhtml"><span class="nodeLabel"><p>List Collections</p></span></div></foreignObject></g></g><g class="node default" id="flowchart-C-2" data-id="C" data-node="true" data-et="node" data-look="neo" transform="translate(518.86328125, 194.951171875)"><rect class="basic label-container" style="" data-id="C" x="-66.39453125" y="-33" width="132.7890625" height="66" stroke="url(#gradient)"/><g class="label" style="" transform="translate(-50.39453125, -21)"><rect/><foreignObject width="100.7890625" height="42"><div style="display: table-cell; white-space: normal; line-height: 1.5; max-width: 200px; text-align: center;" xmlns="http://www.w3.org/1999/xhtml"><span class="nodeLabel"><p>Hybrid Search<br />Dense + Sparse</p></span></div></foreignObject></g></g><g class="node default" id="flowchart-D-3" data-id="D" data-node="true" data-et="node" data-look="neo" transform="translate(688.6015625, 194.951171875)"><rect class="basic label-container" style="" data-id="D" x="-53.34375" y="-22.5" width="106.6875" height="45" stroke="url(#gradient)"/><g class="label" style="" transform="translate(-37.34375, -10.5)"><rect/><foreignObject width="74.6875" height="21"><div style="display: table-cell; white-space: normal; line-height: 1.5; max-width: 200px; text-align: center;" xmlns="http://www.w3.org/1999/xhtml"><span class="nodeLabel"><p>RRF Fusion</p></span></div></foreignObject></g></g><g class="node default" id="flowchart-E-4" data-id="E" data-node="true" data-et="node" data-look="neo" transform="translate(849.96484375, 194.951171875)"><rect class="basic label-container" style="" data-id="E" x="-58.01953125" y="-22.5" width="116.0390625" height="45" stroke="url(#gradient)"/><g class="label" style="" transform="translate(-42.01953125, -10.5)"><rect/><foreignObject width="84.0390625" height="21"><div style="display: table-cell; white-space: normal; line-height: 1.5; max-width: 200px; text-align: center;" xmlns="http://www.w3.org/1999/xhtml"><span class="nodeLabel"><p>Context Docs</p></span></div></foreignObject></g></g><g class="node default" id="flowchart-F1-5" data-id="F1" data-node="true" data-et="node" data-look="neo" transform="translate(1164.92578125, 79.951171875)"><rect class="basic label-container" style="" data-id="F1" x="-128.9296875" y="-22.5" width="257.859375" height="45" stroke="url(#gradient)"/><g class="label" style="" transform="translate(-112.9296875, -10.5)"><rect/><foreignObject width="225.859375" height="21"><div style="display: table; white-space: break-spaces; line-height: 1.5; max-width: 200px; text-align: center; width: 200px;" xmlns="http://www.w3.org/1999/xhtml"><span class="nodeLabel"><p>TRANSLATOR_SYSTEM_PROMPT</p></span></div></foreignObject></g></g><g class="node default" id="flowchart-G1-6" data-id="G1" data-node="true" data-et="node" data-look="neo" transform="translate(1444.6796875, 79.951171875)"><rect class="basic label-container" style="" data-id="G1" x="-51.02734375" y="-22.5" width="102.0546875" height="45" stroke="url(#gradient)"/><g class="label" style="" transform="translate(-35.02734375, -10.5)"><rect/><foreignObject width="70.0546875" height="21"><div style="display: table-cell; white-space: normal; line-height: 1.5; max-width: 200px; text-align: center;" xmlns="http://www.w3.org/1999/xhtml"><span class="nodeLabel"><p>Claude API</p></span></div></foreignObject></g></g><g class="node default" id="flowchart-H1-7" data-id="H1" data-node="true" data-et="node" data-look="neo" transform="translate(1444.6796875, 174.951171875)"><rect class="basic label-container" style="" data-id="H1" x="-72.8125" y="-22.5" width="145.625" height="45" stroke="url(#gradient)"/><g class="label" style="" transform="translate(-56.8125, -10.5)"><rect/><foreignObject width="113.625" height="21"><div style="display: table-cell; white-space: normal; line-height: 1.5; max-width: 200px; text-align: center;" xmlns="http://www.w3.org/1999/xhtml"><span class="nodeLabel"><p>Log Search Query</p></span></div></foreignObject></g></g><g class="node default" id="flowchart-F2-8" data-id="F2" data-node="true" data-et="node" data-look="neo" transform="translate(1164.92578125, 309.951171875)"><rect class="basic label-container" style="" data-id="F2" x="-156.94140625" y="-22.5" width="313.8828125" height="45" stroke="url(#gradient)"/><g class="label" style="" transform="translate(-140.94140625, -10.5)"><rect/><foreignObject width="281.8828125" height="21"><div style="display: table; white-space: break-spaces; line-height: 1.5; max-width: 200px; text-align: center; width: 200px;" xmlns="http://www.w3.org/1999/xhtml"><span class="nodeLabel"><p>DDSQL_TRANSLATOR_SYSTEM_PROMPT</p></span></div></foreignObject></g></g><g class="node default" id="flowchart-G2-9" data-id="G2" data-node="true" data-et="node" data-look="neo" transform="translate(1444.6796875, 309.951171875)"><rect class="basic label-container" style="" data-id="G2" x="-51.02734375" y="-22.5" width="102.0546875" height="45" stroke="url(#gradient)"/><g class="label" style="" transform="translate(-35.02734375, -10.5)"><rect/><foreignObject width="70.0546875" height="21"><div style="display: table-cell; white-space: normal; line-height: 1.5; max-width: 200px; text-align: center;" xmlns="http://www.w3.org/1999/xhtml"><span class="nodeLabel"><p>Claude API</p></span></div></foreignObject></g></g><g class="node default" id="flowchart-H2-10" data-id="H2" data-node="true" data-et="node" data-look="neo" transform="translate(1444.6796875, 404.951171875)"><rect class="basic label-container" style="" data-id="H2" x="-60.8671875" y="-22.5" width="121.734375" height="45" stroke="url(#gradient)"/><g class="label" style="" transform="translate(-44.8671875, -10.5)"><rect/><foreignObject width="89.734375" height="21"><div style="display: table-cell; white-space: normal; line-height: 1.5; max-width: 200px; text-align: center;" xmlns="http://www.w3.org/1999/xhtml"><span class="nodeLabel"><p>DDSQL Query</p></span></div></foreignObject></g></g><g class="node default" id="flowchart-I-11" data-id="I" data-node="true" data-et="node" data-look="neo" transform="translate(1686.39453125, 194.951171875)"><polygon points="68.90234375,0 137.8046875,-68.90234375 68.90234375,-137.8046875 0,-68.90234375" class="label-container" transform="translate(-68.40234375, 68.90234375)"/><g class="label" style="" transform="translate(-38.90234375, -10.5)"><rect/><foreignObject width="77.8046875" height="21"><div style="display: table-cell; white-space: normal; line-height: 1.5; max-width: 200px; text-align: center;" xmlns="http://www.w3.org/1999/xhtml"><span class="nodeLabel"><p>Parse JSON</p></span></div></foreignObject></g></g><g class="node default" id="flowchart-J-12" data-id="J" data-node="true" data-et="node" data-look="neo" transform="translate(1954.96875, 88.701171875)"><rect class="basic label-container" style="" data-id="J" x="-79.625" y="-22.5" width="159.25" height="45" stroke="url(#gradient)"/><g class="label" style="" transform="translate(-63.625, -10.5)"><rect/><foreignObject width="127.25" height="21"><div style="display: table-cell; white-space: normal; line-height: 1.5; max-width: 200px; text-align: center;" xmlns="http://www.w3.org/1999/xhtml"><span class="nodeLabel"><p>Query + Explanation</p></span></div></foreignObject></g></g><g class="node default" id="flowchart-K-13" data-id="K" data-node="true" data-et="node" data-look="neo" transform="translate(1954.96875, 291.201171875)"><rect class="basic label-container" style="" data-id="K" x="-79.03515625" y="-22.5" width="158.0703125" height="45" stroke="url(#gradient)"/><g class="label" style="" transform="translate(-63.03515625, -10.5)"><rect/><foreignObject width="126.0703125" height="21"><div style="display: table-cell; white-space: normal; line-height: 1.5; max-width: 200px; text-align: center;" xmlns="http://www.w3.org/1999/xhtml"><span class="nodeLabel"><p>Clarification Needed</p></span></div></foreignObject></g></g></g></g></g><defs><filter id="drop-shadow" height="130%" width="130%"><feDropShadow dx="4" dy="4" stdDeviation="0" flood-opacity="0.06" flood-color="#FFFFFF"/></filter></defs><defs><filter id="drop-shadow-small" height="150%" width="150%"><feDropShadow dx="2" dy="2" stdDeviation="0" flood-opacity="0.06" flood-color="#FFFFFF"/></filter></defs><linearGradient id="export-svg-gradient" gradientUnits="objectBoundingBox" x1="0%" y1="0%" x2="100%" y2="0%"><stop offset="0%" stop-color="#cccccc" stop-opacity="1"/><stop offset="100%" stop-color="hsl(180, 0%, 18.3529411765%)" stop-opacity="1"/></linearGradient></svg>
@@ -131,3 +135,56 @@ HERO_SVG = '''
 </svg>
 </div>
 '''
+
+
+# Static copies of the diagrams, served by Streamlit's static file server
+# (server.enableStaticServing) so the browser caches them across reruns and page
+# navigations instead of receiving the markup over the websocket every time.
+# Streamlit sends .html and .svg files as text/plain, so each diagram is wrapped
+# in an XHTML document and saved as .xml, which is served as application/xml.
+STATIC_DIR = Path(__file__).parent / "static"
+
+XHTML_TEMPLATE = '''<?xml version="1.0" encoding="UTF-8"?>
+<html xmlns="http://www.w3.org/1999/xhtml">
+<body>
+{body}
+</body>
+</html>
+'''
+
+STATIC_PAGES = {
+    "hero.xml": HERO_SVG,
+    "generate_workflow.xml": GENERATE_WORKFLOW_SVG,
+    "embeddings_workflow.xml": EMBEDDINGS_WORKFLOW_SVG,
+    "log_search_workflow.xml": LOG_SEARCH_WORKFLOW_SVG,
+    "explain_workflow.xml": EXPLAIN_WORKFLOW_SVG,
+}
+
+
+def static_url(filename: str) -> str:
+    """Get the URL Streamlit serves a file in STATIC_DIR from."""
+    return f"app/static/{filename}"
+
+
+def write_static_pages() -> None:
+    """Write the diagrams to STATIC_DIR, skipping files that are already up to date."""
+    STATIC_DIR.mkdir(exist_ok=True)
+    for filename, svg in STATIC_PAGES.items():
+        content = XHTML_TEMPLATE.format(body=svg.strip())
+        path = STATIC_DIR / filename
+        if not path.exists() or path.read_text(encoding="utf-8") != content:
+            path.write_text(content, encoding="utf-8")
+
+
+write_static_pages()
+
+HERO_URL = static_url("hero.xml")
+GENERATE_WORKFLOW_URL = static_url("generate_workflow.xml")
+EMBEDDINGS_WORKFLOW_URL = static_url("embeddings_workflow.xml")
+LOG_SEARCH_WORKFLOW_URL = static_url("log_search_workflow.xml")
+EXPLAIN_WORKFLOW_URL = static_url("explain_workflow.xml")
+
+
+def render_workflow(url: str, height: int) -> None:
+    """Render a workflow diagram served from STATIC_DIR."""
+    components.iframe(url, height=height, scrolling=False)
@@ -18,21 +18,31 @@ Usage:
     python generate_logs.py --count 1000
     python generate_logs.py --count 500 --scenario incident
     python generate_logs.py --duration 60  # Generate for 60 seconds
+    python generate_logs.py --count 100000 --workers 4  # Spread generators over 4 processes
 """
 
-import argparse
-import hashlib
+from __future__ import annotations
+
+import gzip
 import json
 import os
 import random
-import string
-import sys
 import time
 import uuid
+from bisect import bisect
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
-from typing import Any, Callable, Optional
-import requests
+from itertools import accumulate, islice
+from typing import TYPE_CHECKING, NamedTuple, Optional
+
+# requests, concurrent.futures and argparse are only needed to send logs / run the
+# CLI, so they are imported where they're used and the data tables stay cheap to import
+if TYPE_CHECKING:
+    import requests
+
+try:
+    import orjson  # Optional: much faster serialization of large batches
+except ImportError:
+    orjson = None
 
 # =============================================================================
 # CONFIGURATION
@@ -41,47 +51,77 @@ import requests
 DD_API_KEY = os.getenv("DD_API_KEY")
 DD_SITE = os.getenv("DD_SITE")
 
+# Datadog accepts up to 1000 logs (5 MB uncompressed) per intake request
+MAX_BATCH_SIZE = 1000
+SEND_WORKERS = 4
+
 # =============================================================================
 # DATA CONSTANTS
 # =============================================================================
 
+# Catalog records - tuples with named fields, cheaper to store and read than dicts
+class ServiceInfo(NamedTuple):
+    port: int
+    language: str
+    framework: str
+
+
+class UserRecord(NamedTuple):
+    id: str
+    email: str
+    name: str
+    role: str
+
+
+class Endpoint(NamedTuple):
+    path: str
+    method: str
+    auth_required: bool
+
+
+class SecurityEvent(NamedTuple):
+    event: str
+    severity: str
+    message: str
+
+
 # Services - Microservices Architecture
 SERVICES = {
     "frontend": {
-        "api-gateway": {"port": 8080, "language": "go", "framework": "gin"},
-        "web-frontend": {"port": 3000, "language": "typescript", "framework": "nextjs"},
-        "mobile-bff": {"port": 8081, "language": "kotlin", "framework": "ktor"},
-        "graphql-gateway": {"port": 4000, "language": "typescript", "framework": "apollo"},
+        "api-gateway": ServiceInfo(port=8080, language="go", framework="gin"),
+        "web-frontend": ServiceInfo(port=3000, language="typescript", framework="nextjs"),
+        "mobile-bff": ServiceInfo(port=8081, language="kotlin", framework="ktor"),
+        "graphql-gateway": ServiceInfo(port=4000, language="typescript", framework="apollo"),
     },
     "core": {
-        "user-service": {"port": 8001, "language": "python", "framework": "fastapi"},
-        "auth-service": {"port": 8002, "language": "go", "framework": "gin"},
-        "session-service": {"port": 8003, "language": "rust", "framework": "actix"},
-        "notification-service": {"port": 8004, "language": "python", "framework": "celery"},
-        "email-service": {"port": 8005, "language": "python", "framework": "fastapi"},
+        "user-service": ServiceInfo(port=8001, language="python", framework="fastapi"),
+        "auth-service": ServiceInfo(port=8002, language="go", framework="gin"),
+        "session-service": ServiceInfo(port=8003, language="rust", framework="actix"),
+        "notification-service": ServiceInfo(port=8004, language="python", framework="celery"),
+        "email-service": ServiceInfo(port=8005, language="python", framework="fastapi"),
     },
     "commerce": {
-        "payment-service": {"port": 8010, "language": "java", "framework": "spring"},
-        "checkout-service": {"port": 8011, "language": "java", "framework": "spring"},
-        "order-service": {"port": 8012, "language": "java", "framework": "spring"},
-        "inventory-service": {"port": 8013, "language": "go", "framework": "gin"},
-        "pricing-service": {"port": 8014, "language": "python", "framework": "fastapi"},
-        "cart-service": {"port": 8015, "language": "node", "framework": "express"},
-        "shipping-service": {"port": 8016, "language": "go", "framework": "gin"},
-        "tax-service": {"port": 8017, "language": "java", "framework": "spring"},
+        "payment-service": ServiceInfo(port=8010, language="java", framework="spring"),
+        "checkout-service": ServiceInfo(port=8011, language="java", framework="spring"),
+        "order-service": ServiceInfo(port=8012, language="java", framework="spring"),
+        "inventory-service": ServiceInfo(port=8013, language="go", framework="gin"),
+        "pricing-service": ServiceInfo(port=8014, language="python", framework="fastapi"),
+        "cart-service": ServiceInfo(port=8015, language="node", framework="express"),
+        "shipping-service": ServiceInfo(port=8016, language="go", framework="gin"),
+        "tax-service": ServiceInfo(port=8017, language="java", framework="spring"),
     },
     "data": {
-        "search-service": {"port": 8020, "language": "java", "framework": "spring"},
-        "recommendation-service": {"port": 8021, "language": "python", "framework": "fastapi"},
-        "analytics-service": {"port": 8022, "language": "python", "framework": "flask"},
-        "ml-inference": {"port": 8023, "language": "python", "framework": "fastapi"},
-        "etl-service": {"port": 8024, "language": "python", "framework": "airflow"},
-        "reporting-service": {"port": 8025, "language": "python", "framework": "fastapi"},
+        "search-service": ServiceInfo(port=8020, language="java", framework="spring"),
+        "recommendation-service": ServiceInfo(port=8021, language="python", framework="fastapi"),
+        "analytics-service": ServiceInfo(port=8022, language="python", framework="flask"),
+        "ml-inference": ServiceInfo(port=8023, language="python", framework="fastapi"),
+        "etl-service": ServiceInfo(port=8024, language="python", framework="airflow"),
+        "reporting-service": ServiceInfo(port=8025, language="python", framework="fastapi"),
     },
     "infrastructure": {
-        "config-service": {"port": 8030, "language": "java", "framework": "spring"},
-        "discovery-service": {"port": 8031, "language": "java", "framework": "spring"},
-        "vault-proxy": {"port": 8032, "language": "go", "framework": "stdlib"},
+        "config-service": ServiceInfo(port=8030, language="java", framework="spring"),
+        "discovery-service": ServiceInfo(port=8031, language="java", framework="spring"),
+        "vault-proxy": ServiceInfo(port=8032, language="go", framework="stdlib"),
     },
 }
 
@@ -90,162 +130,171 @@ FLAT_SERVICES = {
     for category in SERVICES.values() 
     for name, info in category.items()
 }
+FLAT_SERVICE_NAMES = tuple(FLAT_SERVICES)
 
-ENVIRONMENTS = ["production", "staging", "development", "sandbox"]
-REGIONS = ["us-east-1", "us-west-2", "eu-west-1", "eu-central-1", "ap-southeast-1", "ap-northeast-1"]
-AVAILABILITY_ZONES = ["a", "b", "c"]
+ENVIRONMENTS = ("production", "staging", "development", "sandbox")
+REGIONS = ("us-east-1", "us-west-2", "eu-west-1", "eu-central-1", "ap-southeast-1", "ap-northeast-1")
+AVAILABILITY_ZONES = ("a", "b", "c")
 
 # Hosts and Infrastructure
 HOSTS = {
-    "web": [f"web-{region}-{i:02d}" for region in ["use1", "usw2", "euw1"] for i in range(1, 6)],
-    "api": [f"api-{region}-{i:02d}" for region in ["use1", "usw2", "euw1"] for i in range(1, 8)],
-    "worker": [f"worker-{region}-{i:02d}" for region in ["use1", "usw2"] for i in range(1, 5)],
-    "db": [f"db-{region}-{i:02d}" for region in ["use1", "usw2"] for i in range(1, 4)],
-    "cache": [f"cache-{region}-{i:02d}" for region in ["use1", "usw2"] for i in range(1, 3)],
-    "queue": [f"queue-{region}-{i:02d}" for region in ["use1"] for i in range(1, 3)],
+    "web": tuple(f"web-{region}-{i:02d}" for region in ("use1", "usw2", "euw1") for i in range(1, 6)),
+    "api": tuple(f"api-{region}-{i:02d}" for region in ("use1", "usw2", "euw1") for i in range(1, 8)),
+    "worker": tuple(f"worker-{region}-{i:02d}" for region in ("use1", "usw2") for i in range(1, 5)),
+    "db": tuple(f"db-{region}-{i:02d}" for region in ("use1", "usw2") for i in range(1, 4)),
+    "cache": tuple(f"cache-{region}-{i:02d}" for region in ("use1", "usw2") for i in range(1, 3)),
+    "queue": tuple(f"queue-{region}-{i:02d}" for region in ("use1",) for i in range(1, 3)),
 }
 
-ALL_HOSTS = [host for hosts in HOSTS.values() for host in hosts]
+ALL_HOSTS = tuple(host for hosts in HOSTS.values() for host in hosts)
 
 # Kubernetes
-K8S_CLUSTERS = ["prod-us-east", "prod-us-west", "prod-eu", "staging-us"]
-K8S_NAMESPACES = ["default", "production", "staging", "monitoring", "logging", "istio-system", "cert-manager"]
-K8S_NODE_POOLS = ["general", "compute-optimized", "memory-optimized", "gpu"]
+K8S_CLUSTERS = ("prod-us-east", "prod-us-west", "prod-eu", "staging-us")
+K8S_NAMESPACES = ("default", "production", "staging", "monitoring", "logging", "istio-system", "cert-manager")
+K8S_NODE_POOLS = ("general", "compute-optimized", "memory-optimized", "gpu")
 
 # Databases
 DATABASES = {
     "postgresql": {
-        "hosts": ["pg-primary-01", "pg-replica-01", "pg-replica-02"],
-        "databases": ["users_db", "orders_db", "products_db", "analytics_db"],
+        "hosts": ("pg-primary-01", "pg-replica-01", "pg-replica-02"),
+        "databases": ("users_db", "orders_db", "products_db", "analytics_db"),
         "port": 5432,
     },
     "mysql": {
-        "hosts": ["mysql-primary-01", "mysql-replica-01"],
-        "databases": ["legacy_app", "reporting"],
+        "hosts": ("mysql-primary-01", "mysql-replica-01"),
+        "databases": ("legacy_app", "reporting"),
         "port": 3306,
     },
     "mongodb": {
-        "hosts": ["mongo-01", "mongo-02", "mongo-03"],
-        "databases": ["sessions", "user_preferences", "notifications"],
+        "hosts": ("mongo-01", "mongo-02", "mongo-03"),
+        "databases": ("sessions", "user_preferences", "notifications"),
         "port": 27017,
     },
     "elasticsearch": {
-        "hosts": ["es-master-01", "es-data-01", "es-data-02", "es-data-03"],
-        "indices": ["logs-*", "metrics-*", "traces-*", "products", "search_content"],
+        "hosts": ("es-master-01", "es-data-01", "es-data-02", "es-data-03"),
+        "indices": ("logs-*", "metrics-*", "traces-*", "products", "search_content"),
         "port": 9200,
     },
     "redis": {
-        "hosts": ["redis-master-01", "redis-replica-01"],
-        "databases": ["cache", "sessions", "rate_limits"],
+        "hosts": ("redis-master-01", "redis-replica-01"),
+        "databases": ("cache", "sessions", "rate_limits"),
         "port": 6379,
     },
     "cassandra": {
-        "hosts": ["cassandra-01", "cassandra-02", "cassandra-03"],
-        "keyspaces": ["events", "timeseries", "audit"],
+        "hosts": ("cassandra-01", "cassandra-02", "cassandra-03"),
+        "keyspaces": ("events", "timeseries", "audit"),
         "port": 9042,
     },
 }
+DATABASE_TYPES = tuple(DATABASES)
+
+# Databases (or Cassandra keyspaces) each engine's operations can target
+DATABASE_NAMES = {
+    db_type: config.get("databases") or config.get("keyspaces") or ("data",)
+    for db_type, config in DATABASES.items()
+}
 
 # Message Queues
 MESSAGE_QUEUES = {
     "kafka": {
-        "brokers": ["kafka-01", "kafka-02", "kafka-03"],
-        "topics": [
+        "brokers": ("kafka-01", "kafka-02", "kafka-03"),
+        "topics": (
             "orders.created", "orders.updated", "orders.completed",
             "payments.processed", "payments.failed",
             "users.registered", "users.updated",
             "inventory.updated", "inventory.low_stock",
             "notifications.email", "notifications.push", "notifications.sms",
             "analytics.events", "analytics.pageviews",
-        ],
+        ),
     },
     "rabbitmq": {
-        "hosts": ["rabbitmq-01", "rabbitmq-02"],
-        "queues": [
+        "hosts": ("rabbitmq-01", "rabbitmq-02"),
+        "queues": (
             "email_queue", "sms_queue", "push_notification_queue",
             "order_processing", "payment_retry", "report_generation",
-        ],
+        ),
     },
     "sqs": {
-        "queues": [
+        "queues": (
             "prod-order-processing", "prod-email-delivery", "prod-webhook-delivery",
             "prod-dead-letter", "prod-batch-jobs",
-        ],
+        ),
     },
 }
 
 # Cloud Resources - AWS
 AWS_RESOURCES = {
-    "s3_buckets": [
+    "s3_buckets": (
         "prod-user-uploads", "prod-static-assets", "prod-logs-archive",
         "prod-backups", "prod-ml-models", "prod-data-lake",
         "staging-user-uploads", "dev-sandbox",
-    ],
-    "lambda_functions": [
+    ),
+    "lambda_functions": (
         "image-resizer", "thumbnail-generator", "email-sender",
         "order-processor", "inventory-checker", "report-generator",
         "data-transformer", "webhook-handler", "cleanup-job",
-    ],
-    "rds_instances": [
+    ),
+    "rds_instances": (
         "prod-users-primary", "prod-users-replica", "prod-orders-primary",
         "staging-main", "analytics-warehouse",
-    ],
-    "ec2_instance_types": [
+    ),
+    "ec2_instance_types": (
         "t3.micro", "t3.small", "t3.medium", "t3.large",
         "m5.large", "m5.xlarge", "m5.2xlarge",
         "c5.large", "c5.xlarge", "r5.large", "r5.xlarge",
-    ],
-    "elb": ["prod-api-alb", "prod-web-alb", "staging-alb", "internal-nlb"],
-    "cloudfront_distributions": ["E1234567890ABC", "E0987654321DEF"],
+    ),
+    "elb": ("prod-api-alb", "prod-web-alb", "staging-alb", "internal-nlb"),
+    "cloudfront_distributions": ("E1234567890ABC", "E0987654321DEF"),
 }
 
 # Cloud Resources - GCP
 GCP_RESOURCES = {
-    "gcs_buckets": ["prod-data-backup", "ml-training-data", "analytics-exports"],
-    "cloud_functions": ["data-processor", "pubsub-handler", "scheduler-trigger"],
-    "cloud_run_services": ["api-service", "worker-service"],
-    "bigquery_datasets": ["analytics", "data_warehouse", "ml_features"],
+    "gcs_buckets": ("prod-data-backup", "ml-training-data", "analytics-exports"),
+    "cloud_functions": ("data-processor", "pubsub-handler", "scheduler-trigger"),
+    "cloud_run_services": ("api-service", "worker-service"),
+    "bigquery_datasets": ("analytics", "data_warehouse", "ml_features"),
 }
 
 # Cloud Resources - Azure
 AZURE_RESOURCES = {
-    "storage_accounts": ["proddata001", "backups002", "logs003"],
-    "app_services": ["api-app-service", "web-app-service"],
-    "cosmos_db": ["user-data", "session-store"],
+    "storage_accounts": ("proddata001", "backups002", "logs003"),
+    "app_services": ("api-app-service", "web-app-service"),
+    "cosmos_db": ("user-data", "session-store"),
 }
 
 # Network Data
 NETWORK = {
-    "internal_ranges": ["10.0.0.0/8", "172.16.0.0/12", "192.168.0.0/16"],
-    "load_balancers": ["lb-prod-01", "lb-prod-02", "lb-staging-01"],
-    "vpn_gateways": ["vpn-office-nyc", "vpn-office-sfo", "vpn-office-lon"],
-    "cdn_pops": ["JFK", "LAX", "LHR", "FRA", "NRT", "SIN", "SYD"],
+    "internal_ranges": ("10.0.0.0/8", "172.16.0.0/12", "192.168.0.0/16"),
+    "load_balancers": ("lb-prod-01", "lb-prod-02", "lb-staging-01"),
+    "vpn_gateways": ("vpn-office-nyc", "vpn-office-sfo", "vpn-office-lon"),
+    "cdn_pops": ("JFK", "LAX", "LHR", "FRA", "NRT", "SIN", "SYD"),
 }
 
 # Realistic IP Ranges by Type
 IP_POOLS = {
-    "internal": [
-        (f"10.{a}.{b}.{c}", "Internal")
-        for a in range(0, 10) for b in range(0, 5) for c in range(1, 255, 50)
-    ][:50],
-    "office": [
+    "internal": tuple(islice(
+        ((f"10.{a}.{b}.{c}", "Internal")
+         for a in range(0, 10) for b in range(0, 5) for c in range(1, 255, 50)),
+        50,
+    )),
+    "office": (
         ("203.0.113.10", "NYC Office"),
         ("203.0.113.20", "SFO Office"),
         ("203.0.113.30", "London Office"),
         ("203.0.113.40", "Berlin Office"),
-    ],
-    "cloud": [
+    ),
+    "cloud": (
         ("52.94.76.0", "AWS us-east-1"),
         ("35.180.0.0", "AWS eu-west-3"),
         ("34.102.136.0", "GCP us-central1"),
         ("20.42.0.0", "Azure eastus"),
-    ],
-    "residential": [
+    ),
+    "residential": tuple(
         (f"{random.randint(1,223)}.{random.randint(0,255)}.{random.randint(0,255)}.{random.randint(1,254)}", country)
-        for country in ["United States", "Canada", "United Kingdom", "Germany", "France", 
-                       "Japan", "Australia", "Brazil", "India", "Singapore"] * 5
-    ][:50],
-    "suspicious": [
+        for country in ("United States", "Canada", "United Kingdom", "Germany", "France", 
+                       "Japan", "Australia", "Brazil", "India", "Singapore") * 5
+    ),
+    "suspicious": (
         ("185.220.101.1", "Russia"),
         ("5.188.62.1", "Russia"),
         ("116.31.116.1", "China"),
@@ -254,176 +303,195 @@ IP_POOLS = {
         ("5.34.180.1", "Iran"),
         ("93.184.216.1", "Unknown VPN"),
         ("198.51.100.1", "Tor Exit Node"),
-    ],
+    ),
 }
 
+# Every 10.0.{1-10}.{1-254} address, so generators pick a private host IP with one
+# random.choice instead of formatting two random octets per log
+PRIVATE_HOST_IPS = tuple(f"10.0.{b}.{d}" for b in range(1, 11) for d in range(1, 255))
+
 # Users
 USERS = {
-    "admins": [
-        {"id": "u_admin_001", "email": "admin@company.com", "name": "System Admin", "role": "admin"},
-        {"id": "u_admin_002", "email": "security@company.com", "name": "Security Admin", "role": "security_admin"},
-        {"id": "u_admin_003", "email": "devops@company.com", "name": "DevOps Admin", "role": "admin"},
-    ],
-    "developers": [
-        {"id": "u_dev_001", "email": "alice.chen@company.com", "name": "Alice Chen", "role": "developer"},
-        {"id": "u_dev_002", "email": "bob.smith@company.com", "name": "Bob Smith", "role": "developer"},
-        {"id": "u_dev_003", "email": "carol.jones@company.com", "name": "Carol Jones", "role": "senior_developer"},
-        {"id": "u_dev_004", "email": "david.kim@company.com", "name": "David Kim", "role": "developer"},
-        {"id": "u_dev_005", "email": "emma.wilson@company.com", "name": "Emma Wilson", "role": "tech_lead"},
-    ],
-    "service_accounts": [
-        {"id": "sa_deploy", "email": "deploy-bot@company.com", "name": "Deploy Bot", "role": "service"},
-        {"id": "sa_monitoring", "email": "monitoring@company.com", "name": "Monitoring Service", "role": "service"},
-        {"id": "sa_backup", "email": "backup-service@company.com", "name": "Backup Service", "role": "service"},
-        {"id": "sa_ci", "email": "ci-runner@company.com", "name": "CI Runner", "role": "service"},
-    ],
-    "customers": [
-        {"id": f"c_{i:06d}", "email": f"customer{i}@example.com", "name": f"Customer {i}", "role": "customer"}
+    "admins": (
+        UserRecord(id="u_admin_001", email="admin@company.com", name="System Admin", role="admin"),
+        UserRecord(id="u_admin_002", email="security@company.com", name="Security Admin", role="security_admin"),
+        UserRecord(id="u_admin_003", email="devops@company.com", name="DevOps Admin", role="admin"),
+    ),
+    "developers": (
+        UserRecord(id="u_dev_001", email="alice.chen@company.com", name="Alice Chen", role="developer"),
+        UserRecord(id="u_dev_002", email="bob.smith@company.com", name="Bob Smith", role="developer"),
+        UserRecord(id="u_dev_003", email="carol.jones@company.com", name="Carol Jones", role="senior_developer"),
+        UserRecord(id="u_dev_004", email="david.kim@company.com", name="David Kim", role="developer"),
+        UserRecord(id="u_dev_005", email="emma.wilson@company.com", name="Emma Wilson", role="tech_lead"),
+    ),
+    "service_accounts": (
+        UserRecord(id="sa_deploy", email="deploy-bot@company.com", name="Deploy Bot", role="service"),
+        UserRecord(id="sa_monitoring", email="monitoring@company.com", name="Monitoring Service", role="service"),
+        UserRecord(id="sa_backup", email="backup-service@company.com", name="Backup Service", role="service"),
+        UserRecord(id="sa_ci", email="ci-runner@company.com", name="CI Runner", role="service"),
+    ),
+    "customers": tuple(
+        UserRecord(id=f"c_{i:06d}", email=f"customer{i}@example.com", name=f"Customer {i}", role="customer")
         for i in range(1, 101)
-    ],
-    "suspicious": [
-        {"id": "u_unknown", "email": "unknown@suspicious.ru", "name": "Unknown", "role": "unknown"},
-        {"id": "u_attacker", "email": "h4ck3r@evil.com", "name": "Attacker", "role": "unknown"},
-    ],
+    ),
+    "suspicious": (
+        UserRecord(id="u_unknown", email="unknown@suspicious.ru", name="Unknown", role="unknown"),
+        UserRecord(id="u_attacker", email="h4ck3r@evil.com", name="Attacker", role="unknown"),
+    ),
 }
 
-ALL_USERS = [
-    user for category in USERS.values() for user in category
-]
-
 # HTTP Endpoints
 API_ENDPOINTS = {
-    "auth": [
-        {"path": "/api/v1/auth/login", "method": "POST", "auth_required": False},
-        {"path": "/api/v1/auth/logout", "method": "POST", "auth_required": True},
-        {"path": "/api/v1/auth/refresh", "method": "POST", "auth_required": True},
-        {"path": "/api/v1/auth/register", "method": "POST", "auth_required": False},
-        {"path": "/api/v1/auth/forgot-password", "method": "POST", "auth_required": False},
-        {"path": "/api/v1/auth/reset-password", "method": "POST", "auth_required": False},
-        {"path": "/api/v1/auth/verify-email", "method": "GET", "auth_required": False},
-        {"path": "/api/v1/auth/mfa/setup", "method": "POST", "auth_required": True},
-        {"path": "/api/v1/auth/mfa/verify", "method": "POST", "auth_required": True},
-        {"path": "/api/v1/auth/oauth/google", "method": "GET", "auth_required": False},
-        {"path": "/api/v1/auth/oauth/github", "method": "GET", "auth_required": False},
-    ],
-    "users": [
-        {"path": "/api/v1/users", "method": "GET", "auth_required": True},
-        {"path": "/api/v1/users/{id}", "method": "GET", "auth_required": True},
-        {"path": "/api/v1/users/{id}", "method": "PUT", "auth_required": True},
-        {"path": "/api/v1/users/{id}", "method": "DELETE", "auth_required": True},
-        {"path": "/api/v1/users/{id}/preferences", "method": "GET", "auth_required": True},
-        {"path": "/api/v1/users/{id}/preferences", "method": "PUT", "auth_required": True},
-        {"path": "/api/v1/users/{id}/avatar", "method": "POST", "auth_required": True},
-        {"path": "/api/v1/users/me", "method": "GET", "auth_required": True},
-        {"path": "/api/v1/users/search", "method": "GET", "auth_required": True},
-    ],
-    "products": [
-        {"path": "/api/v1/products", "method": "GET", "auth_required": False},
-        {"path": "/api/v1/products/{id}", "method": "GET", "auth_required": False},
-        {"path": "/api/v1/products", "method": "POST", "auth_required": True},
-        {"path": "/api/v1/products/{id}", "method": "PUT", "auth_required": True},
-        {"path": "/api/v1/products/{id}", "method": "DELETE", "auth_required": True},
-        {"path": "/api/v1/products/search", "method": "GET", "auth_required": False},
-        {"path": "/api/v1/products/categories", "method": "GET", "auth_required": False},
-        {"path": "/api/v1/products/{id}/reviews", "method": "GET", "auth_required": False},
-        {"path": "/api/v1/products/{id}/reviews", "method": "POST", "auth_required": True},
-        {"path": "/api/v1/products/{id}/inventory", "method": "GET", "auth_required": True},
-    ],
-    "orders": [
-        {"path": "/api/v1/orders", "method": "GET", "auth_required": True},
-        {"path": "/api/v1/orders/{id}", "method": "GET", "auth_required": True},
-        {"path": "/api/v1/orders", "method": "POST", "auth_required": True},
-        {"path": "/api/v1/orders/{id}/cancel", "method": "POST", "auth_required": True},
-        {"path": "/api/v1/orders/{id}/refund", "method": "POST", "auth_required": True},
-        {"path": "/api/v1/orders/{id}/shipping", "method": "GET", "auth_required": True},
-        {"path": "/api/v1/orders/{id}/invoice", "method": "GET", "auth_required": True},
-    ],
-    "payments": [
-        {"path": "/api/v1/payments", "method": "POST", "auth_required": True},
-        {"path": "/api/v1/payments/{id}", "method": "GET", "auth_required": True},
-        {"path": "/api/v1/payments/{id}/refund", "method": "POST", "auth_required": True},
-        {"path": "/api/v1/payments/methods", "method": "GET", "auth_required": True},
-        {"path": "/api/v1/payments/methods", "method": "POST", "auth_required": True},
-        {"path": "/api/v1/payments/webhook", "method": "POST", "auth_required": False},
-    ],
-    "cart": [
-        {"path": "/api/v1/cart", "method": "GET", "auth_required": True},
-        {"path": "/api/v1/cart/items", "method": "POST", "auth_required": True},
-        {"path": "/api/v1/cart/items/{id}", "method": "PUT", "auth_required": True},
-        {"path": "/api/v1/cart/items/{id}", "method": "DELETE", "auth_required": True},
-        {"path": "/api/v1/cart/checkout", "method": "POST", "auth_required": True},
-        {"path": "/api/v1/cart/apply-coupon", "method": "POST", "auth_required": True},
-    ],
-    "search": [
-        {"path": "/api/v1/search", "method": "GET", "auth_required": False},
-        {"path": "/api/v1/search/suggest", "method": "GET", "auth_required": False},
-        {"path": "/api/v1/search/filters", "method": "GET", "auth_required": False},
-    ],
-    "admin": [
-        {"path": "/api/v1/admin/users", "method": "GET", "auth_required": True},
-        {"path": "/api/v1/admin/users/{id}/suspend", "method": "POST", "auth_required": True},
-        {"path": "/api/v1/admin/users/{id}/roles", "method": "PUT", "auth_required": True},
-        {"path": "/api/v1/admin/reports", "method": "GET", "auth_required": True},
-        {"path": "/api/v1/admin/settings", "method": "GET", "auth_required": True},
-        {"path": "/api/v1/admin/settings", "method": "PUT", "auth_required": True},
-        {"path": "/api/v1/admin/audit-log", "method": "GET", "auth_required": True},
-    ],
-    "internal": [
-        {"path": "/health", "method": "GET", "auth_required": False},
-        {"path": "/ready", "method": "GET", "auth_required": False},
-        {"path": "/metrics", "method": "GET", "auth_required": False},
-        {"path": "/internal/cache/flush", "method": "POST", "auth_required": True},
-        {"path": "/internal/config/reload", "method": "POST", "auth_required": True},
-    ],
+    "auth": (
+        Endpoint(path="/api/v1/auth/login", method="POST", auth_required=False),
+        Endpoint(path="/api/v1/auth/logout", method="POST", auth_required=True),
+        Endpoint(path="/api/v1/auth/refresh", method="POST", auth_required=True),
+        Endpoint(path="/api/v1/auth/register", method="POST", auth_required=False),
+        Endpoint(path="/api/v1/auth/forgot-password", method="POST", auth_required=False),
+        Endpoint(path="/api/v1/auth/reset-password", method="POST", auth_required=False),
+        Endpoint(path="/api/v1/auth/verify-email", method="GET", auth_required=False),
+        Endpoint(path="/api/v1/auth/mfa/setup", method="POST", auth_required=True),
+        Endpoint(path="/api/v1/auth/mfa/verify", method="POST", auth_required=True),
+        Endpoint(path="/api/v1/auth/oauth/google", method="GET", auth_required=False),
+        Endpoint(path="/api/v1/auth/oauth/github", method="GET", auth_required=False),
+    ),
+    "users": (
+        Endpoint(path="/api/v1/users", method="GET", auth_required=True),
+        Endpoint(path="/api/v1/users/{id}", method="GET", auth_required=True),
+        Endpoint(path="/api/v1/users/{id}", method="PUT", auth_required=True),
+        Endpoint(path="/api/v1/users/{id}", method="DELETE", auth_required=True),
+        Endpoint(path="/api/v1/users/{id}/preferences", method="GET", auth_required=True),
+        Endpoint(path="/api/v1/users/{id}/preferences", method="PUT", auth_required=True),
+        Endpoint(path="/api/v1/users/{id}/avatar", method="POST", auth_required=True),
+        Endpoint(path="/api/v1/users/me", method="GET", auth_required=True),
+        Endpoint(path="/api/v1/users/search", method="GET", auth_required=True),
+    ),
+    "products": (
+        Endpoint(path="/api/v1/products", method="GET", auth_required=False),
+        Endpoint(path="/api/v1/products/{id}", method="GET", auth_required=False),
+        Endpoint(path="/api/v1/products", method="POST", auth_required=True),
+        Endpoint(path="/api/v1/products/{id}", method="PUT", auth_required=True),
+        Endpoint(path="/api/v1/products/{id}", method="DELETE", auth_required=True),
+        Endpoint(path="/api/v1/products/search", method="GET", auth_required=False),
+        Endpoint(path="/api/v1/products/categories", method="GET", auth_required=False),
+        Endpoint(path="/api/v1/products/{id}/reviews", method="GET", auth_required=False),
+        Endpoint(path="/api/v1/products/{id}/reviews", method="POST", auth_required=True),
+        Endpoint(path="/api/v1/products/{id}/inventory", method="GET", auth_required=True),
+    ),
+    "orders": (
+        Endpoint(path="/api/v1/orders", method="GET", auth_required=True),
+        Endpoint(path="/api/v1/orders/{id}", method="GET", auth_required=True),
+        Endpoint(path="/api/v1/orders", method="POST", auth_required=True),
+        Endpoint(path="/api/v1/orders/{id}/cancel", method="POST", auth_required=True),
+        Endpoint(path="/api/v1/orders/{id}/refund", method="POST", auth_required=True),
+        Endpoint(path="/api/v1/orders/{id}/shipping", method="GET", auth_required=True),
+        Endpoint(path="/api/v1/orders/{id}/invoice", method="GET", auth_required=True),
+    ),
+    "payments": (
+        Endpoint(path="/api/v1/payments", method="POST", auth_required=True),
+        Endpoint(path="/api/v1/payments/{id}", method="GET", auth_required=True),
+        Endpoint(path="/api/v1/payments/{id}/refund", method="POST", auth_required=True),
+        Endpoint(path="/api/v1/payments/methods", method="GET", auth_required=True),
+        Endpoint(path="/api/v1/payments/methods", method="POST", auth_required=True),
+        Endpoint(path="/api/v1/payments/webhook", method="POST", auth_required=False),
+    ),
+    "cart": (
+        Endpoint(path="/api/v1/cart", method="GET", auth_required=True),
+        Endpoint(path="/api/v1/cart/items", method="POST", auth_required=True),
+        Endpoint(path="/api/v1/cart/items/{id}", method="PUT", auth_required=True),
+        Endpoint(path="/api/v1/cart/items/{id}", method="DELETE", auth_required=True),
+        Endpoint(path="/api/v1/cart/checkout", method="POST", auth_required=True),
+        Endpoint(path="/api/v1/cart/apply-coupon", method="POST", auth_required=True),
+    ),
+    "search": (
+        Endpoint(path="/api/v1/search", method="GET", auth_required=False),
+        Endpoint(path="/api/v1/search/suggest", method="GET", auth_required=False),
+        Endpoint(path="/api/v1/search/filters", method="GET", auth_required=False),
+    ),
+    "admin": (
+        Endpoint(path="/api/v1/admin/users", method="GET", auth_required=True),
+        Endpoint(path="/api/v1/admin/users/{id}/suspend", method="POST", auth_required=True),
+        Endpoint(path="/api/v1/admin/users/{id}/roles", method="PUT", auth_required=True),
+        Endpoint(path="/api/v1/admin/reports", method="GET", auth_required=True),
+        Endpoint(path="/api/v1/admin/settings", method="GET", auth_required=True),
+        Endpoint(path="/api/v1/admin/settings", method="PUT", auth_required=True),
+        Endpoint(path="/api/v1/admin/audit-log", method="GET", auth_required=True),
+    ),
+    "internal": (
+        Endpoint(path="/health", method="GET", auth_required=False),
+        Endpoint(path="/ready", method="GET", auth_required=False),
+        Endpoint(path="/metrics", method="GET", auth_required=False),
+        Endpoint(path="/internal/cache/flush", method="POST", auth_required=True),
+        Endpoint(path="/internal/config/reload", method="POST", auth_required=True),
+    ),
 }
 
-ALL_ENDPOINTS = [
+ALL_ENDPOINTS = tuple(
     endpoint for category in API_ENDPOINTS.values() for endpoint in category
-]
+)
+
+# Service behind each endpoint path - first matching rule wins, otherwise the
+# request is served by the API gateway itself
+PATH_SERVICE_RULES = (
+    ("/auth", "auth-service"),
+    ("/users", "user-service"),
+    ("/orders", "order-service"),
+    ("/payments", "payment-service"),
+    ("/products", "search-service"),
+    ("/search", "search-service"),
+    ("/cart", "cart-service"),
+)
+ENDPOINT_SERVICES = {
+    endpoint.path: next(
+        (service for fragment, service in PATH_SERVICE_RULES if fragment in endpoint.path),
+        "api-gateway",
+    )
+    for endpoint in ALL_ENDPOINTS
+}
 
 # User Agents
 USER_AGENTS = {
-    "browsers": [
+    "browsers": (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
         "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0",
         "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.2 Safari/605.1.15",
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36 Edg/120.0.0.0",
-    ],
-    "mobile": [
+    ),
+    "mobile": (
         "Mozilla/5.0 (iPhone; CPU iPhone OS 17_2 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.2 Mobile/15E148 Safari/604.1",
         "Mozilla/5.0 (Linux; Android 14; Pixel 8) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Mobile Safari/537.36",
         "Mozilla/5.0 (iPad; CPU OS 17_2 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.2 Mobile/15E148 Safari/604.1",
-    ],
-    "bots": [
+    ),
+    "bots": (
         "Googlebot/2.1 (+http://www.google.com/bot.html)",
         "Bingbot/2.0 (+http://www.bing.com/bingbot.htm)",
         "Slackbot-LinkExpanding 1.0 (+https://api.slack.com/robots)",
         "Twitterbot/1.0",
         "facebookexternalhit/1.1",
-    ],
-    "api_clients": [
+    ),
+    "api_clients": (
         "python-requests/2.31.0",
         "axios/1.6.2",
         "curl/8.4.0",
         "Go-http-client/2.0",
         "okhttp/4.12.0",
         "PostmanRuntime/7.35.0",
-    ],
-    "suspicious": [
+    ),
+    "suspicious": (
         "sqlmap/1.7",
         "nikto/2.1.6",
         "nmap scripting engine",
         "python-urllib3/2.0",
         "",  # Empty user agent
         "-",
-    ],
+    ),
 }
 
 # Error Templates
 ERROR_TEMPLATES = {
     "python": {
-        "exceptions": [
+        "exceptions": (
             ("ValueError", "invalid literal for int() with base 10: 'abc'"),
             ("KeyError", "'user_id'"),
             ("TypeError", "'NoneType' object is not subscriptable"),
@@ -434,7 +502,7 @@ ERROR_TEMPLATES = {
             ("ValidationError", "field required: email"),
             ("IntegrityError", "duplicate key value violates unique constraint"),
             ("OperationalError", "connection to server lost"),
-        ],
+        ),
         "stack_template": """Traceback (most recent call last):
   File "/app/{service}/main.py", line {line1}, in {func1}
     result = {operation1}
@@ -445,7 +513,7 @@ ERROR_TEMPLATES = {
 {exception}: {message}""",
     },
     "java": {
-        "exceptions": [
+        "exceptions": (
             ("NullPointerException", "Cannot invoke method on null object"),
             ("IllegalArgumentException", "Invalid parameter value"),
             ("SQLException", "Connection pool exhausted"),
@@ -456,7 +524,7 @@ ERROR_TEMPLATES = {
             ("ConcurrentModificationException", "Collection modified during iteration"),
             ("NoSuchElementException", "No value present"),
             ("OptimisticLockException", "Row was updated by another transaction"),
-        ],
+        ),
         "stack_template": """java.lang.{exception}: {message}
 \tat com.company.{service}.{class1}.{method1}({class1}.java:{line1})
 \tat com.company.{service}.{class2}.{method2}({class2}.java:{line2})
@@ -465,13 +533,13 @@ ERROR_TEMPLATES = {
 \tat javax.servlet.http.HttpServlet.service(HttpServlet.java:750)""",
     },
     "go": {
-        "exceptions": [
+        "exceptions": (
             ("panic", "runtime error: index out of range"),
             ("error", "connection refused"),
             ("error", "context deadline exceeded"),
             ("error", "invalid memory address or nil pointer dereference"),
             ("error", "sql: no rows in result set"),
-        ],
+        ),
         "stack_template": """{exception}: {message}
 goroutine 1 [running]:
 main.{func1}(...)
@@ -482,14 +550,14 @@ runtime.main()
 \t/usr/local/go/src/runtime/proc.go:250 +0x1c9""",
     },
     "node": {
-        "exceptions": [
+        "exceptions": (
             ("TypeError", "Cannot read property 'id' of undefined"),
             ("ReferenceError", "user is not defined"),
             ("SyntaxError", "Unexpected token in JSON"),
             ("Error", "ECONNREFUSED"),
             ("Error", "ETIMEDOUT"),
             ("RangeError", "Maximum call stack size exceeded"),
-        ],
+        ),
         "stack_template": """{exception}: {message}
     at {func1} (/app/{service}/src/{file1}.js:{line1}:{col1})
     at {func2} (/app/{service}/src/{file2}.js:{line2}:{col2})
@@ -498,130 +566,220 @@ runtime.main()
     },
 }
 
+# Stack trace placeholder values, drawn on demand when a template references them
+STACK_TRACE_FIELDS = {
+    "line1": lambda: random.randint(10, 500),
+    "line2": lambda: random.randint(10, 300),
+    "line3": lambda: random.randint(10, 200),
+    "col1": lambda: random.randint(1, 50),
+    "col2": lambda: random.randint(1, 50),
+    "col3": lambda: random.randint(1, 50),
+    "func1": lambda: random.choice(("handle_request", "process", "execute", "run")),
+    "func2": lambda: random.choice(("validate", "transform", "parse", "fetch")),
+    "func3": lambda: random.choice(("serialize", "convert", "format", "encode")),
+    "operation1": lambda: random.choice(("self.process(data)", "handler.execute()", "db.query(sql)")),
+    "operation2": lambda: random.choice(("json.loads(response)", "model.validate()", "cache.get(key)")),
+    "operation3": lambda: random.choice(("result.decode()", "data['value']", "obj.attribute")),
+    "handler": lambda: random.choice(("user", "order", "payment", "product")),
+    "class1": lambda: random.choice(("UserService", "OrderHandler", "PaymentProcessor")),
+    "class2": lambda: random.choice(("Repository", "Validator", "Mapper")),
+    "class3": lambda: random.choice(("Utils", "Helper", "Converter")),
+    "method1": lambda: random.choice(("process", "handle", "execute")),
+    "method2": lambda: random.choice(("validate", "transform", "map")),
+    "method3": lambda: random.choice(("convert", "serialize", "format")),
+    "package": lambda: random.choice(("handlers", "services", "utils")),
+    "file": lambda: random.choice(("handler", "service", "processor")),
+    "file1": lambda: random.choice(("handler", "controller", "service")),
+    "file2": lambda: random.choice(("validator", "repository", "mapper")),
+    "file3": lambda: random.choice(("utils", "helpers", "common")),
+    "offset": lambda: f"{random.randint(100, 999):x}",
+}
+
+# Application log message placeholder values, drawn on demand like the above
+APP_MESSAGE_FIELDS = {
+    "key": lambda: f"user:{random.randint(1000, 9999)}",
+    "ms": lambda: random.randint(50, 5000),
+    "user_id": lambda: f"u_{random.randint(1000, 9999)}",
+    "order_id": lambda: generate_order_id(),
+    "payment_id": lambda: f"pay_{random_hex(12)}",
+    "email": lambda: f"user{random.randint(1, 100)}@example.com",
+    "flag": lambda: random.choice(("new_checkout", "dark_mode", "beta_features")),
+    "value": lambda: random.choice(("true", "false")),
+    "n": lambda: random.randint(1, 5),
+    "available": lambda: random.randint(1, 10),
+    "total": lambda: random.randint(50, 100),
+    "percent": lambda: random.randint(80, 99),
+    "endpoint": lambda: random.choice(("/api/v1/legacy", "/api/v1/old-auth")),
+    "error": lambda: random.choice(("timeout", "connection refused", "invalid data")),
+    "reason": lambda: random.choice(("card declined", "insufficient funds", "network error")),
+    "status": lambda: random.choice((400, 401, 403, 500, 502, 503)),
+    "ip": lambda: get_random_ip()[0],
+    "field": lambda: random.choice(("email", "phone", "amount", "address")),
+}
+
 # Security Events
 SECURITY_EVENTS = {
-    "authentication": [
-        {"event": "login_success", "severity": "info", "message": "User logged in successfully"},
-        {"event": "login_failed", "severity": "warn", "message": "Failed login attempt"},
-        {"event": "login_blocked", "severity": "warn", "message": "Login blocked due to rate limiting"},
-        {"event": "account_locked", "severity": "warn", "message": "Account locked after multiple failed attempts"},
-        {"event": "password_changed", "severity": "info", "message": "User password changed"},
-        {"event": "mfa_enabled", "severity": "info", "message": "MFA enabled for user"},
-        {"event": "mfa_disabled", "severity": "warn", "message": "MFA disabled for user"},
-        {"event": "session_expired", "severity": "info", "message": "Session expired"},
-        {"event": "token_revoked", "severity": "info", "message": "Access token revoked"},
-    ],
-    "authorization": [
-        {"event": "access_denied", "severity": "warn", "message": "Access denied to resource"},
-        {"event": "privilege_escalation", "severity": "error", "message": "Privilege escalation attempt detected"},
-        {"event": "role_changed", "severity": "info", "message": "User role changed"},
-        {"event": "permission_granted", "severity": "info", "message": "Permission granted to user"},
-        {"event": "permission_revoked", "severity": "info", "message": "Permission revoked from user"},
-    ],
-    "threat_detection": [
-        {"event": "sql_injection", "severity": "error", "message": "SQL injection attempt detected"},
-        {"event": "xss_attempt", "severity": "error", "message": "XSS attempt detected"},
-        {"event": "path_traversal", "severity": "error", "message": "Path traversal attempt detected"},
-        {"event": "brute_force", "severity": "error", "message": "Brute force attack detected"},
-        {"event": "credential_stuffing", "severity": "error", "message": "Credential stuffing attack detected"},
-        {"event": "suspicious_ip", "severity": "warn", "message": "Request from suspicious IP address"},
-        {"event": "anomalous_behavior", "severity": "warn", "message": "Anomalous user behavior detected"},
-        {"event": "impossible_travel", "severity": "warn", "message": "Impossible travel detected"},
-    ],
-    "data_access": [
-        {"event": "sensitive_data_access", "severity": "info", "message": "Sensitive data accessed"},
-        {"event": "bulk_data_export", "severity": "warn", "message": "Bulk data export performed"},
-        {"event": "pii_access", "severity": "info", "message": "PII data accessed"},
-        {"event": "data_deletion", "severity": "warn", "message": "Data deletion performed"},
-    ],
+    "authentication": (
+        SecurityEvent(event="login_success", severity="info", message="User logged in successfully"),
+        SecurityEvent(event="login_failed", severity="warn", message="Failed login attempt"),
+        SecurityEvent(event="login_blocked", severity="warn", message="Login blocked due to rate limiting"),
+        SecurityEvent(event="account_locked", severity="warn", message="Account locked after multiple failed attempts"),
+        SecurityEvent(event="password_changed", severity="info", message="User password changed"),
+        SecurityEvent(event="mfa_enabled", severity="info", message="MFA enabled for user"),
+        SecurityEvent(event="mfa_disabled", severity="warn", message="MFA disabled for user"),
+        SecurityEvent(event="session_expired", severity="info", message="Session expired"),
+        SecurityEvent(event="token_revoked", severity="info", message="Access token revoked"),
+    ),
+    "authorization": (
+        SecurityEvent(event="access_denied", severity="warn", message="Access denied to resource"),
+        SecurityEvent(event="privilege_escalation", severity="error", message="Privilege escalation attempt detected"),
+        SecurityEvent(event="role_changed", severity="info", message="User role changed"),
+        SecurityEvent(event="permission_granted", severity="info", message="Permission granted to user"),
+        SecurityEvent(event="permission_revoked", severity="info", message="Permission revoked from user"),
+    ),
+    "threat_detection": (
+        SecurityEvent(event="sql_injection", severity="error", message="SQL injection attempt detected"),
+        SecurityEvent(event="xss_attempt", severity="error", message="XSS attempt detected"),
+        SecurityEvent(event="path_traversal", severity="error", message="Path traversal attempt detected"),
+        SecurityEvent(event="brute_force", severity="error", message="Brute force attack detected"),
+        SecurityEvent(event="credential_stuffing", severity="error", message="Credential stuffing attack detected"),
+        SecurityEvent(event="suspicious_ip", severity="warn", message="Request from suspicious IP address"),
+        SecurityEvent(event="anomalous_behavior", severity="warn", message="Anomalous user behavior detected"),
+        SecurityEvent(event="impossible_travel", severity="warn", message="Impossible travel detected"),
+    ),
+    "data_access": (
+        SecurityEvent(event="sensitive_data_access", severity="info", message="Sensitive data accessed"),
+        SecurityEvent(event="bulk_data_export", severity="warn", message="Bulk data export performed"),
+        SecurityEvent(event="pii_access", severity="info", message="PII data accessed"),
+        SecurityEvent(event="data_deletion", severity="warn", message="Data deletion performed"),
+    ),
 }
 
 # =============================================================================
 # HELPER CLASSES AND FUNCTIONS
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class LogContext:
     """Shared context for generating correlated logs."""
-    trace_id: str = field(default_factory=lambda: uuid.uuid4().hex[:32])
-    span_id: str = field(default_factory=lambda: uuid.uuid4().hex[:16])
+    trace_id: str = field(default_factory=lambda: random_hex(32))
+    span_id: str = field(default_factory=lambda: random_hex(16))
     parent_span_id: Optional[str] = None
     user: Optional[dict] = None
     session_id: Optional[str] = None
-    request_id: str = field(default_factory=lambda: f"req_{uuid.uuid4().hex[:12]}")
+    request_id: str = field(default_factory=lambda: f"req_{random_hex(12)}")
     client_ip: Optional[str] = None
-    timestamp: datetime = field(default_factory=datetime.utcnow)
+    timestamp_ns: int = field(default_factory=time.time_ns)
     environment: str = "production"
     region: str = "us-east-1"
 
 
+def random_hex(length: int) -> str:
+    """Random hex string of the given length (much cheaper than slicing uuid4().hex)."""
+    return f"{random.getrandbits(4 * length):0{length}x}"
+
+
 def generate_trace_id() -> str:
-    return uuid.uuid4().hex[:32]
+    return f"{random.getrandbits(128):032x}"
 
 
 def generate_span_id() -> str:
-    return uuid.uuid4().hex[:16]
+    return f"{random.getrandbits(64):016x}"
 
 
 def generate_request_id() -> str:
-    return f"req_{uuid.uuid4().hex[:12]}"
+    return f"req_{random.getrandbits(48):012x}"
 
 
 def generate_transaction_id() -> str:
-    return f"txn_{uuid.uuid4().hex[:16]}"
+    return f"txn_{random.getrandbits(64):016x}"
 
 
 def generate_order_id() -> str:
-    return f"ord_{uuid.uuid4().hex[:12]}"
+    return f"ord_{random.getrandbits(48):012x}"
+
+
+def pick_weighted(options: tuple, cum_weights: tuple):
+    """
+    Pick one option given precomputed cumulative weights.
+    
+    Same draw as random.choices(options, cum_weights=cum_weights)[0], without
+    the per-call argument handling and result list.
+    """
+    return options[bisect(cum_weights, random.random() * cum_weights[-1])]
+
+
+# Pool mixes used by the "mixed" helpers below, with weights accumulated once
+IP_POOL_MIX = ("internal", "residential", "office", "suspicious")
+IP_POOL_MIX_CUM_WEIGHTS = tuple(accumulate((30, 50, 15, 5)))
+
+USER_POOL_MIX = ("admins", "developers", "service_accounts", "customers")
+USER_POOL_MIX_CUM_WEIGHTS = tuple(accumulate((5, 10, 15, 70)))
+
+USER_AGENT_MIX = ("browsers", "mobile", "api_clients", "bots")
+USER_AGENT_MIX_CUM_WEIGHTS = tuple(accumulate((50, 20, 25, 5)))
+
+# Pools that get_random_ip / get_random_user return from directly; any other
+# type falls back to the weighted mix
+IP_TYPE_POOLS = {
+    "internal": IP_POOLS["internal"],
+    "suspicious": IP_POOLS["suspicious"],
+    "residential": IP_POOLS["residential"],
+}
+
+USER_TYPE_POOLS = {
+    "admin": USERS["admins"],
+    "developer": USERS["developers"],
+    "service": USERS["service_accounts"],
+    "customer": USERS["customers"],
+    "suspicious": USERS["suspicious"],
+}
 
 
 def get_random_ip(ip_type: str = "mixed") -> tuple[str, str]:
     """Get a random IP address and its location."""
-    if ip_type == "internal":
-        ip, loc = random.choice(IP_POOLS["internal"])
-    elif ip_type == "suspicious":
-        ip, loc = random.choice(IP_POOLS["suspicious"])
-    elif ip_type == "residential":
-        ip, loc = random.choice(IP_POOLS["residential"])
-    else:
-        pool = random.choices(
-            ["internal", "residential", "office", "suspicious"],
-            weights=[30, 50, 15, 5]
-        )[0]
-        ip, loc = random.choice(IP_POOLS[pool])
-    return ip, loc
+    pool = IP_TYPE_POOLS.get(ip_type)
+    if pool is None:
+        pool = IP_POOLS[pick_weighted(IP_POOL_MIX, IP_POOL_MIX_CUM_WEIGHTS)]
+    return random.choice(pool)
 
 
-def get_random_user(user_type: str = "mixed") -> dict:
+def get_random_user(user_type: str = "mixed") -> UserRecord:
     """Get a random user."""
-    if user_type == "admin":
-        return random.choice(USERS["admins"])
-    elif user_type == "developer":
-        return random.choice(USERS["developers"])
-    elif user_type == "service":
-        return random.choice(USERS["service_accounts"])
-    elif user_type == "customer":
-        return random.choice(USERS["customers"])
-    elif user_type == "suspicious":
-        return random.choice(USERS["suspicious"])
-    else:
-        pool = random.choices(
-            ["admins", "developers", "service_accounts", "customers"],
-            weights=[5, 10, 15, 70]
-        )[0]
-        return random.choice(USERS[pool])
+    pool = USER_TYPE_POOLS.get(user_type)
+    if pool is None:
+        pool = USERS[pick_weighted(USER_POOL_MIX, USER_POOL_MIX_CUM_WEIGHTS)]
+    return random.choice(pool)
 
 
 def get_random_user_agent(agent_type: str = "mixed") -> str:
     """Get a random user agent string."""
-    if agent_type in USER_AGENTS:
-        return random.choice(USER_AGENTS[agent_type])
-    else:
-        pool = random.choices(
-            ["browsers", "mobile", "api_clients", "bots"],
-            weights=[50, 20, 25, 5]
-        )[0]
-        return random.choice(USER_AGENTS[pool])
+    pool = USER_AGENTS.get(agent_type)
+    if pool is None:
+        pool = USER_AGENTS[pick_weighted(USER_AGENT_MIX, USER_AGENT_MIX_CUM_WEIGHTS)]
+    return random.choice(pool)
+
+
+def fill_path_id(path: str, low: int, high: int) -> str:
+    """Fill an endpoint path's {id} placeholder, drawing an id only if there is one."""
+    if "{id}" not in path:
+        return path
+    return path.replace("{id}", str(random.randint(low, high)))
+
+
+class LazyFields(dict):
+    """
+    Placeholder mapping for str.format_map that draws a value the first time a
+    template asks for it, from a table of zero-argument generators.
+    """
+
+    def __init__(self, generators: dict, **values):
+        super().__init__(values)
+        self.generators = generators
+
+    def __missing__(self, key: str):
+        value = self[key] = self.generators[key]()
+        return value
 
 
 def generate_stack_trace(language: str, service: str) -> str:
@@ -629,59 +787,33 @@ def generate_stack_trace(language: str, service: str) -> str:
     templates = ERROR_TEMPLATES.get(language, ERROR_TEMPLATES["python"])
     exception, message = random.choice(templates["exceptions"])
     
-    template = templates["stack_template"]
-    
-    replacements = {
-        "service": service.replace("-", "_"),
-        "exception": exception,
-        "message": message,
-        "line1": random.randint(10, 500),
-        "line2": random.randint(10, 300),
-        "line3": random.randint(10, 200),
-        "col1": random.randint(1, 50),
-        "col2": random.randint(1, 50),
-        "col3": random.randint(1, 50),
-        "func1": random.choice(["handle_request", "process", "execute", "run"]),
-        "func2": random.choice(["validate", "transform", "parse", "fetch"]),
-        "func3": random.choice(["serialize", "convert", "format", "encode"]),
-        "operation1": random.choice(["self.process(data)", "handler.execute()", "db.query(sql)"]),
-        "operation2": random.choice(["json.loads(response)", "model.validate()", "cache.get(key)"]),
-        "operation3": random.choice(["result.decode()", "data['value']", "obj.attribute"]),
-        "handler": random.choice(["user", "order", "payment", "product"]),
-        "class1": random.choice(["UserService", "OrderHandler", "PaymentProcessor"]),
-        "class2": random.choice(["Repository", "Validator", "Mapper"]),
-        "class3": random.choice(["Utils", "Helper", "Converter"]),
-        "method1": random.choice(["process", "handle", "execute"]),
-        "method2": random.choice(["validate", "transform", "map"]),
-        "method3": random.choice(["convert", "serialize", "format"]),
-        "package": random.choice(["handlers", "services", "utils"]),
-        "file": random.choice(["handler", "service", "processor"]),
-        "file1": random.choice(["handler", "controller", "service"]),
-        "file2": random.choice(["validator", "repository", "mapper"]),
-        "file3": random.choice(["utils", "helpers", "common"]),
-        "offset": f"{random.randint(100, 999):x}",
-    }
-    
-    for key, value in replacements.items():
-        template = template.replace("{" + key + "}", str(value))
-    
-    return template
+    # str.format_map parses the template in C and only the placeholders the
+    # template actually uses get drawn (see LazyFields)
+    return templates["stack_template"].format_map(LazyFields(
+        STACK_TRACE_FIELDS,
+        service=service.replace("-", "_"),
+        exception=exception,
+        message=message,
+    ))
+
+
+# Typical (min, max) latency in milliseconds per service
+BASE_LATENCIES_MS = {
+    "api-gateway": (5, 50),
+    "auth-service": (10, 100),
+    "user-service": (20, 150),
+    "payment-service": (100, 500),
+    "order-service": (50, 300),
+    "search-service": (30, 200),
+    "recommendation-service": (100, 400),
+    "ml-inference": (200, 1000),
+}
+DEFAULT_LATENCY_MS = (10, 200)
 
 
 def calculate_latency(service: str, is_error: bool = False, is_slow: bool = False) -> int:
     """Calculate realistic latency in nanoseconds."""
-    base_latencies = {
-        "api-gateway": (5, 50),
-        "auth-service": (10, 100),
-        "user-service": (20, 150),
-        "payment-service": (100, 500),
-        "order-service": (50, 300),
-        "search-service": (30, 200),
-        "recommendation-service": (100, 400),
-        "ml-inference": (200, 1000),
-    }
-    
-    min_ms, max_ms = base_latencies.get(service, (10, 200))
+    min_ms, max_ms = BASE_LATENCIES_MS.get(service, DEFAULT_LATENCY_MS)
     
     if is_error:
         latency_ms = random.randint(max_ms, max_ms * 3)
@@ -701,42 +833,29 @@ def generate_http_access_logs(count: int, ctx: Optional[LogContext] = None) -> l
     """Generate HTTP access logs (nginx/ALB style)."""
     logs = []
     
-    for _ in range(count):
-        endpoint = random.choice(ALL_ENDPOINTS)
+    # Weight status codes realistically
+    statuses = (200, 201, 204, 301, 302, 304, 400, 401, 403, 404, 429, 500, 502, 503, 504)
+    status_cum_weights = tuple(accumulate((60, 5, 3, 2, 2, 5, 5, 3, 2, 8, 2, 1, 1, 0.5, 0.5)))
+    
+    # Tags only vary by service, so they're formatted once per service
+    ddtags_by_service = {
+        service: f"env:production,service:{service},region:us-east-1"
+        for service in set(ENDPOINT_SERVICES.values())
+    }
+    
+    for endpoint in random.choices(ALL_ENDPOINTS, k=count):
         ip, location = get_random_ip()
         user_agent = get_random_user_agent()
         
-        # Weight status codes realistically
-        status = random.choices(
-            [200, 201, 204, 301, 302, 304, 400, 401, 403, 404, 429, 500, 502, 503, 504],
-            weights=[60, 5, 3, 2, 2, 5, 5, 3, 2, 8, 2, 1, 1, 0.5, 0.5]
-        )[0]
+        status = pick_weighted(statuses, status_cum_weights)
         
         is_error = status >= 400
         latency_ns = calculate_latency("api-gateway", is_error)
         
-        # Determine service based on endpoint path
-        if "/auth" in endpoint["path"]:
-            service = "auth-service"
-        elif "/users" in endpoint["path"]:
-            service = "user-service"
-        elif "/orders" in endpoint["path"]:
-            service = "order-service"
-        elif "/payments" in endpoint["path"]:
-            service = "payment-service"
-        elif "/products" in endpoint["path"] or "/search" in endpoint["path"]:
-            service = "search-service"
-        elif "/cart" in endpoint["path"]:
-            service = "cart-service"
-        elif "/admin" in endpoint["path"]:
-            service = "api-gateway"
-        else:
-            service = "api-gateway"
+        service = ENDPOINT_SERVICES[endpoint.path]
         
         # Replace path parameters
-        path = endpoint["path"]
-        if "{id}" in path:
-            path = path.replace("{id}", str(random.randint(1000, 99999)))
+        path = fill_path_id(endpoint.path, 1000, 99999)
         
         request_id = generate_request_id()
         trace_id = generate_trace_id()
@@ -753,13 +872,13 @@ def generate_http_access_logs(count: int, ctx: Optional[LogContext] = None) -> l
         
         logs.append({
             "ddsource": "nginx",
-            "ddtags": f"env:production,service:{service},region:us-east-1",
+            "ddtags": ddtags_by_service[service],
             "hostname": random.choice(HOSTS["web"]),
             "service": service,
             "status": log_status,
-            "message": f'{ip} - "{endpoint["method"]} {path} HTTP/1.1" {status} {response_size}',
+            "message": f'{ip} - "{endpoint.method} {path} HTTP/1.1" {status} {response_size}',
             "http": {
-                "method": endpoint["method"],
+                "method": endpoint.method,
                 "url": path,
                 "url_details": {
                     "path": path,
@@ -790,8 +909,8 @@ def generate_application_logs(count: int) -> list:
     """Generate application-level logs from various services."""
     logs = []
     
-    log_levels = ["DEBUG", "INFO", "WARN", "ERROR"]
-    level_weights = [5, 70, 15, 10]
+    log_levels = ("DEBUG", "INFO", "WARN", "ERROR")
+    level_cum_weights = tuple(accumulate((5, 70, 15, 10)))
     
     info_messages = [
         "Request processed successfully",
@@ -843,9 +962,13 @@ def generate_application_logs(count: int) -> list:
         "Data validation failed: {field}",
     ]
     
+    ddtags_by_service = {
+        name: f"env:production,service:{name},version:1.2.3" for name in FLAT_SERVICE_NAMES
+    }
+    
     for _ in range(count):
-        level = random.choices(log_levels, weights=level_weights)[0]
-        service_name = random.choice(list(FLAT_SERVICES.keys()))
+        level = pick_weighted(log_levels, level_cum_weights)
+        service_name = random.choice(FLAT_SERVICE_NAMES)
         service_info = FLAT_SERVICES[service_name]
         
         if level == "DEBUG":
@@ -858,36 +981,14 @@ def generate_application_logs(count: int) -> list:
             message = random.choice(error_messages)
         
         # Fill in placeholders
-        replacements = {
-            "{key}": f"user:{random.randint(1000, 9999)}",
-            "{ms}": str(random.randint(50, 5000)),
-            "{user_id}": f"u_{random.randint(1000, 9999)}",
-            "{order_id}": generate_order_id(),
-            "{payment_id}": f"pay_{uuid.uuid4().hex[:12]}",
-            "{email}": f"user{random.randint(1, 100)}@example.com",
-            "{flag}": random.choice(["new_checkout", "dark_mode", "beta_features"]),
-            "{value}": random.choice(["true", "false"]),
-            "{n}": str(random.randint(1, 5)),
-            "{available}": str(random.randint(1, 10)),
-            "{total}": str(random.randint(50, 100)),
-            "{percent}": str(random.randint(80, 99)),
-            "{endpoint}": random.choice(["/api/v1/legacy", "/api/v1/old-auth"]),
-            "{error}": random.choice(["timeout", "connection refused", "invalid data"]),
-            "{reason}": random.choice(["card declined", "insufficient funds", "network error"]),
-            "{status}": str(random.choice([400, 401, 403, 500, 502, 503])),
-            "{ip}": get_random_ip()[0],
-            "{field}": random.choice(["email", "phone", "amount", "address"]),
-        }
-        
-        for key, value in replacements.items():
-            message = message.replace(key, value)
+        message = message.format_map(LazyFields(APP_MESSAGE_FIELDS))
         
         trace_id = generate_trace_id()
         span_id = generate_span_id()
         
         log_entry = {
-            "ddsource": service_info["language"],
-            "ddtags": f"env:production,service:{service_name},version:1.2.3",
+            "ddsource": service_info.language,
+            "ddtags": ddtags_by_service[service_name],
             "hostname": random.choice(ALL_HOSTS),
             "service": service_name,
             "status": level.lower(),
@@ -904,7 +1005,7 @@ def generate_application_logs(count: int) -> list:
             log_entry["error"] = {
                 "message": message,
                 "kind": random.choice(["RuntimeError", "ValueError", "ConnectionError"]),
-                "stack": generate_stack_trace(service_info["language"], service_name),
+                "stack": generate_stack_trace(service_info.language, service_name),
             }
         
         logs.append(log_entry)
@@ -916,12 +1017,16 @@ def generate_authentication_logs(count: int) -> list:
     """Generate authentication and authorization logs."""
     logs = []
     
+    # Event categories with a realistic distribution
+    event_categories = tuple(SECURITY_EVENTS)
+    event_category_cum_weights = tuple(accumulate((50, 20, 15, 15)))
+    ddtags_by_category = {
+        category: f"env:production,service:auth-service,event_category:{category}"
+        for category in event_categories
+    }
+    
     for _ in range(count):
-        # Select event type with realistic distribution
-        event_category = random.choices(
-            list(SECURITY_EVENTS.keys()),
-            weights=[50, 20, 15, 15]
-        )[0]
+        event_category = pick_weighted(event_categories, event_category_cum_weights)
         
         event = random.choice(SECURITY_EVENTS[event_category])
         
@@ -936,24 +1041,24 @@ def generate_authentication_logs(count: int) -> list:
             user = get_random_user()
         
         trace_id = generate_trace_id()
-        session_id = f"sess_{uuid.uuid4().hex[:16]}"
+        session_id = f"sess_{random_hex(16)}"
         
         log_entry = {
             "ddsource": "security",
-            "ddtags": f"env:production,service:auth-service,event_category:{event_category}",
+            "ddtags": ddtags_by_category[event_category],
             "hostname": random.choice(HOSTS["api"]),
             "service": "auth-service",
-            "status": event["severity"],
-            "message": f"{event['message']} - {user['email']}",
+            "status": event.severity,
+            "message": f"{event.message} - {user.email}",
             "evt": {
-                "name": event["event"],
+                "name": event.event,
                 "category": event_category,
-                "outcome": "failure" if event["severity"] in ["warn", "error"] else "success",
+                "outcome": "failure" if event.severity in ["warn", "error"] else "success",
             },
             "usr": {
-                "id": user["id"],
-                "email": user["email"],
-                "name": user["name"],
+                "id": user.id,
+                "email": user.email,
+                "name": user.name,
             },
             "network": {
                 "client": {
@@ -972,14 +1077,14 @@ def generate_authentication_logs(count: int) -> list:
         if event_category == "authentication":
             log_entry["auth"] = {
                 "method": random.choice(["password", "oauth", "sso", "api_key", "mfa"]),
-                "provider": random.choice(["internal", "google", "github", "okta"]) if "oauth" in event["event"] or "sso" in event["event"] else "internal",
+                "provider": random.choice(["internal", "google", "github", "okta"]) if "oauth" in event.event or "sso" in event.event else "internal",
             }
         
         # Add threat detection details
         if event_category == "threat_detection":
             log_entry["threat"] = {
                 "tactic": random.choice(["initial_access", "credential_access", "persistence"]),
-                "technique": event["event"],
+                "technique": event.event,
                 "confidence": random.choice(["low", "medium", "high"]),
             }
             if is_suspicious:
@@ -998,82 +1103,118 @@ def generate_cloudtrail_logs(count: int) -> list:
     """Generate AWS CloudTrail-style audit logs."""
     logs = []
     
-    cloudtrail_events = [
+    # (event name, event source, category)
+    cloudtrail_events = (
         # IAM Events
-        {"name": "ConsoleLogin", "service": "signin.amazonaws.com", "category": "authentication"},
-        {"name": "CreateUser", "service": "iam.amazonaws.com", "category": "iam"},
-        {"name": "DeleteUser", "service": "iam.amazonaws.com", "category": "iam"},
-        {"name": "AttachUserPolicy", "service": "iam.amazonaws.com", "category": "iam"},
-        {"name": "CreateAccessKey", "service": "iam.amazonaws.com", "category": "iam"},
-        {"name": "DeleteAccessKey", "service": "iam.amazonaws.com", "category": "iam"},
-        {"name": "AssumeRole", "service": "sts.amazonaws.com", "category": "iam"},
+        ("ConsoleLogin", "signin.amazonaws.com", "authentication"),
+        ("CreateUser", "iam.amazonaws.com", "iam"),
+        ("DeleteUser", "iam.amazonaws.com", "iam"),
+        ("AttachUserPolicy", "iam.amazonaws.com", "iam"),
+        ("CreateAccessKey", "iam.amazonaws.com", "iam"),
+        ("DeleteAccessKey", "iam.amazonaws.com", "iam"),
+        ("AssumeRole", "sts.amazonaws.com", "iam"),
         
         # S3 Events
-        {"name": "CreateBucket", "service": "s3.amazonaws.com", "category": "s3"},
-        {"name": "DeleteBucket", "service": "s3.amazonaws.com", "category": "s3"},
-        {"name": "PutBucketPolicy", "service": "s3.amazonaws.com", "category": "s3"},
-        {"name": "GetObject", "service": "s3.amazonaws.com", "category": "s3"},
-        {"name": "PutObject", "service": "s3.amazonaws.com", "category": "s3"},
-        {"name": "DeleteObject", "service": "s3.amazonaws.com", "category": "s3"},
+        ("CreateBucket", "s3.amazonaws.com", "s3"),
+        ("DeleteBucket", "s3.amazonaws.com", "s3"),
+        ("PutBucketPolicy", "s3.amazonaws.com", "s3"),
+        ("GetObject", "s3.amazonaws.com", "s3"),
+        ("PutObject", "s3.amazonaws.com", "s3"),
+        ("DeleteObject", "s3.amazonaws.com", "s3"),
         
         # EC2 Events
-        {"name": "RunInstances", "service": "ec2.amazonaws.com", "category": "ec2"},
-        {"name": "TerminateInstances", "service": "ec2.amazonaws.com", "category": "ec2"},
-        {"name": "StopInstances", "service": "ec2.amazonaws.com", "category": "ec2"},
-        {"name": "CreateSecurityGroup", "service": "ec2.amazonaws.com", "category": "ec2"},
-        {"name": "AuthorizeSecurityGroupIngress", "service": "ec2.amazonaws.com", "category": "ec2"},
-        {"name": "ModifyInstanceAttribute", "service": "ec2.amazonaws.com", "category": "ec2"},
+        ("RunInstances", "ec2.amazonaws.com", "ec2"),
+        ("TerminateInstances", "ec2.amazonaws.com", "ec2"),
+        ("StopInstances", "ec2.amazonaws.com", "ec2"),
+        ("CreateSecurityGroup", "ec2.amazonaws.com", "ec2"),
+        ("AuthorizeSecurityGroupIngress", "ec2.amazonaws.com", "ec2"),
+        ("ModifyInstanceAttribute", "ec2.amazonaws.com", "ec2"),
         
         # RDS Events
-        {"name": "CreateDBInstance", "service": "rds.amazonaws.com", "category": "rds"},
-        {"name": "DeleteDBInstance", "service": "rds.amazonaws.com", "category": "rds"},
-        {"name": "ModifyDBInstance", "service": "rds.amazonaws.com", "category": "rds"},
-        {"name": "CreateDBSnapshot", "service": "rds.amazonaws.com", "category": "rds"},
+        ("CreateDBInstance", "rds.amazonaws.com", "rds"),
+        ("DeleteDBInstance", "rds.amazonaws.com", "rds"),
+        ("ModifyDBInstance", "rds.amazonaws.com", "rds"),
+        ("CreateDBSnapshot", "rds.amazonaws.com", "rds"),
         
         # Lambda Events
-        {"name": "CreateFunction", "service": "lambda.amazonaws.com", "category": "lambda"},
-        {"name": "UpdateFunctionCode", "service": "lambda.amazonaws.com", "category": "lambda"},
-        {"name": "DeleteFunction", "service": "lambda.amazonaws.com", "category": "lambda"},
-        {"name": "Invoke", "service": "lambda.amazonaws.com", "category": "lambda"},
+        ("CreateFunction", "lambda.amazonaws.com", "lambda"),
+        ("UpdateFunctionCode", "lambda.amazonaws.com", "lambda"),
+        ("DeleteFunction", "lambda.amazonaws.com", "lambda"),
+        ("Invoke", "lambda.amazonaws.com", "lambda"),
         
         # Secrets Manager
-        {"name": "GetSecretValue", "service": "secretsmanager.amazonaws.com", "category": "secrets"},
-        {"name": "CreateSecret", "service": "secretsmanager.amazonaws.com", "category": "secrets"},
-        {"name": "DeleteSecret", "service": "secretsmanager.amazonaws.com", "category": "secrets"},
+        ("GetSecretValue", "secretsmanager.amazonaws.com", "secrets"),
+        ("CreateSecret", "secretsmanager.amazonaws.com", "secrets"),
+        ("DeleteSecret", "secretsmanager.amazonaws.com", "secrets"),
         
         # KMS Events
-        {"name": "Decrypt", "service": "kms.amazonaws.com", "category": "kms"},
-        {"name": "Encrypt", "service": "kms.amazonaws.com", "category": "kms"},
-        {"name": "CreateKey", "service": "kms.amazonaws.com", "category": "kms"},
-    ]
+        ("Decrypt", "kms.amazonaws.com", "kms"),
+        ("Encrypt", "kms.amazonaws.com", "kms"),
+        ("CreateKey", "kms.amazonaws.com", "kms"),
+    )
+    
+    # Error codes a failed event can carry, by category
+    error_codes = {
+        "iam": ("AccessDenied", "MalformedPolicyDocument", "EntityAlreadyExists"),
+        "s3": ("AccessDenied", "NoSuchBucket", "BucketAlreadyExists"),
+        "ec2": ("UnauthorizedOperation", "InvalidParameterValue", "InsufficientInstanceCapacity"),
+        "rds": ("DBInstanceAlreadyExists", "InvalidDBInstanceState", "StorageQuotaExceeded"),
+        "lambda": ("ResourceNotFoundException", "InvalidParameterValueException"),
+        "secrets": ("ResourceNotFoundException", "AccessDeniedException"),
+        "kms": ("AccessDeniedException", "NotFoundException"),
+    }
+    default_error_codes = ("UnauthorizedOperation",)
+    
+    user_identity_types = ("IAMUser", "AssumedRole", "Root", "AWSService")
+    user_agents = (
+        "console.amazonaws.com",
+        "aws-cli/2.13.0 Python/3.11.4",
+        "Boto3/1.28.0 Python/3.10.0",
+        "terraform/1.5.0",
+    )
+    
+    ddtags_by_region = {
+        region: f"env:production,service:aws,cloud:aws,region:{region}" for region in REGIONS
+    }
+    
+    suspicious_users = USERS["suspicious"] + USERS["admins"]
+    regular_users = USERS["admins"] + USERS["developers"] + USERS["service_accounts"]
+    
+    # IAM identity per user, formatted once - a user keeps the same ARN and
+    # principal ID across events, as in real CloudTrail
+    iam_identities = {
+        user.id: (f"arn:aws:iam::123456789012:user/{user.id}", f"AIDA{random_hex(17).upper()}")
+        for user in suspicious_users + regular_users
+    }
     
     for _ in range(count):
-        event = random.choice(cloudtrail_events)
+        event_name, event_source, category = random.choice(cloudtrail_events)
         
         is_error = random.random() < 0.08
         is_suspicious = random.random() < 0.05
         
         if is_suspicious:
             ip, location = get_random_ip("suspicious")
-            user = random.choice(USERS["suspicious"] + USERS["admins"])
+            user = random.choice(suspicious_users)
         else:
             ip, location = get_random_ip("residential" if random.random() < 0.3 else "internal")
-            user = random.choice(USERS["admins"] + USERS["developers"] + USERS["service_accounts"])
+            user = random.choice(regular_users)
         
+        arn, principal_id = iam_identities[user.id]
         region = random.choice(REGIONS)
         
-        user_identity_type = random.choice(["IAMUser", "AssumedRole", "Root", "AWSService"])
+        user_identity_type = random.choice(user_identity_types)
         
         log_entry = {
             "ddsource": "cloudtrail",
-            "ddtags": f"env:production,service:aws,cloud:aws,region:{region}",
+            "ddtags": ddtags_by_region[region],
             "hostname": "cloudtrail",
             "service": "aws",
             "source": "cloudtrail",
             "status": "error" if is_error else "info",
-            "message": f"AWS {event['name']} by {user['email']} from {location}",
+            "message": f"AWS {event_name} by {user.email} from {location}",
             "evt": {
-                "name": event["name"],
+                "name": event_name,
                 "outcome": "failure" if is_error else "success",
                 "category": "cloud",
             },
@@ -1084,22 +1225,17 @@ def generate_cloudtrail_logs(count: int) -> list:
             },
             "userIdentity": {
                 "type": user_identity_type,
-                "arn": f"arn:aws:iam::123456789012:user/{user['id']}",
+                "arn": arn,
                 "accountId": "123456789012",
-                "userName": user["id"],
-                "principalId": f"AIDA{uuid.uuid4().hex[:17].upper()}",
+                "userName": user.id,
+                "principalId": principal_id,
             },
-            "eventSource": event["service"],
-            "eventName": event["name"],
-            "eventCategory": event["category"],
+            "eventSource": event_source,
+            "eventName": event_name,
+            "eventCategory": category,
             "awsRegion": region,
             "sourceIPAddress": ip,
-            "userAgent": random.choice([
-                "console.amazonaws.com",
-                "aws-cli/2.13.0 Python/3.11.4",
-                "Boto3/1.28.0 Python/3.10.0",
-                "terraform/1.5.0",
-            ]),
+            "userAgent": random.choice(user_agents),
             "network": {
                 "client": {
                     "ip": ip,
@@ -1112,34 +1248,24 @@ def generate_cloudtrail_logs(count: int) -> list:
         
         # Add error details
         if is_error:
-            error_codes = {
-                "iam": ["AccessDenied", "MalformedPolicyDocument", "EntityAlreadyExists"],
-                "s3": ["AccessDenied", "NoSuchBucket", "BucketAlreadyExists"],
-                "ec2": ["UnauthorizedOperation", "InvalidParameterValue", "InsufficientInstanceCapacity"],
-                "rds": ["DBInstanceAlreadyExists", "InvalidDBInstanceState", "StorageQuotaExceeded"],
-                "lambda": ["ResourceNotFoundException", "InvalidParameterValueException"],
-                "secrets": ["ResourceNotFoundException", "AccessDeniedException"],
-                "kms": ["AccessDeniedException", "NotFoundException"],
-            }
-            category_errors = error_codes.get(event["category"], ["UnauthorizedOperation"])
-            log_entry["errorCode"] = random.choice(category_errors)
+            log_entry["errorCode"] = random.choice(error_codes.get(category, default_error_codes))
             log_entry["errorMessage"] = "User is not authorized to perform this operation"
         
         # Add resource-specific details
-        if event["category"] == "s3":
+        if category == "s3":
             log_entry["requestParameters"] = {
                 "bucketName": random.choice(AWS_RESOURCES["s3_buckets"]),
             }
-            if "Object" in event["name"]:
-                log_entry["requestParameters"]["key"] = f"data/{random.choice(['uploads', 'exports', 'logs'])}/{uuid.uuid4().hex[:8]}.json"
+            if "Object" in event_name:
+                log_entry["requestParameters"]["key"] = f"data/{random.choice(['uploads', 'exports', 'logs'])}/{random_hex(8)}.json"
         
-        elif event["category"] == "ec2":
+        elif category == "ec2":
             log_entry["requestParameters"] = {
-                "instancesSet": {"items": [{"instanceId": f"i-{uuid.uuid4().hex[:17]}"}]},
+                "instancesSet": {"items": [{"instanceId": f"i-{random_hex(17)}"}]},
                 "instanceType": random.choice(AWS_RESOURCES["ec2_instance_types"]),
             }
         
-        elif event["category"] == "lambda":
+        elif category == "lambda":
             log_entry["requestParameters"] = {
                 "functionName": random.choice(AWS_RESOURCES["lambda_functions"]),
             }
@@ -1154,8 +1280,9 @@ def generate_database_logs(count: int) -> list:
     logs = []
     
     for _ in range(count):
-        db_type = random.choice(list(DATABASES.keys()))
+        db_type = random.choice(DATABASE_TYPES)
         db_config = DATABASES[db_type]
+        hostname = random.choice(db_config["hosts"])
         
         is_slow = random.random() < 0.15
         is_error = random.random() < 0.05
@@ -1191,7 +1318,7 @@ def generate_database_logs(count: int) -> list:
             log_entry = {
                 "ddsource": db_type,
                 "ddtags": f"env:production,service:{db_type},database:{random.choice(db_config['databases'])}",
-                "hostname": random.choice(db_config["hosts"]),
+                "hostname": hostname,
                 "service": db_type,
                 "status": status,
                 "message": message,
@@ -1226,7 +1353,7 @@ def generate_database_logs(count: int) -> list:
             log_entry = {
                 "ddsource": "redis",
                 "ddtags": "env:production,service:redis",
-                "hostname": random.choice(db_config["hosts"]),
+                "hostname": hostname,
                 "service": "redis",
                 "status": status,
                 "message": message,
@@ -1251,6 +1378,7 @@ def generate_database_logs(count: int) -> list:
                     "search_phase_execution_exception",
                     "cluster_block_exception",
                 ])
+                took_ms = None
                 message = f"Error: {error} on {index}"
                 status = "error"
             else:
@@ -1261,14 +1389,14 @@ def generate_database_logs(count: int) -> list:
             log_entry = {
                 "ddsource": "elasticsearch",
                 "ddtags": f"env:production,service:elasticsearch,index:{index}",
-                "hostname": random.choice(db_config["hosts"]),
+                "hostname": hostname,
                 "service": "elasticsearch",
                 "status": status,
                 "message": message,
                 "elasticsearch": {
                     "index": index,
                     "operation": operation,
-                    "took_ms": took_ms if "took_ms" in dir() else None,
+                    "took_ms": took_ms,
                     "hits": random.randint(0, 10000) if operation == "search" else None,
                 },
             }
@@ -1278,13 +1406,13 @@ def generate_database_logs(count: int) -> list:
             operation = random.choice(operations)
             
             duration_ms = random.randint(1000, 10000) if is_slow else random.randint(1, 100)
-            message = f"{operation} on {random.choice(db_config.get('databases', db_config.get('keyspaces', ['data'])))} ({duration_ms}ms)"
+            message = f"{operation} on {random.choice(DATABASE_NAMES[db_type])} ({duration_ms}ms)"
             status = "warn" if is_slow else "info"
             
             log_entry = {
                 "ddsource": db_type,
                 "ddtags": f"env:production,service:{db_type}",
-                "hostname": random.choice(db_config["hosts"]),
+                "hostname": hostname,
                 "service": db_type,
                 "status": status,
                 "message": message,
@@ -1337,7 +1465,15 @@ def generate_kubernetes_logs(count: int) -> list:
         {"type": "Warning", "reason": "ProvisioningFailed", "message": "Failed to provision volume: {error}", "status": "error"},
     ]
     
-    services = list(FLAT_SERVICES.keys())
+    # Placeholders only some event messages use, drawn on demand (the image
+    # lambda reads the current record's service when it's called)
+    message_fields = {
+        "image": lambda: f"gcr.io/company/{service}:v1.{random.randint(0, 99)}.{random.randint(0, 999)}",
+        "replicas": lambda: random.randint(1, 10),
+        "nodes": lambda: random.randint(3, 10),
+        "pvc_id": lambda: random_hex(8),
+        "error": lambda: random.choice(("no storage class found", "quota exceeded", "invalid access mode")),
+    }
     
     for _ in range(count):
         event = random.choice(k8s_events)
@@ -1345,28 +1481,20 @@ def generate_kubernetes_logs(count: int) -> list:
         cluster = random.choice(K8S_CLUSTERS)
         
         # Generate pod and deployment names
-        service = random.choice(services)
+        service = random.choice(FLAT_SERVICE_NAMES)
         deployment = f"{service}-deployment"
-        pod = f"{service}-{uuid.uuid4().hex[:8]}"
+        pod = f"{service}-{random_hex(8)}"
         container = service.replace("-service", "")
-        node = f"gke-{cluster}-{random.choice(K8S_NODE_POOLS)}-{uuid.uuid4().hex[:8]}"
-        
-        message = event["message"]
-        replacements = {
-            "{namespace}": namespace,
-            "{pod}": pod,
-            "{node}": node,
-            "{image}": f"gcr.io/company/{service}:v1.{random.randint(0, 99)}.{random.randint(0, 999)}",
-            "{container}": container,
-            "{deployment}": deployment,
-            "{replicas}": str(random.randint(1, 10)),
-            "{nodes}": str(random.randint(3, 10)),
-            "{pvc_id}": uuid.uuid4().hex[:8],
-            "{error}": random.choice(["no storage class found", "quota exceeded", "invalid access mode"]),
-        }
+        node = f"gke-{cluster}-{random.choice(K8S_NODE_POOLS)}-{random_hex(8)}"
         
-        for key, value in replacements.items():
-            message = message.replace(key, value)
+        message = event["message"].format_map(LazyFields(
+            message_fields,
+            namespace=namespace,
+            pod=pod,
+            node=node,
+            container=container,
+            deployment=deployment,
+        ))
         
         logs.append({
             "ddsource": "kubernetes",
@@ -1452,7 +1580,7 @@ def generate_lambda_logs(count: int) -> list:
     
     for _ in range(count):
         function = random.choice(AWS_RESOURCES["lambda_functions"])
-        request_id = str(uuid.uuid4())
+        request_id = str(uuid.UUID(int=random.getrandbits(128), version=4))
         
         is_error = random.random() < 0.08
         is_timeout = random.random() < 0.03
@@ -1516,12 +1644,10 @@ def generate_cicd_logs(count: int) -> list:
         "release": ["tag", "changelog", "publish", "notify"],
     }
     
-    services = list(FLAT_SERVICES.keys())
-    
     for _ in range(count):
         pipeline = random.choice(pipelines)
         stage = random.choice(stages[pipeline])
-        service = random.choice(services)
+        service = random.choice(FLAT_SERVICE_NAMES)
         build_number = random.randint(1000, 9999)
         
         is_error = random.random() < 0.1
@@ -1542,7 +1668,7 @@ def generate_cicd_logs(count: int) -> list:
             message = f"[{pipeline}/{stage}] Completed successfully in {duration_s}s"
             status = "info"
         
-        commit_sha = uuid.uuid4().hex[:7]
+        commit_sha = random_hex(7)
         branch = random.choice(["main", "develop", f"feature/{random.choice(['auth', 'payments', 'ui'])}", "release/v1.2"])
         
         logs.append({
@@ -1591,11 +1717,10 @@ def generate_payment_logs(count: int) -> list:
         "do_not_honor", "lost_card", "stolen_card", "processing_error",
     ]
     
+    payment_status_cum_weights = tuple(accumulate(s[2] for s in payment_statuses))
+    
     for _ in range(count):
-        status_info = random.choices(
-            payment_statuses,
-            weights=[s[2] for s in payment_statuses]
-        )[0]
+        status_info = pick_weighted(payment_statuses, payment_status_cum_weights)
         
         txn_status, log_status, _ = status_info
         txn_id = generate_transaction_id()
@@ -1624,8 +1749,8 @@ def generate_payment_logs(count: int) -> list:
                 "payment_method": payment_method,
             },
             "usr": {
-                "id": user["id"],
-                "email": user["email"],
+                "id": user.id,
+                "email": user.email,
             },
             "trace_id": generate_trace_id(),
         }
@@ -1674,12 +1799,12 @@ def generate_cdn_logs(count: int) -> list:
         ("LimitExceeded", 2),
     ]
     
+    result_names = tuple(r[0] for r in result_types)
+    result_cum_weights = tuple(accumulate(r[1] for r in result_types))
+    
     for _ in range(count):
         path = random.choice(static_paths)
-        result_type = random.choices(
-            [r[0] for r in result_types],
-            weights=[r[1] for r in result_types]
-        )[0]
+        result_type = pick_weighted(result_names, result_cum_weights)
         
         ip, location = get_random_ip("residential")
         pop = random.choice(NETWORK["cdn_pops"])
@@ -1759,11 +1884,11 @@ def generate_waf_logs(count: int) -> list:
         ("CAPTCHA", "info", 5),
     ]
     
+    action_cum_weights = tuple(accumulate(a[2] for a in actions))
+    rule_group_names = tuple(rule_groups)
+    
     for _ in range(count):
-        action_info = random.choices(
-            actions,
-            weights=[a[2] for a in actions]
-        )[0]
+        action_info = pick_weighted(actions, action_cum_weights)
         
         action, log_status, _ = action_info
         
@@ -1773,11 +1898,11 @@ def generate_waf_logs(count: int) -> list:
         else:
             ip, location = get_random_ip()
         
-        rule_group = random.choice(list(rule_groups.keys()))
+        rule_group = random.choice(rule_group_names)
         rule_id = random.choice(rule_groups[rule_group])
         
         endpoint = random.choice(ALL_ENDPOINTS)
-        path = endpoint["path"].replace("{id}", str(random.randint(1, 9999)))
+        path = fill_path_id(endpoint.path, 1, 9999)
         
         logs.append({
             "ddsource": "waf",
@@ -1793,7 +1918,7 @@ def generate_waf_logs(count: int) -> list:
                 "web_acl": "prod-api-waf",
             },
             "http": {
-                "method": endpoint["method"],
+                "method": endpoint.method,
                 "url": path,
                 "useragent": get_random_user_agent("suspicious") if action == "BLOCK" else get_random_user_agent(),
             },
@@ -1814,22 +1939,21 @@ def generate_load_balancer_logs(count: int) -> list:
     """Generate Application Load Balancer logs."""
     logs = []
     
-    for _ in range(count):
-        endpoint = random.choice(ALL_ENDPOINTS)
-        path = endpoint["path"].replace("{id}", str(random.randint(1, 9999)))
+    elb_statuses = (200, 201, 204, 301, 302, 400, 401, 403, 404, 500, 502, 503, 504)
+    elb_status_cum_weights = tuple(accumulate((50, 5, 3, 2, 2, 5, 3, 2, 5, 3, 5, 5, 10)))
+    
+    for endpoint in random.choices(ALL_ENDPOINTS, k=count):
+        path = fill_path_id(endpoint.path, 1, 9999)
         
         ip, location = get_random_ip()
         
         # Target selection
-        target_service = random.choice(list(FLAT_SERVICES.keys()))
-        target_ip = f"10.0.{random.randint(1, 10)}.{random.randint(1, 254)}"
-        target_port = FLAT_SERVICES[target_service]["port"]
+        target_service = random.choice(FLAT_SERVICE_NAMES)
+        target_ip = random.choice(PRIVATE_HOST_IPS)
+        target_port = FLAT_SERVICES[target_service].port
         
         # Status codes
-        elb_status = random.choices(
-            [200, 201, 204, 301, 302, 400, 401, 403, 404, 500, 502, 503, 504],
-            weights=[50, 5, 3, 2, 2, 5, 3, 2, 5, 3, 5, 5, 10]
-        )[0]
+        elb_status = pick_weighted(elb_statuses, elb_status_cum_weights)
         
         target_status = elb_status if elb_status < 500 else random.choice([200, 500, 502, 503])
         
@@ -1853,9 +1977,9 @@ def generate_load_balancer_logs(count: int) -> list:
             "hostname": random.choice(AWS_RESOURCES["elb"]),
             "service": "alb",
             "status": log_status,
-            "message": f'{ip}:{random.randint(1024, 65535)} {target_ip}:{target_port} {endpoint["method"]} {path} {elb_status} {target_status}',
+            "message": f'{ip}:{random.randint(1024, 65535)} {target_ip}:{target_port} {endpoint.method} {path} {elb_status} {target_status}',
             "http": {
-                "method": endpoint["method"],
+                "method": endpoint.method,
                 "url": path,
                 "status_code": elb_status,
             },
@@ -1901,7 +2025,7 @@ def generate_batch_job_logs(count: int) -> list:
     
     for _ in range(count):
         job = random.choice(jobs)
-        job_id = f"job_{uuid.uuid4().hex[:12]}"
+        job_id = f"job_{random_hex(12)}"
         
         is_error = random.random() < 0.08
         is_slow = random.random() < 0.1
@@ -1984,18 +2108,23 @@ def generate_audit_logs(count: int) -> list:
         {"action": "admin.access", "resource": "admin_panel", "sensitivity": "confidential"},
         {"action": "admin.override", "resource": "security_control", "sensitivity": "confidential"},
     ]
+    confidential_events = [e for e in audit_events if e["sensitivity"] == "confidential"]
+    audit_users = USERS["admins"] + USERS["developers"]
     
     for _ in range(count):
-        event = random.choice(audit_events)
-        user = random.choice(USERS["admins"] + USERS["developers"])
-        ip, location = get_random_ip("internal" if random.random() < 0.7 else "residential")
+        user = random.choice(audit_users)
         
+        # Suspicious activity targets confidential resources from a suspicious IP;
+        # decided up front so each record draws one event and one IP
         is_suspicious = random.random() < 0.05
         if is_suspicious:
-            event = random.choice([e for e in audit_events if e["sensitivity"] == "confidential"])
+            event = random.choice(confidential_events)
             ip, location = get_random_ip("suspicious")
+        else:
+            event = random.choice(audit_events)
+            ip, location = get_random_ip("internal" if random.random() < 0.7 else "residential")
         
-        target_id = f"res_{uuid.uuid4().hex[:12]}"
+        target_id = f"res_{random_hex(12)}"
         
         logs.append({
             "ddsource": "audit",
@@ -2003,7 +2132,7 @@ def generate_audit_logs(count: int) -> list:
             "hostname": random.choice(HOSTS["api"]),
             "service": "audit-service",
             "status": "warn" if is_suspicious else "info",
-            "message": f"Audit: {event['action']} on {event['resource']} by {user['email']}",
+            "message": f"Audit: {event['action']} on {event['resource']} by {user.email}",
             "audit": {
                 "action": event["action"],
                 "resource_type": event["resource"],
@@ -2012,10 +2141,10 @@ def generate_audit_logs(count: int) -> list:
                 "outcome": "success",
             },
             "usr": {
-                "id": user["id"],
-                "email": user["email"],
-                "name": user["name"],
-                "role": user["role"],
+                "id": user.id,
+                "email": user.email,
+                "name": user.name,
+                "role": user.role,
             },
             "network": {
                 "client": {
@@ -2046,6 +2175,9 @@ def generate_network_flow_logs(count: int) -> list:
         (1, "ICMP", 0),
     ]
     
+    flow_actions = ("ACCEPT", "REJECT")
+    flow_action_cum_weights = tuple(accumulate((95, 5)))
+    
     for _ in range(count):
         protocol_num, protocol_name, typical_port = random.choice(protocols)
         
@@ -2054,17 +2186,17 @@ def generate_network_flow_logs(count: int) -> list:
         
         if is_inbound:
             src_ip, src_loc = get_random_ip("residential")
-            dst_ip = f"10.0.{random.randint(1, 10)}.{random.randint(1, 254)}"
+            dst_ip = random.choice(PRIVATE_HOST_IPS)
             src_port = random.randint(1024, 65535)
             dst_port = typical_port
         else:
-            src_ip = f"10.0.{random.randint(1, 10)}.{random.randint(1, 254)}"
+            src_ip = random.choice(PRIVATE_HOST_IPS)
             dst_ip, _ = get_random_ip("residential")
             src_port = typical_port
             dst_port = random.randint(1024, 65535)
         
         # Action
-        action = random.choices(["ACCEPT", "REJECT"], weights=[95, 5])[0]
+        action = pick_weighted(flow_actions, flow_action_cum_weights)
         
         packets = random.randint(1, 1000)
         bytes_transferred = packets * random.randint(40, 1500)
@@ -2074,7 +2206,7 @@ def generate_network_flow_logs(count: int) -> list:
         logs.append({
             "ddsource": "vpc-flow",
             "ddtags": f"env:production,service:vpc,action:{action.lower()}",
-            "hostname": f"eni-{uuid.uuid4().hex[:17]}",
+            "hostname": f"eni-{random_hex(17)}",
             "service": "vpc",
             "status": status,
             "message": f"{src_ip}:{src_port} -> {dst_ip}:{dst_port} {protocol_name} {action} {packets}pkts {bytes_transferred}B",
@@ -2094,8 +2226,8 @@ def generate_network_flow_logs(count: int) -> list:
             },
             "vpc": {
                 "action": action,
-                "interface_id": f"eni-{uuid.uuid4().hex[:17]}",
-                "subnet_id": f"subnet-{uuid.uuid4().hex[:17]}",
+                "interface_id": f"eni-{random_hex(17)}",
+                "subnet_id": f"subnet-{random_hex(17)}",
             },
         })
     
@@ -2124,12 +2256,18 @@ def generate_dns_logs(count: int) -> list:
         # CDN
         "cdn.company.com",
         "static.company.com",
-        
-        # Suspicious
+    ]
+    
+    # Suspicious
+    suspicious_domains = frozenset({
         "malware.evil.com",
         "c2.badactor.ru",
         "exfil.suspicious.cn",
-    ]
+    })
+    domains.extend(sorted(suspicious_domains))
+    
+    response_codes = ("NOERROR", "NXDOMAIN", "SERVFAIL")
+    response_code_cum_weights = tuple(accumulate((90, 8, 2)))
     
     record_types = ["A", "AAAA", "CNAME", "MX", "TXT", "NS"]
     
@@ -2137,16 +2275,13 @@ def generate_dns_logs(count: int) -> list:
         domain = random.choice(domains)
         record_type = random.choice(record_types)
         
-        is_suspicious = "evil" in domain or "badactor" in domain or "suspicious" in domain
+        is_suspicious = domain in suspicious_domains
         
         if is_suspicious:
             response_code = random.choice(["NOERROR", "NXDOMAIN"])
             status = "warn"
         else:
-            response_code = random.choices(
-                ["NOERROR", "NXDOMAIN", "SERVFAIL"],
-                weights=[90, 8, 2]
-            )[0]
+            response_code = pick_weighted(response_codes, response_code_cum_weights)
             status = "info" if response_code == "NOERROR" else "warn"
         
         query_time_ms = random.uniform(0.5, 50) if response_code == "NOERROR" else random.uniform(100, 1000)
@@ -2168,7 +2303,7 @@ def generate_dns_logs(count: int) -> list:
             },
             "network": {
                 "client": {
-                    "ip": f"10.0.{random.randint(1, 10)}.{random.randint(1, 254)}",
+                    "ip": random.choice(PRIVATE_HOST_IPS),
                 },
             },
         })
@@ -2264,44 +2399,74 @@ def generate_incident_scenario_logs(count: int) -> list:
 # MAIN EXECUTION
 # =============================================================================
 
-def send_logs(logs: list, batch_size: int = 50) -> tuple[int, int]:
-    """Send logs to Datadog in batches."""
+def create_session() -> requests.Session:
+    """Create a pooled HTTP session preconfigured for the Datadog logs intake."""
+    import requests
+    
+    session = requests.Session()
+    session.headers.update({
+        "DD-API-KEY": DD_API_KEY,
+        "Content-Type": "application/json",
+        "Content-Encoding": "gzip",
+    })
+    return session
+
+
+def serialize_batch(batch: list) -> bytes:
+    """Serialize a batch of logs to a JSON array, using orjson when it's installed."""
+    if orjson is not None:
+        return orjson.dumps(batch)
+    return json.dumps(batch, separators=(",", ":")).encode()
+
+
+def send_batch(session: requests.Session, url: str, batch: list) -> int:
+    """POST one gzip-compressed batch of logs and return the HTTP status code."""
+    body = gzip.compress(serialize_batch(batch), compresslevel=1)
+    return session.post(url, data=body, timeout=30).status_code
+
+
+def send_logs(logs: list, session: requests.Session, batch_size: int = MAX_BATCH_SIZE) -> tuple[int, int]:
+    """Send logs to Datadog in batches, SEND_WORKERS requests at a time."""
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+    
+    import requests
+    
     if not DD_API_KEY:
         print("❌ DD_API_KEY not set, logs not sent")
         return 0, len(logs)
     
     url = f"https://http-intake.logs.{DD_SITE}/api/v2/logs"
-    headers = {
-        "DD-API-KEY": DD_API_KEY,
-        "Content-Type": "application/json",
-    }
     
     success_count = 0
     error_count = 0
-    total_batches = (len(logs) + batch_size - 1) // batch_size
+    batches = [logs[i:i + batch_size] for i in range(0, len(logs), batch_size)]
+    total_batches = len(batches)
     
-    for i in range(0, len(logs), batch_size):
-        batch = logs[i:i + batch_size]
-        batch_num = i // batch_size + 1
-        
-        try:
-            response = requests.post(url, headers=headers, json=batch, timeout=30)
-            if response.status_code == 202:
-                success_count += len(batch)
-                print(f"  Batch {batch_num}/{total_batches}: ✅ ({len(batch)} logs)")
-            else:
+    with ThreadPoolExecutor(max_workers=SEND_WORKERS) as executor:
+        futures = {
+            executor.submit(send_batch, session, url, batch): (batch_num, batch)
+            for batch_num, batch in enumerate(batches, 1)
+        }
+        for future in as_completed(futures):
+            batch_num, batch = futures[future]
+            try:
+                status_code = future.result()
+                if status_code == 202:
+                    success_count += len(batch)
+                    print(f"  Batch {batch_num}/{total_batches}: ✅ ({len(batch)} logs)")
+                else:
+                    error_count += len(batch)
+                    print(f"  Batch {batch_num}/{total_batches}: ❌ Status {status_code}")
+            except requests.RequestException as e:
                 error_count += len(batch)
-                print(f"  Batch {batch_num}/{total_batches}: ❌ Status {response.status_code}")
-        except requests.RequestException as e:
-            error_count += len(batch)
-            print(f"  Batch {batch_num}/{total_batches}: ❌ Error: {e}")
-        
-        time.sleep(0.2)  # Rate limiting
+                print(f"  Batch {batch_num}/{total_batches}: ❌ Error: {e}")
     
     return success_count, error_count
 
 
 def main():
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="Comprehensive log generator for Datadog",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -2317,6 +2482,7 @@ Examples:
     parser.add_argument("--scenario", choices=["normal", "incident"], default="normal", help="Log scenario type")
     parser.add_argument("--duration", type=int, help="Generate logs continuously for N seconds")
     parser.add_argument("--dry-run", action="store_true", help="Generate logs but don't send to Datadog")
+    parser.add_argument("--workers", type=int, default=1, help="Processes to run the generators in (for large counts)")
     args = parser.parse_args()
     
     if not DD_API_KEY and not args.dry_run:
@@ -2360,19 +2526,37 @@ Examples:
     
     total_weight = sum(g[2] for g in generators)
     
+    # The generators are independent and CPU-bound, so large runs can spread them
+    # over processes. Workers reseed on start so they don't share a random stream.
+    executor = None
+    if args.workers > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        executor = ProcessPoolExecutor(max_workers=args.workers, initializer=random.seed)
+    
     def generate_batch(target_count: int) -> list:
         all_logs = []
         print("\n📝 Generating logs...\n")
         
-        for name, generator, weight in generators:
-            count = max(1, int(target_count * weight / total_weight))
-            logs = generator(count)
+        jobs = [
+            (name, generator, max(1, int(target_count * weight / total_weight)))
+            for name, generator, weight in generators
+        ]
+        if executor is not None:
+            futures = [executor.submit(generator, count) for _, generator, count in jobs]
+            results = (future.result() for future in futures)
+        else:
+            results = (generator(count) for _, generator, count in jobs)
+        
+        for (name, _, _), logs in zip(jobs, results):
             all_logs.extend(logs)
             print(f"  ✓ {name}: {len(logs)} logs")
         
         random.shuffle(all_logs)
         return all_logs
     
+    # One session for the whole run so batches reuse pooled TLS connections
+    session = None if args.dry_run else create_session()
+    
     if args.duration:
         print(f"\n⏱️  Generating logs for {args.duration} seconds...\n")
         start_time = time.time()
@@ -2383,7 +2567,7 @@ Examples:
             batch = generate_batch(args.count // 10)  # Smaller batches for continuous generation
             
             if not args.dry_run:
-                success, errors = send_logs(batch)
+                success, errors = send_logs(batch, session)
                 total_sent += success
                 total_errors += errors
             else:
@@ -2410,13 +2594,18 @@ Examples:
             print(f"\n📄 Sample log:\n{json.dumps(all_logs[0], indent=2)}")
         else:
             print("📤 Sending logs to Datadog...\n")
-            success, errors = send_logs(all_logs)
+            success, errors = send_logs(all_logs, session)
             
             print(f"\n{'='*70}")
             print(f"✅ Sent {success} logs to Datadog")
             if errors:
                 print(f"❌ Failed to send {errors} logs")
     
+    if session is not None:
+        session.close()
+    if executor is not None:
+        executor.shutdown()
+    
     print(f"\n📝 Sample queries to test:")
     print("  • 'Show me errors from the payment service'")
     print("  • 'Failed login attempts from suspicious IPs'")
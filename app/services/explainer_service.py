@@ -1,43 +1,50 @@
 """Explain Datadog Log Search queries and log entries."""
 
+from typing import Literal
+
 import anthropic
 
-from configs.config import get_settings
+from cache import normalize_log_json, normalize_text, response_cache
+from configs.config import get_anthropic_settings
 from configs.logger import get_logger
-from services.vectorstore_service import get_rag_context, list_collections
-from prompts import LOG_EXPLAINER_SYSTEM_PROMPT, DDSQL_EXPLAINER_SYSTEM_PROMPT, LOG_ANALYZER_SYSTEM_PROMPT
+from prompts import (
+    DDSQL_EXPLAINER_SYSTEM_PROMPTS,
+    LOG_ANALYZER_SYSTEM_PROMPTS,
+    LOG_EXPLAINER_SYSTEM_PROMPTS,
+)
+from services.vectorstore_service import build_rag_context
 
 logger = get_logger("explainer_service")
 
+DetailLevel = Literal["short", "full"]
+
 
-def explain_log_query(query: str) -> str:
+def explain_log_query(query: str, detail: DetailLevel = "short") -> str:
     """
     Explain a Datadog Log Search query in plain English.
     
     Args:
         query: The Datadog Log Search query to explain
+        detail: "short" for a brief summary, "full" for the complete breakdown
         
     Returns:
         Human-readable explanation of the query
     """
     logger.info(f"Explaining query: {query[:100]}...")
     
-    settings = get_settings()
+    settings = get_anthropic_settings()
     
     # Get RAG context from all collections
-    rag_context = ""
-    collections = list_collections()
-    if collections:
-        for collection in collections:
-            collection_name = collection["name"]
-            logger.debug(f"Fetching RAG context from: {collection_name}")
-            context = get_rag_context(query, collection_name, limit=3)
-            rag_context += context
-    else:
-        logger.debug("No collections available for RAG context")
+    rag_context = build_rag_context(query)
     
     logger.debug(f"RAG context length: {len(rag_context)} chars")
     
+    cache_key = response_cache.make_key(f"log_explainer:{detail}", rag_context, normalize_text(query))
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        logger.info("Returning cached explanation")
+        return cached
+    
     client = anthropic.Anthropic(api_key=settings.anthropic_api_key)
     
     logger.debug("Sending explanation request to Claude API (streaming)")
@@ -46,10 +53,10 @@ def explain_log_query(query: str) -> str:
         model=settings.anthropic_model_name,
         max_tokens=settings.anthropic_max_output_tokens,
         temperature=settings.anthropic_temperature,
-        system=LOG_EXPLAINER_SYSTEM_PROMPT.format(rag_context=rag_context),
+        system=LOG_EXPLAINER_SYSTEM_PROMPTS[detail],
         messages=[{
             "role": "user",
-            "content": f"Explain this Datadog Log Search query:\n\n{query}"
+            "content": f"Explain this Datadog Log Search query:\n\n{query}{rag_context}"
         }]
     ) as stream:
         response = stream.get_final_message()
@@ -60,37 +67,36 @@ def explain_log_query(query: str) -> str:
     explanation = response.content[0].text.strip()
     logger.info(f"Generated explanation ({len(explanation)} chars)")
     
+    response_cache.set(cache_key, explanation)
     return explanation
 
 
-def explain_ddsql_query(query: str) -> str:
+def explain_ddsql_query(query: str, detail: DetailLevel = "short") -> str:
     """
     Explain a DDSQL query in plain English.
     
     Args:
         query: The DDSQL query to explain
+        detail: "short" for a brief summary, "full" for the complete breakdown
         
     Returns:
         Human-readable explanation of the query
     """
     logger.info(f"Explaining DDSQL query: {query[:100]}...")
     
-    settings = get_settings()
+    settings = get_anthropic_settings()
     
     # Get RAG context from all collections
-    rag_context = ""
-    collections = list_collections()
-    if collections:
-        for collection in collections:
-            collection_name = collection["name"]
-            logger.debug(f"Fetching RAG context from: {collection_name}")
-            context = get_rag_context(query, collection_name, limit=3)
-            rag_context += context
-    else:
-        logger.debug("No collections available for RAG context")
+    rag_context = build_rag_context(query)
     
     logger.debug(f"RAG context length: {len(rag_context)} chars")
     
+    cache_key = response_cache.make_key(f"ddsql_explainer:{detail}", rag_context, normalize_text(query))
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        logger.info("Returning cached DDSQL explanation")
+        return cached
+    
     client = anthropic.Anthropic(api_key=settings.anthropic_api_key)
     
     logger.debug("Sending DDSQL explanation request to Claude API (streaming)")
@@ -99,10 +105,10 @@ def explain_ddsql_query(query: str) -> str:
         model=settings.anthropic_model_name,
         max_tokens=settings.anthropic_max_output_tokens,
         temperature=settings.anthropic_temperature,
-        system=DDSQL_EXPLAINER_SYSTEM_PROMPT.format(rag_context=rag_context),
+        system=DDSQL_EXPLAINER_SYSTEM_PROMPTS[detail],
         messages=[{
             "role": "user",
-            "content": f"Explain this DDSQL query:\n\n{query}"
+            "content": f"Explain this DDSQL query:\n\n{query}{rag_context}"
         }]
     ) as stream:
         response = stream.get_final_message()
@@ -113,37 +119,36 @@ def explain_ddsql_query(query: str) -> str:
     explanation = response.content[0].text.strip()
     logger.info(f"Generated DDSQL explanation ({len(explanation)} chars)")
     
+    response_cache.set(cache_key, explanation)
     return explanation
 
 
-def explain_log_entry(log_json: str) -> str:
+def explain_log_entry(log_json: str, detail: DetailLevel = "short") -> str:
     """
     Analyze a log entry and explain what happened and potential causes.
     
     Args:
         log_json: The log entry in JSON format
+        detail: "short" for a brief summary, "full" for the complete breakdown
         
     Returns:
         Human-readable analysis of the log entry
     """
     logger.info("Analyzing log entry...")
     
-    settings = get_settings()
+    settings = get_anthropic_settings()
     
     # Get RAG context from all collections
-    rag_context = ""
-    collections = list_collections()
-    if collections:
-        for collection in collections:
-            collection_name = collection["name"]
-            logger.debug(f"Fetching RAG context from: {collection_name}")
-            context = get_rag_context(log_json[:500], collection_name, limit=3)
-            rag_context += context
-    else:
-        logger.debug("No collections available for RAG context")
+    rag_context = build_rag_context(log_json[:500])
     
     logger.debug(f"RAG context length: {len(rag_context)} chars")
     
+    cache_key = response_cache.make_key(f"log_analyzer:{detail}", rag_context, normalize_log_json(log_json))
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        logger.info("Returning cached log analysis")
+        return cached
+    
     client = anthropic.Anthropic(api_key=settings.anthropic_api_key)
     
     logger.debug("Sending log analysis request to Claude API (streaming)")
@@ -152,10 +157,10 @@ def explain_log_entry(log_json: str) -> str:
         model=settings.anthropic_model_name,
         max_tokens=settings.anthropic_max_output_tokens,
         temperature=settings.anthropic_temperature,
-        system=LOG_ANALYZER_SYSTEM_PROMPT.format(rag_context=rag_context),
+        system=LOG_ANALYZER_SYSTEM_PROMPTS[detail],
         messages=[{
             "role": "user",
-            "content": f"Analyze this log entry and explain what happened:\n\n{log_json}"
+            "content": f"Analyze this log entry and explain what happened:\n\n{log_json}{rag_context}"
         }]
     ) as stream:
         response = stream.get_final_message()
@@ -166,5 +171,6 @@ def explain_log_entry(log_json: str) -> str:
     analysis = response.content[0].text.strip()
     logger.info(f"Generated log analysis ({len(analysis)} chars)")
     
+    response_cache.set(cache_key, analysis)
     return analysis
 
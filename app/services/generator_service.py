@@ -1,15 +1,87 @@
 """Generate Datadog Log Search and DDSQL queries from natural language."""
 
-import json
+from collections.abc import Callable
+
 import anthropic
 
-from configs.config import get_settings
+from cache import normalize_text, response_cache
+from configs.config import get_anthropic_settings
 from configs.logger import get_logger
-from services.vectorstore_service import get_rag_context, list_collections
-from prompts import TRANSLATOR_SYSTEM_PROMPT, DDSQL_TRANSLATOR_SYSTEM_PROMPT
+from prompts import (
+    DDSQL_TRANSLATOR_SYSTEM_PROMPT,
+    TRANSLATOR_SYSTEM_PROMPT,
+    select_ddsql_examples,
+)
+from services.translation_parser import (
+    EXPLANATION_SEPARATOR,
+    looks_like_ddsql,
+    looks_like_log_query,
+    parse_translation,
+)
+from services.vectorstore_service import build_rag_context
 
 logger = get_logger("generator_service")
 
+def _stream_text(client: anthropic.Anthropic, model: str, system_prompt: str, content: str) -> str:
+    """Send one translator request to Claude and return the response text."""
+    settings = get_anthropic_settings()
+    
+    logger.debug(f"Sending request to Claude API (streaming) - model: {model}")
+    
+    with client.messages.stream(
+        model=model,
+        max_tokens=settings.anthropic_max_output_tokens,
+        temperature=settings.anthropic_temperature,
+        system=system_prompt,
+        messages=[{
+            "role": "user",
+            "content": content
+        }]
+    ) as stream:
+        response = stream.get_final_message()
+    
+    # Log token usage
+    logger.debug(f"Claude response - input tokens: {response.usage.input_tokens}, output tokens: {response.usage.output_tokens}")
+    
+    return response.content[0].text
+
+
+def _translate(system_prompt: str, content: str, is_valid: Callable[[str], bool]) -> dict:
+    """
+    Run a translator prompt, trying the small model first when one is configured.
+    
+    The small model's answer is kept only if it is well-formed and passes the
+    is_valid check; clarification requests, API errors and anything else go to
+    the main model.
+    
+    Args:
+        system_prompt: Translator system prompt
+        content: User message
+        is_valid: Syntax check for the generated query
+        
+    Returns:
+        Dict with 'query' and 'explanation', or 'needs_clarification' if ambiguous
+    """
+    settings = get_anthropic_settings()
+    client = anthropic.Anthropic(api_key=settings.anthropic_api_key)
+    
+    if settings.anthropic_small_model_name:
+        try:
+            text = _stream_text(client, settings.anthropic_small_model_name, system_prompt, content)
+        except anthropic.APIError as e:
+            logger.warning(f"Small model request failed, escalating to the main model: {e}")
+        else:
+            result = parse_translation(text)
+            is_well_formed = (
+                EXPLANATION_SEPARATOR in text.strip()
+                and not result.get("needs_clarification")
+            )
+            if is_well_formed and is_valid(result["query"]):
+                return result
+            logger.info("Small model answer rejected, escalating to the main model")
+    
+    return parse_translation(_stream_text(client, settings.anthropic_model_name, system_prompt, content))
+
 
 def generate_log_query(natural_language: str) -> dict:
     """
@@ -23,69 +95,30 @@ def generate_log_query(natural_language: str) -> dict:
     """
     logger.info(f"Generating Log Query: {natural_language[:100]}...")
     
-    settings = get_settings()
-    
     # Get RAG context from all collections
-    rag_context = ""
-    collections = list_collections()
-    if collections:
-        for collection in collections:
-            collection_name = collection["name"]
-            logger.debug(f"Fetching RAG context from: {collection_name}")
-            context = get_rag_context(natural_language, collection_name, limit=3)
-            rag_context += context
-    else:
-        logger.debug("No collections available for RAG context")
+    rag_context = build_rag_context(natural_language)
     
     logger.debug(f"RAG context length: {len(rag_context)} chars")
     
-    client = anthropic.Anthropic(api_key=settings.anthropic_api_key)
-    
-    logger.debug("Sending request to Claude API (streaming)")
-    
-    with client.messages.stream(
-        model=settings.anthropic_model_name,
-        max_tokens=settings.anthropic_max_output_tokens,
-        temperature=settings.anthropic_temperature,
-        system=TRANSLATOR_SYSTEM_PROMPT.format(rag_context=rag_context),
-        messages=[{
-            "role": "user",
-            "content": f"Translate to Datadog Log Search: {natural_language}"
-        }]
-    ) as stream:
-        response = stream.get_final_message()
-    
-    # Log token usage
-    logger.debug(f"Claude response - input tokens: {response.usage.input_tokens}, output tokens: {response.usage.output_tokens}")
+    cache_key = response_cache.make_key("translator", rag_context, normalize_text(natural_language))
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        logger.info("Returning cached Log Search query")
+        return cached
     
-    # Parse response
-    text = response.content[0].text.strip()
+    result = _translate(
+        TRANSLATOR_SYSTEM_PROMPT,
+        f"Translate to Datadog Log Search: {natural_language}{rag_context}",
+        looks_like_log_query,
+    )
     
-    # Handle potential markdown wrapping
-    if text.startswith("```"):
-        text = text.split("```")[1]
-        if text.startswith("json"):
-            text = text[4:]
-        text = text.strip()
+    if result.get("needs_clarification"):
+        logger.info(f"Clarification needed: {result['message']}")
+    else:
+        logger.info(f"Generated query: {result['query'][:100]}")
     
-    try:
-        result = json.loads(text)
-        
-        if result.get("needs_clarification"):
-            logger.info(f"Clarification needed: {result.get('message')}")
-        else:
-            logger.info(f"Generated query: {result.get('query', '')[:100]}")
-        
-        return result
-    except json.JSONDecodeError as e:
-        logger.warning(f"Failed to parse JSON response: {e}")
-        return {
-            "query": text,
-            "explanation": "Generated query (could not parse structured response)"
-        }
-    except Exception as e:
-        logger.error(f"Generation error: {type(e).__name__}: {e}")
-        raise
+    response_cache.set(cache_key, result)
+    return result
 
 
 def generate_ddsql_query(natural_language: str) -> dict:
@@ -100,67 +133,27 @@ def generate_ddsql_query(natural_language: str) -> dict:
     """
     logger.info(f"Generating DDSQL Query: {natural_language[:100]}...")
     
-    settings = get_settings()
-    
     # Get RAG context from all collections
-    rag_context = ""
-    collections = list_collections()
-    if collections:
-        for collection in collections:
-            collection_name = collection["name"]
-            logger.debug(f"Fetching RAG context from: {collection_name}")
-            context = get_rag_context(natural_language, collection_name, limit=3)
-            rag_context += context
-    else:
-        logger.debug("No collections available for RAG context")
+    rag_context = build_rag_context(natural_language)
     
     logger.debug(f"RAG context length: {len(rag_context)} chars")
     
-    client = anthropic.Anthropic(api_key=settings.anthropic_api_key)
+    cache_key = response_cache.make_key("ddsql_translator", rag_context, normalize_text(natural_language))
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        logger.info("Returning cached DDSQL query")
+        return cached
     
-    logger.debug("Sending DDSQL request to Claude API (streaming)")
+    result = _translate(
+        DDSQL_TRANSLATOR_SYSTEM_PROMPT,
+        f"Translate to DDSQL: {natural_language}{select_ddsql_examples(natural_language)}{rag_context}",
+        looks_like_ddsql,
+    )
     
-    with client.messages.stream(
-        model=settings.anthropic_model_name,
-        max_tokens=settings.anthropic_max_output_tokens,
-        temperature=settings.anthropic_temperature,
-        system=DDSQL_TRANSLATOR_SYSTEM_PROMPT.format(rag_context=rag_context),
-        messages=[{
-            "role": "user",
-            "content": f"Translate to DDSQL: {natural_language}"
-        }]
-    ) as stream:
-        response = stream.get_final_message()
-    
-    # Log token usage
-    logger.debug(f"Claude response - input tokens: {response.usage.input_tokens}, output tokens: {response.usage.output_tokens}")
-    
-    # Parse response
-    text = response.content[0].text.strip()
-    
-    # Handle potential markdown wrapping
-    if text.startswith("```"):
-        text = text.split("```")[1]
-        if text.startswith("json"):
-            text = text[4:]
-        text = text.strip()
+    if result.get("needs_clarification"):
+        logger.info(f"Clarification needed: {result['message']}")
+    else:
+        logger.info(f"Generated DDSQL query: {result['query'][:100]}")
     
-    try:
-        result = json.loads(text)
-        
-        if result.get("needs_clarification"):
-            logger.info(f"Clarification needed: {result.get('message')}")
-        else:
-            logger.info(f"Generated DDSQL query: {result.get('query', '')[:100]}")
-        
-        return result
-    except json.JSONDecodeError as e:
-        logger.warning(f"Failed to parse JSON response: {e}")
-        return {
-            "query": text,
-            "explanation": "Generated DDSQL query (could not parse structured response)"
-        }
-    except Exception as e:
-        logger.error(f"DDSQL generation error: {type(e).__name__}: {e}")
-        raise
-
+    response_cache.set(cache_key, result)
+    return result
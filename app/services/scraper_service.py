@@ -3,7 +3,7 @@
 from firecrawl import Firecrawl
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 
-from configs.config import get_settings
+from configs.config import get_firecrawl_settings
 from configs.logger import get_logger
 
 logger = get_logger("scraper_service")
@@ -15,7 +15,7 @@ CHUNK_OVERLAP = 200  # 20% overlap ensures context continuity
 
 def get_firecrawl_client() -> Firecrawl:
     """Get Firecrawl client."""
-    settings = get_settings()
+    settings = get_firecrawl_settings()
     return Firecrawl(api_key=settings.firecrawl_api_key)
 
 
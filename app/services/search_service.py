@@ -10,7 +10,7 @@ from datadog_api_client.v2.model.logs_list_request_page import LogsListRequestPa
 from datadog_api_client.v2.model.logs_query_filter import LogsQueryFilter
 from datadog_api_client.v2.model.logs_sort import LogsSort
 
-from configs.config import get_settings
+from configs.config import get_datadog_settings
 from configs.logger import get_logger
 
 logger = get_logger("search_service")
@@ -35,7 +35,7 @@ def execute_query(
     logger.info(f"Executing query: {query[:100]}...")
     logger.debug(f"Time range: {time_range_minutes} min, limit: {limit}")
     
-    settings = get_settings()
+    settings = get_datadog_settings()
     
     configuration = Configuration()
     configuration.api_key["apiKeyAuth"] = settings.dd_api_key
@@ -0,0 +1,84 @@
+"""Parse and sanity-check translator output (kept free of API client imports)."""
+
+import re
+
+from configs.logger import get_logger
+
+logger = get_logger("translation_parser")
+
+# Separators used by the translator prompts' plain-text output format
+CLARIFY_PREFIX = "CLARIFY|||"
+EXPLANATION_SEPARATOR = "\n---\n"
+
+# Opening markdown fence, with its language tag when the code starts on the next line
+CODE_FENCE_OPENING = re.compile(r"^```(?:[\w+-]*\n)?")
+
+
+def parse_translation(text: str) -> dict:
+    """
+    Parse a translator response into the dict the UI expects.
+    
+    Args:
+        text: Raw model output, either "<query>\n---\n<explanation>" or
+            "CLARIFY|||<question>|||<opt1>;<opt2>;<opt3>"
+        
+    Returns:
+        Dict with 'query' and 'explanation', or 'needs_clarification' if ambiguous
+    """
+    text = text.strip()
+    
+    if text.startswith(CLARIFY_PREFIX):
+        message, _, options = text[len(CLARIFY_PREFIX):].partition("|||")
+        return {
+            "needs_clarification": True,
+            "message": message.strip(),
+            "options": [option.strip() for option in options.split(";") if option.strip()],
+        }
+    
+    query, separator, explanation = text.partition(EXPLANATION_SEPARATOR)
+    
+    # Handle potential markdown wrapping
+    query = query.strip()
+    if query.startswith("```"):
+        query = CODE_FENCE_OPENING.sub("", query).rstrip("`").strip()
+    
+    if not separator:
+        logger.warning("Response had no explanation separator")
+        explanation = "Generated query (could not parse structured response)"
+    
+    return {"query": query, "explanation": explanation.rstrip().rstrip("`").strip()}
+
+
+def has_balanced_delimiters(query: str) -> bool:
+    """Check that parentheses are balanced and quotes closed (ignoring parens in quotes)."""
+    depth = 0
+    quote = None
+    for char in query:
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in "'\"":
+            quote = char
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+            if depth < 0:
+                return False
+    return depth == 0 and quote is None
+
+
+def looks_like_log_query(query: str) -> bool:
+    """Cheap sanity check of a generated Log Search query."""
+    if not query or "\n" in query or "@@" in query:
+        return False
+    return has_balanced_delimiters(query)
+
+
+def looks_like_ddsql(query: str) -> bool:
+    """Cheap sanity check of a generated DDSQL query."""
+    upper = query.upper()
+    if not upper.startswith(("SELECT", "WITH")) or not has_balanced_delimiters(query):
+        return False
+    # dd.logs() must declare its columns with an AS clause
+    return "DD.LOGS(" not in upper or ") AS (" in upper
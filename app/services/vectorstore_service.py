@@ -6,6 +6,7 @@ Uses:
 - FastEmbed SPLADE for sparse embeddings
 """
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Callable
 
@@ -13,7 +14,7 @@ from qdrant_client import QdrantClient, models
 from openai import OpenAI
 from fastembed import SparseTextEmbedding
 
-from configs.config import get_settings
+from configs.config import get_openai_settings, get_qdrant_settings
 from configs.logger import get_logger
 from services.scraper_service import scrape_url, chunk_text
 
@@ -30,19 +31,19 @@ def get_qdrant_client() -> QdrantClient:
 
 def get_openai_client() -> OpenAI:
     """Get OpenAI client."""
-    settings = get_settings()
+    settings = get_openai_settings()
     return OpenAI(api_key=settings.openai_api_key)
 
 
 def get_sparse_model() -> SparseTextEmbedding:
     """Get FastEmbed sparse model."""
-    settings = get_settings()
+    settings = get_qdrant_settings()
     return SparseTextEmbedding(model_name=settings.qdrant_sparse_embedding_model)
 
 
 def create_collection(client: QdrantClient, collection_name: str) -> None:
     """Create a collection with hybrid vector config."""
-    settings = get_settings()
+    settings = get_openai_settings()
     collections = [c.name for c in client.get_collections().collections]
     
     if collection_name in collections:
@@ -69,7 +70,7 @@ def create_collection(client: QdrantClient, collection_name: str) -> None:
 
 def get_dense_embedding(openai_client: OpenAI, text: str) -> list[float]:
     """Get dense embedding from OpenAI."""
-    settings = get_settings()
+    settings = get_openai_settings()
     response = openai_client.embeddings.create(
         model=settings.openai_embedding_model,
         input=text,
@@ -163,6 +164,9 @@ def index_url(
     qdrant.upsert(collection_name=collection_name, points=points)
     logger.info(f"Indexed {len(points)} chunks from {url}")
     
+    # New content can leave the point count unchanged, so drop memoized context
+    _cached_rag_context.cache_clear()
+    
     return len(points)
 
 
@@ -242,6 +246,7 @@ def delete_collection(collection_name: str) -> None:
     qdrant = get_qdrant_client()
     qdrant.delete_collection(collection_name)
     logger.info(f"Deleted collection: {collection_name}")
+    _cached_rag_context.cache_clear()
 
 
 def get_rag_context(query: str, collection_name: str, limit: int = 5) -> str:
@@ -256,10 +261,41 @@ def get_rag_context(query: str, collection_name: str, limit: int = 5) -> str:
     if not results:
         return ""
     
-    context = "\n\nRELEVANT DOCUMENTATION:\n"
-    for i, result in enumerate(results, 1):
-        context += f"\n{i}. {result['text'][:500]}\n"
-        context += f"   Source: {result['url']}\n"
+    # Most relevant first; chunks with tied scores are ordered by source so the
+    # same hits always build the same prompt
+    results.sort(key=lambda result: (-result["score"], result["url"], result["text"]))
     
-    return context
+    return "\n\nRELEVANT DOCUMENTATION:\n" + "".join(
+        f"\n{i}. {result['text'][:500]}\n   Source: {result['url']}\n"
+        for i, result in enumerate(results, 1)
+    )
+
+
+@lru_cache(maxsize=2048)
+def _cached_rag_context(query: str, collections: tuple[tuple[str, int], ...], limit: int) -> str:
+    """Concatenate RAG context from each collection (memoized)."""
+    logger.debug(f"Fetching RAG context from: {', '.join(name for name, _ in collections)}")
+    return "".join(get_rag_context(query, name, limit=limit) for name, _ in collections)
 
+
+def build_rag_context(query: str, limit: int = 3) -> str:
+    """
+    Get RAG context for a query from all collections.
+    
+    Results are memoized on the query and each collection's name and point count.
+    index_url and delete_collection clear the memo, so re-indexed documentation
+    is picked up even when its chunk count is unchanged.
+    
+    Args:
+        query: Text to retrieve documentation for
+        limit: Number of chunks to retrieve per collection
+        
+    Returns:
+        Formatted context string for LLM prompt (empty if there are no collections)
+    """
+    collections = tuple((c["name"], c["points_count"]) for c in list_collections())
+    if not collections:
+        logger.debug("No collections available for RAG context")
+        return ""
+    
+    return _cached_rag_context(query, collections, limit)
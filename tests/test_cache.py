@@ -0,0 +1,78 @@
+"""Tests for the LLM response cache and its key normalization."""
+
+from cache import ResponseCache, normalize_log_json
+
+
+def test_nested_id_changes_log_key():
+    first = '{"service": "api", "error": {"id": "err_1", "message": "boom"}}'
+    second = '{"service": "api", "error": {"id": "err_2", "message": "boom"}}'
+
+    assert normalize_log_json(first) != normalize_log_json(second)
+    assert ResponseCache.make_key("log_analyzer:short", "", normalize_log_json(first)) != (
+        ResponseCache.make_key("log_analyzer:short", "", normalize_log_json(second))
+    )
+
+
+def test_timestamp_and_trace_id_change_log_key():
+    first = '{"timestamp": "2024-01-01T00:00:00Z", "trace_id": "abc", "message": "boom"}'
+    second = '{"timestamp": "2024-06-01T12:00:00Z", "trace_id": "abc", "message": "boom"}'
+    third = '{"timestamp": "2024-01-01T00:00:00Z", "trace_id": "def", "message": "boom"}'
+
+    keys = {normalize_log_json(entry) for entry in (first, second, third)}
+    assert len(keys) == 3
+
+
+def test_key_order_and_whitespace_are_ignored():
+    first = '{"message": "boom", "service": "api"}'
+    second = '{\n  "service": "api",\n  "message": "boom"\n}'
+
+    assert normalize_log_json(first) == normalize_log_json(second)
+
+
+def test_make_key_is_stable_and_separates_parts():
+    assert ResponseCache.make_key("translator", "docs", "errors") == (
+        ResponseCache.make_key("translator", "docs", "errors")
+    )
+    assert ResponseCache.make_key("translator", "ab", "c") != (
+        ResponseCache.make_key("translator", "a", "bc")
+    )
+    assert ResponseCache.make_key("translator", "", "q") != (
+        ResponseCache.make_key("ddsql_translator", "", "q")
+    )
+
+
+def test_evicts_least_recently_used_entry():
+    cache = ResponseCache(maxsize=2)
+    cache.set(b"a", "first")
+    cache.set(b"b", "second")
+
+    # Reading "a" makes "b" the least recently used entry
+    assert cache.get(b"a") == "first"
+    cache.set(b"c", "third")
+
+    assert cache.get(b"b") is None
+    assert cache.get(b"a") == "first"
+    assert cache.get(b"c") == "third"
+
+
+def test_set_refreshes_existing_entry():
+    cache = ResponseCache(maxsize=2)
+    cache.set(b"a", "first")
+    cache.set(b"b", "second")
+    cache.set(b"a", "updated")
+    cache.set(b"c", "third")
+
+    assert cache.get(b"a") == "updated"
+    assert cache.get(b"b") is None
+
+
+def test_clear_drops_every_entry():
+    cache = ResponseCache()
+    cache.set(b"a", "first")
+    cache.clear()
+
+    assert cache.get(b"a") is None
+
+
+def test_invalid_json_falls_back_to_whitespace_normalization():
+    assert normalize_log_json("not  json\n at all") == "not json at all"
@@ -0,0 +1,113 @@
+"""Tests for parsing and sanity-checking translator output."""
+
+import pytest
+
+from services.translation_parser import (
+    has_balanced_delimiters,
+    looks_like_ddsql,
+    looks_like_log_query,
+    parse_translation,
+)
+
+
+def test_parse_query_and_explanation():
+    result = parse_translation("service:api status:error\n---\nErrors from the API service.\n")
+
+    assert result == {
+        "query": "service:api status:error",
+        "explanation": "Errors from the API service.",
+    }
+
+
+@pytest.mark.parametrize("fence", ["```", "```sql"])
+def test_parse_strips_code_fences(fence):
+    text = f"{fence}\nSELECT 1\n```\n---\nSelects one.\n```"
+
+    result = parse_translation(text)
+
+    assert result["query"] == "SELECT 1"
+    assert result["explanation"] == "Selects one."
+
+
+@pytest.mark.parametrize("text", [
+    "```service:web```",
+    "```service:web```\n---\nLogs from the web service.",
+])
+def test_parse_strips_single_line_code_fence(text):
+    result = parse_translation(text)
+
+    assert result["query"] == "service:web"
+    assert looks_like_log_query(result["query"])
+
+
+def test_parse_without_separator_keeps_query():
+    result = parse_translation("service:api status:error")
+
+    assert result["query"] == "service:api status:error"
+    assert result["explanation"] == "Generated query (could not parse structured response)"
+    assert "needs_clarification" not in result
+
+
+def test_parse_clarification_with_options():
+    result = parse_translation("CLARIFY|||Which service?|||api; ;payments;")
+
+    assert result == {
+        "needs_clarification": True,
+        "message": "Which service?",
+        "options": ["api", "payments"],
+    }
+
+
+@pytest.mark.parametrize("text", ["CLARIFY|||Which service?|||", "CLARIFY|||Which service?"])
+def test_parse_clarification_without_options(text):
+    result = parse_translation(text)
+
+    assert result["needs_clarification"] is True
+    assert result["message"] == "Which service?"
+    assert result["options"] == []
+
+
+@pytest.mark.parametrize("query", [
+    "service:api (status:error OR status:warn)",
+    '@error.message:"unexpected ) in input"',
+    "@error.message:'missing ( paren'",
+    "@error.message:\"can't connect\"",
+])
+def test_balanced_delimiters_accepted(query):
+    assert has_balanced_delimiters(query)
+
+
+@pytest.mark.parametrize("query", [
+    "service:api (status:error",
+    "service:api status:error)",
+    ")service:api(",
+    '@error.message:"unterminated',
+    "@error.message:'unterminated",
+])
+def test_unbalanced_delimiters_rejected(query):
+    assert not has_balanced_delimiters(query)
+
+
+@pytest.mark.parametrize("query, expected", [
+    ("service:api status:error", True),
+    ("", False),
+    ("service:api\nstatus:error", False),
+    ("@@http.status_code:500", False),
+    ("service:api (status:error", False),
+])
+def testlooks_like_log_query(query, expected):
+    assert looks_like_log_query(query) is expected
+
+
+@pytest.mark.parametrize("query, expected", [
+    ("SELECT service, count(*) FROM logs GROUP BY service", True),
+    ("with errors AS (SELECT 1) SELECT * FROM errors", True),
+    ("SELECT * FROM dd.logs(filter => 'status:error', columns => ARRAY['service']) "
+     "AS (service VARCHAR)", True),
+    ("SELECT * FROM dd.logs(filter => 'status:error', columns => ARRAY['service'])", False),
+    ("DELETE FROM logs", False),
+    ("SELECT count(* FROM logs", False),
+    ("SELECT * FROM logs WHERE service = 'api", False),
+])
+def testlooks_like_ddsql(query, expected):
+    assert looks_like_ddsql(query) is expected